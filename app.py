@@ -1,36 +1,58 @@
 import streamlit as st
-import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 import json
-import base64
 import os
 
+from columnar import ColumnTable
+from dashboard_state import DashboardState
+from habit_log import HabitLogs, habit_analytics
+from session_views import project_view, study_view, time_log_view, to_int
+from time_log import MINUTES_PER_DAY, day_start, week_days
+from web_store import FRAME_COLUMNS, FRAME_KEYS, SharedStore, StaleWriteError
+from web_styles import BACKGROUND_FILE, THEMES, page_css
+
 # ---------------------------------------------------------
 # 0. 데이터 지속성 설정 (로컬 JSON 저장 방식)
 # ---------------------------------------------------------
 DATA_FILE = "data.json"
+STORE_KEYS = ("semester_progress",) + FRAME_KEYS + ("daily_memo", "habit_logs")
+
+@st.cache_resource
+def get_shared_store():
+    """서버 프로세스 전체에서 하나만 생성 (모든 세션/탭이 공유)"""
+    return SharedStore(DATA_FILE)
+
+def new_table(key, records=()):
+    """세션 컬렉션 (추가 O(1), 삭제/다시 읽기 후에도 행 ID 유지 -> 위젯 key 가 같은 레코드를 가리킴)"""
+    return ColumnTable.from_records(records, FRAME_COLUMNS[key])
+
+def dashboard():
+    """세션의 대시보드 갱신 상태 (DashboardState)"""
+    return st.session_state.setdefault("dashboard", DashboardState())
 
 def sync_load_data():
-    """로컬 JSON 파일에서 데이터를 읽어와 세션 상태에 반영"""
-    if not os.path.exists(DATA_FILE):
-        return False
-    
+    """공유 저장소의 데이터를 세션 상태에 반영"""
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        version, data = get_shared_store().snapshot()
+        st.session_state.store_version = version
+        st.session_state.loads = st.session_state.get("loads", 0) + 1
+        dashboard().reset()  # 새 데이터 -> 대시보드 카드 재계산
+        if data is None:
+            return False
         
+        # 스냅샷은 모든 세션이 공유하므로 세션에서 직접 수정하는 값은 복사해서 사용
         # 1. 학기
         if "semester_progress" in data:
-            st.session_state.semester_progress = data["semester_progress"]
+            st.session_state.semester_progress = {
+                sem: dict(subjects) for sem, subjects in data["semester_progress"].items()
+            }
             
-        # 2~6, 8. DataFrames
-        keys = ["monthly_goals", "weekly_tasks", "daily_time_logs", 
-                "study_sessions", "project_data", "habits"]
-        for key in keys:
+        # 2~6, 8. 컬렉션 (ColumnTable)
+        for key in FRAME_KEYS:
             if key in data:
-                st.session_state[key] = pd.DataFrame(data[key])
+                st.session_state[key] = new_table(key, data[key])
                 
         # 7. 메모
         if "daily_memo" in data:
@@ -38,39 +60,45 @@ def sync_load_data():
             
         # 9. 습관 로그
         if "habit_logs" in data:
-            st.session_state.habit_logs = data["habit_logs"]
+            st.session_state.habit_logs = HabitLogs.from_json(data["habit_logs"])
             
         return True
     except Exception as e:
         st.sidebar.error(f"데이터 로드 실패: {e}")
         return False
 
-def sync_save_data():
-    """세션 상태의 데이터를 로컬 JSON 파일로 저장"""
+def serialize_item(key):
+    """세션 상태의 저장 항목 하나를 JSON 값으로 (세션이 계속 수정하는 값은 복사)"""
+    if key in FRAME_KEYS:
+        return st.session_state[key].to_records()
+    if key == "habit_logs":
+        return st.session_state.habit_logs.to_json()
+    if key == "semester_progress":
+        return {sem: dict(subjects) for sem, subjects in st.session_state.semester_progress.items()}
+    return st.session_state[key]
+
+def sync_save_data(*keys):
+    """세션 상태 중 keys 항목만 (없으면 전체) 공유 저장소에 저장
+
+    세션이 읽은 뒤 다른 세션이 같은 항목을 저장했으면 덮어쓰지 않고 최신 데이터를 다시 읽음.
+    다른 항목만 바뀌었으면 병합해서 저장한 뒤 그 변경도 세션에 반영.
+    """
+    expected = st.session_state.get("store_version")
     try:
-        data = {}
-        # 1. 학기 (Dict)
-        data["semester_progress"] = st.session_state.semester_progress
-        
-        # 2~6, 8. DataFrames (JSON 저장을 위해 Dict로 변환)
-        keys = ["monthly_goals", "weekly_tasks", "daily_time_logs", 
-                "study_sessions", "project_data", "habits"]
-        for key in keys:
-            data[key] = st.session_state[key].to_dict(orient="records")
-            
-        # 7. 메모
-        data["daily_memo"] = st.session_state.daily_memo
-        
-        # 9. 습관 로그
-        data["habit_logs"] = st.session_state.habit_logs
-        
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-        return True
+        changes = {key: serialize_item(key) for key in keys or STORE_KEYS}
+        version = get_shared_store().update(changes, expected_version=expected)
+    except StaleWriteError:
+        sync_load_data()
+        st.session_state.sync_notice = "다른 탭에서 먼저 저장한 내용이 있어 최신 데이터를 다시 불러왔습니다. 다시 입력해 주세요."
+        return False
     except Exception as e:
-        st.sidebar.warning(f"데이터 자동 저장 실패: {e}")
+        st.session_state.sync_notice = f"데이터 자동 저장 실패: {e}"
         return False
-
+    if expected is not None and version != expected + 1:
+        sync_load_data()
+    else:
+        st.session_state.store_version = version
+    return True
 
 # ---------------------------------------------------------
 # 1. 페이지 설정
@@ -116,12 +144,12 @@ with st.sidebar:
     import json
     if st.button("📥 데이터 백업 (JSON)", use_container_width=True):
         export_data = {
-            "monthly_goals": st.session_state.monthly_goals.to_dict('records'),
-            "weekly_tasks": st.session_state.weekly_tasks.to_dict('records'),
-            "study_sessions": st.session_state.study_sessions.to_dict('records'),
-            "project_data": st.session_state.project_data.to_dict('records'),
-            "habits": st.session_state.habits.to_dict('records'),
-            "habit_logs": st.session_state.habit_logs,
+            "monthly_goals": st.session_state.monthly_goals.to_records(),
+            "weekly_tasks": st.session_state.weekly_tasks.to_records(),
+            "study_sessions": st.session_state.study_sessions.to_records(),
+            "project_data": st.session_state.project_data.to_records(),
+            "habits": st.session_state.habits.to_records(),
+            "habit_logs": st.session_state.habit_logs.to_json(),
             "daily_memo": st.session_state.daily_memo
         }
         json_str = json.dumps(export_data, ensure_ascii=False, indent=2)
@@ -133,30 +161,6 @@ with st.sidebar:
             use_container_width=True
         )
 
-# 테마 팔레트 정의 (예시 이미지 기반)
-THEMES = {
-    'light': {
-        'bg_main': '#f8fafc',
-        'bg_card': '#ffffff',
-        'text_primary': '#1e293b',
-        'text_secondary': '#64748b',
-        'accent': '#0d9488',  # Teal (예시1)
-        'accent_light': '#14b8a6',
-        'border': '#e2e8f0',
-        'chart_colors': ['#0d9488', '#64748b', '#94a3b8'],
-    },
-    'dark': {
-        'bg_main': '#0a1628',
-        'bg_card': 'rgba(15, 30, 60, 0.8)',
-        'text_primary': '#f1f5f9',
-        'text_secondary': '#94a3b8',
-        'accent': '#38bdf8',  # Sky Blue (예시2)
-        'accent_light': '#7dd3fc',
-        'border': 'rgba(56, 189, 248, 0.2)',
-        'chart_colors': ['#38bdf8', '#0ea5e9', '#0284c7'],
-    }
-}
-
 # 현재 테마 결정
 def get_current_theme():
     if st.session_state.theme == 'auto':
@@ -165,195 +169,19 @@ def get_current_theme():
 
 current = get_current_theme()
 T = THEMES[current]
-is_dark = current == 'dark'
 
 # 기존 코드 호환성 변수
 PURPLE_BTN = T['accent']
 CARD_BG = T['bg_card']
 
-# CSS 생성
-st.markdown(f"""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-    
-    /* ============================================ */
-    /* 기본 스타일 */
-    /* ============================================ */
-    html, body, .stApp, [data-testid="stAppViewContainer"], [data-testid="stHeader"] {{
-        background: {T['bg_main']} !important;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-    }}
-    
-    {"" if not is_dark else f'''
-    /* 다크모드 글로우 배경 효과 */
-    [data-testid="stAppViewContainer"]::before {{
-        content: "";
-        position: fixed;
-        top: 0; left: 0; right: 0; bottom: 0;
-        background: 
-            radial-gradient(ellipse 80% 60% at 30% 30%, rgba(56, 189, 248, 0.08) 0%, transparent 50%),
-            radial-gradient(ellipse 60% 50% at 70% 70%, rgba(14, 165, 233, 0.06) 0%, transparent 50%);
-        pointer-events: none;
-        z-index: -1;
-    }}
-    '''}
-    
-    h1, h2, h3, h4 {{
-        color: {T['text_primary']} !important;
-        font-weight: 700 !important;
-    }}
-    
-    p, span, div, label {{
-        color: {T['text_primary']} !important;
-    }}
-    
-    /* ============================================ */
-    /* 카드 스타일 */
-    /* ============================================ */
-    .metric-card {{
-        background: {T['bg_card']};
-        {"backdrop-filter: blur(20px); -webkit-backdrop-filter: blur(20px);" if is_dark else ""}
-        border-radius: 16px;
-        padding: 20px;
-        border: 1px solid {T['border']};
-        {"box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3), inset 0 1px 0 rgba(255,255,255,0.05);" if is_dark else "box-shadow: 0 1px 3px rgba(0,0,0,0.08);"}
-        margin-bottom: 16px;
-        transition: all 0.3s ease;
-    }}
-    
-    .metric-card:hover {{
-        {"border-color: " + T['accent'] + "; box-shadow: 0 0 30px rgba(56, 189, 248, 0.15);" if is_dark else "box-shadow: 0 4px 12px rgba(0,0,0,0.1);"}
-        transform: translateY(-2px);
-    }}
-    
-    /* ============================================ */
-    /* 버튼 스타일 */
-    /* ============================================ */
-    div[data-testid="column"] button {{
-        background: {T['accent']} !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 12px !important;
-        height: 48px !important;
-        font-weight: 600 !important;
-        font-size: 0.95rem !important;
-        width: 100% !important;
-        {"box-shadow: 0 4px 15px rgba(56, 189, 248, 0.3);" if is_dark else "box-shadow: 0 2px 8px rgba(13, 148, 136, 0.2);"}
-        transition: all 0.2s ease !important;
-    }}
-    
-    div[data-testid="column"] button:hover {{
-        background: {T['accent_light']} !important;
-        transform: translateY(-2px) !important;
-        {"box-shadow: 0 8px 25px rgba(56, 189, 248, 0.4) !important;" if is_dark else "box-shadow: 0 4px 12px rgba(13, 148, 136, 0.3) !important;"}
-    }}
-    
-    /* ============================================ */
-    /* 입력 필드 */
-    /* ============================================ */
-    .stTextInput input, .stSelectbox div[data-baseweb="select"], .stNumberInput input, .stTextArea textarea {{
-        background: {"rgba(15, 30, 60, 0.6)" if is_dark else "#ffffff"} !important;
-        color: {T['text_primary']} !important;
-        border: 1px solid {T['border']} !important;
-        border-radius: 10px !important;
-    }}
-    
-    .stTextInput input:focus {{
-        border-color: {T['accent']} !important;
-        {"box-shadow: 0 0 15px rgba(56, 189, 248, 0.2) !important;" if is_dark else ""}
-    }}
-    
-    /* ============================================ */
-    /* 탭 스타일 */
-    /* ============================================ */
-    .stTabs [data-baseweb="tab-list"] {{
-        gap: 6px;
-        background: {"rgba(15, 30, 60, 0.5)" if is_dark else "#f1f5f9"};
-        padding: 6px;
-        border-radius: 14px;
-        {"backdrop-filter: blur(10px);" if is_dark else ""}
-    }}
-    
-    .stTabs [data-baseweb="tab"] {{
-        background: transparent;
-        border-radius: 10px;
-        padding: 10px 16px;
-        border: none;
-        color: {T['text_secondary']} !important;
-        font-weight: 500;
-        transition: all 0.2s ease;
-    }}
-    
-    .stTabs [data-baseweb="tab"]:hover {{
-        background: {"rgba(56, 189, 248, 0.1)" if is_dark else "rgba(13, 148, 136, 0.08)"};
-        color: {T['text_primary']} !important;
-    }}
-    
-    .stTabs [aria-selected="true"] {{
-        background: {T['accent']} !important;
-        color: white !important;
-        {"box-shadow: 0 4px 15px rgba(56, 189, 248, 0.3);" if is_dark else ""}
-    }}
-    
-    /* ============================================ */
-    /* 사이드바 */
-    /* ============================================ */
-    section[data-testid="stSidebar"] {{
-        background: {"#0f1e3c" if is_dark else "#ffffff"} !important;
-        border-right: 1px solid {T['border']};
-    }}
-    
-    section[data-testid="stSidebar"] * {{
-        color: {T['text_primary']} !important;
-    }}
-    
-    /* ============================================ */
-    /* 체크박스 */
-    /* ============================================ */
-    .stCheckbox label span {{
-        color: {T['text_primary']} !important;
-    }}
-    
-    /* ============================================ */
-    /* 스크롤바 */
-    /* ============================================ */
-    ::-webkit-scrollbar {{ width: 8px; height: 8px; }}
-    ::-webkit-scrollbar-track {{ background: {"#0a1628" if is_dark else "#f1f5f9"}; }}
-    ::-webkit-scrollbar-thumb {{ 
-        background: {T['accent']};
-        border-radius: 4px;
-    }}
-    
-    /* 선택 색상 */
-    ::selection {{
-        background: {T['accent']};
-        color: white;
-    }}
-    
-    </style>
-""", unsafe_allow_html=True)
-
 # ---------------------------------------------------------
-# 2.5 배경 이미지 설정 (사용자 요청)
+# 2.5 스타일시트 (테마 + 배경 이미지)
 # ---------------------------------------------------------
-if os.path.exists("background.png"):
-    def get_base64(bin_file):
-        with open(bin_file, 'rb') as f:
-            data = f.read()
-        return base64.b64encode(data).decode()
-
-    bin_str = get_base64("background.png")
-    st.markdown(f"""
-        <style>
-        .stApp, [data-testid="stAppViewContainer"] {{
-            background: url("data:image/png;base64,{bin_str}") no-repeat center fixed !important;
-            background-size: cover !important;
-        }}
-        [data-testid="stHeader"] {{
-            background: rgba(0,0,0,0) !important;
-        }}
-        </style>
-    """, unsafe_allow_html=True)
+# 스타일시트는 web_styles.page_css: (테마, 배경) 조합별로 한 번만 만들고 페이지당 한 번만 출력
+# 배경은 정적 서빙 URL (rerun마다 이미지를 보내지 않음)
+
+background = BACKGROUND_FILE if os.path.exists(BACKGROUND_FILE) else None
+st.markdown(page_css(current, background, st.get_option("server.enableStaticServing")), unsafe_allow_html=True)
 
 # ---------------------------------------------------------
 # 3. 데이터 초기화 (시트에서 먼저 시도 후 없으면 기본값)
@@ -380,56 +208,65 @@ if 'initialized' not in st.session_state:
             "알고리즘(7급)": False, "졸업지도": False, "리눅스보안": False, "SW취약점분석": False
         }
     }
-    st.session_state.monthly_goals = pd.DataFrame([
+    st.session_state.monthly_goals = new_table("monthly_goals", [
         {"Goal": "C언어 포인터 완벽 이해", "Done": True},
         {"Goal": "매일 아침 1시간 코딩", "Done": False},
         {"Goal": "전공 서적 1권 완독", "Done": False}
     ])
-    st.session_state.weekly_tasks = pd.DataFrame([
+    st.session_state.weekly_tasks = new_table("weekly_tasks", [
         {"Day": "Mon", "Task": "자료구조 강의", "Done": True},
         {"Day": "Tue", "Task": "알고리즘 풀이", "Done": True},
         {"Day": "Wed", "Task": "복습", "Done": False},
         {"Day": "Thu", "Task": "프로젝트", "Done": False},
         {"Day": "Fri", "Task": "스터디", "Done": False}
     ])
-    st.session_state.daily_time_logs = pd.DataFrame([
+    st.session_state.daily_time_logs = new_table("daily_time_logs", [
         {"StartTime": "09:00", "EndTime": "11:00", "Activity": "자료구조", "Category": "Study"},
         {"StartTime": "14:00", "EndTime": "16:00", "Activity": "코딩", "Category": "Practice"}
     ])
-    st.session_state.study_sessions = pd.DataFrame([
+    st.session_state.study_sessions = new_table("study_sessions", [
         {"Name": "알고리즘", "Total": 10, "Done": 8},
         {"Name": "정보처리기사", "Total": 12, "Done": 3}
     ])
-    st.session_state.project_data = pd.DataFrame([
+    st.session_state.project_data = new_table("project_data", [
         {"Subject": "캡스톤1", "Task": "기획안", "Total": 5, "Done": 5, "Deadline": "2026-03-15"},
         {"Subject": "자료구조", "Task": "연결리스트", "Total": 8, "Done": 2, "Deadline": "2026-03-20"}
     ])
     st.session_state.daily_memo = ""
-    st.session_state.habits = pd.DataFrame([
+    st.session_state.habits = new_table("habits", [
         {"Name": "아침 운동", "Icon": "🏃", "Target": 7},
         {"Name": "독서 30분", "Icon": "📚", "Target": 5},
         {"Name": "물 2L 마시기", "Icon": "💧", "Target": 7}
     ])
     today = datetime.now().date()
-    st.session_state.habit_logs = {
+    st.session_state.habit_logs = HabitLogs.from_json({
         "아침 운동": [str(today - timedelta(days=i)) for i in [1, 2, 4, 5]],
         "독서 30분": [str(today - timedelta(days=i)) for i in [0, 1, 3]],
         "물 2L 마시기": [str(today - timedelta(days=i)) for i in [0, 1, 2, 3, 4, 5, 6]]
-    }
+    })
 
     # 2단계: 로컬 JSON에서 데이터 덮어쓰기 시도
     sync_load_data()
+elif st.session_state.get("store_version") != get_shared_store().current_version():
+    # 다른 세션(탭)이 저장함 -> 이 세션의 뷰를 새 버전으로 갱신
+    sync_load_data()
+
+if st.session_state.get("sync_notice"):
+    st.warning(st.session_state.pop("sync_notice"))
 
 
 # ---------------------------------------------------------
 # 4. 차트 생성 함수 (대시보드용)
 # ---------------------------------------------------------
-def draw_pie_chart(done, total, title):
+# 같은 (완료, 전체, 테마) 조합의 도넛 차트는 모든 세션이 한 객체를 공유 (LRU 64개)
+# 반환된 Figure 는 공유 객체이므로 수정하지 말 것
+@st.cache_resource(max_entries=64, show_spinner=False)
+def draw_pie_chart(done, total, theme):
     if total == 0: total = 1
     fig = go.Figure(data=[go.Pie(
         values=[done, total-done],
         hole=0.7,
-        marker=dict(colors=[PURPLE_BTN, '#2f2f3d']),
+        marker=dict(colors=[THEMES[theme]['accent'], '#2f2f3d']),
         textinfo='none',
         hoverinfo='label+percent'
     )])
@@ -457,99 +294,166 @@ def draw_bar_chart(df, x_col, y_col, title):
     )
     return fig
 
+def draw_week_chart(days, minutes_by_category):
+    """최근 7일 카테고리별 공부 시간 (누적 막대, 시간 단위)"""
+    labels = [day.strftime("%m/%d") for day in days]
+    colors = T['chart_colors']
+    fig = go.Figure()
+    for index, category in enumerate(sorted(minutes_by_category, key=str)):
+        fig.add_trace(go.Bar(
+            x=labels,
+            y=[round(minutes / 60, 2) for minutes in minutes_by_category[category]],
+            name=str(category),
+            marker_color=colors[index % len(colors)],
+        ))
+    fig.update_layout(
+        barmode='stack',
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=180,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        legend=dict(orientation='h', y=1.15, font=dict(color=T['text_secondary'])),
+        xaxis=dict(showgrid=False, tickfont=dict(color=T['text_secondary'], size=10)),
+        yaxis=dict(showgrid=False, ticksuffix='h', tickfont=dict(color=T['text_secondary'], size=10))
+    )
+    return fig
+
+def draw_habit_heatmap(analytics):
+    """최근 52주 전체 습관 체크 수 (요일 x 주)"""
+    fig = go.Figure(data=go.Heatmap(
+        z=analytics.heatmap,
+        x=[day.strftime("%m/%d") for day in analytics.week_starts],
+        y=["월", "화", "수", "목", "금", "토", "일"],
+        colorscale=[[0, T['bg_card']], [1, T['accent']]],
+        showscale=False,
+        xgap=2,
+        ygap=2,
+        hovertemplate='%{x} %{y}: %{z}<extra></extra>'
+    ))
+    fig.update_layout(
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=160,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(showgrid=False, showticklabels=False),
+        yaxis=dict(showgrid=False, autorange='reversed', tickfont=dict(color=T['text_secondary'], size=10))
+    )
+    return fig
+
+def draw_attainment_chart(analytics):
+    """주별 주간 목표를 채운 습관 수"""
+    fig = go.Figure(data=go.Bar(
+        x=[day.strftime("%m/%d") for day in analytics.week_starts],
+        y=analytics.attainment,
+        marker_color=T['accent']
+    ))
+    fig.update_layout(
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=140,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(showgrid=False, tickfont=dict(color=T['text_secondary'], size=9)),
+        yaxis=dict(showgrid=False, dtick=1, tickfont=dict(color=T['text_secondary'], size=10))
+    )
+    return fig
+
 # ---------------------------------------------------------
 # 5. UI 구성
 # ---------------------------------------------------------
+# 탭 본문은 st.fragment 로 분리: 탭 안의 위젯을 조작하면 그 탭만 다시 실행됨
+# 데이터가 바뀌면 그 데이터에 의존하는 대시보드 카드만 다시 그림
+card_slots = {}  # 카드 -> st.empty() 자리 (전체 실행 때마다 새로 생성)
+
+def save_collections(*collections):
+    """collections 만 저장. 실패했거나 세션 뷰를 다시 읽었으면 (충돌, 다른 세션의 변경) False"""
+    loads = st.session_state.get("loads", 0)
+    return sync_save_data(*collections) and st.session_state.get("loads", 0) == loads
+
+def commit_change(*collections):
+    """저장 후 의존 카드만 갱신 대상으로 표시하고 현재 탭(fragment)만 다시 실행
+    (저장 실패/다시 읽음 -> 앱 전체 다시 실행)"""
+    st.rerun(scope=dashboard().commit(collections, lambda: save_collections(*collections)))
+
+def card_values(card):
+    """카드별 (완료, 전체, 보조 문구)"""
+    if card == "semester":
+        progress = st.session_state.semester_progress
+        total_sub = sum(len(v) for v in progress.values())
+        done_sub = sum(sum(1 for x in v.values() if x) for v in progress.values())
+        return done_sub, total_sub, None
+    if card == "monthly":
+        goals = st.session_state.monthly_goals
+        return sum(1 for done in goals.column('Done') if done), len(goals), None
+    if card == "weekly":
+        tasks = st.session_state.weekly_tasks
+        return sum(1 for done in tasks.column('Done') if done), len(tasks), None
+    if card == "daily":
+        # 간단히 총 시간만 퍼센트로 시각화 (목표 6시간 가정)
+        # 겹치거나 중복된 기록은 병합, 자정을 넘긴 기록은 오늘 몫만 계산
+        today_date = datetime.now().date()
+        log = time_log_view(st.session_state.daily_time_logs, today_date).log
+        total_min = log.covered_minutes(day_start(today_date), day_start(today_date) + MINUTES_PER_DAY)
+        return total_min, 360, f"{total_min//60}h {total_min%60}m"
+    if card == "study":
+        s_view = study_view(st.session_state.study_sessions)
+        return s_view.done, s_view.total, None
+    if card == "project":
+        p_view = project_view(st.session_state.project_data)
+        return p_view.done, p_view.total, None
+    # habit
+    today_date = datetime.now().date()
+    total_habits = len(st.session_state.habits)
+    today_done = sum(1 for name in st.session_state.habits.column('Name')
+                    if st.session_state.habit_logs.contains(name, today_date))
+    return today_done, total_habits if total_habits > 0 else 1, None
+
+def draw_card(card):
+    done, total, caption = dashboard().values(card, lambda: card_values(card), current, datetime.now().date())
+    with card_slots[card].container():
+        st.plotly_chart(draw_pie_chart(done, total, current), use_container_width=True, key=f"chart_{card}")
+        if caption:
+            st.markdown(f"<div style='text-align:center; font-size:0.8rem'>{caption}</div>", unsafe_allow_html=True)
+
+def refresh_cards():
+    """탭(fragment) 재실행 시작: 다른 세션이 저장했으면 다시 읽고 앱 전체 다시 실행,
+    아니면 변경된 데이터에 의존하는 카드만 다시 그림"""
+    if st.session_state.get("store_version") != get_shared_store().current_version():
+        sync_load_data()
+        st.rerun()
+    for card in dashboard().take_dirty():
+        if card in card_slots:
+            draw_card(card)
+
 # 사이드바 대신 상단 네비게이션 (모바일 친화적)
 st.markdown("<h2 style='text-align:center; margin-bottom:10px;'>🧭 Navigators</h2>", unsafe_allow_html=True)
 menu = st.tabs(["📊 대시보드", "📚 학기", "📅 월간", "📆 주간", "📝 데일리", "📖 스터디", "💼 프로젝트", "🎯 습관"])
 
 # === [1] 대시보드 (통합 그래프) ===
+DASHBOARD_CARDS = [
+    ("semester", "📚 학기 이수율"), ("monthly", "📅 이번달 목표"),
+    ("weekly", "📆 주간 할일"), ("daily", "📝 오늘 공부"),
+    ("study", "📖 스터디"), ("project", "💼 프로젝트"),
+    ("habit", "🎯 습관"),
+]
+
 with menu[0]:
     st.markdown("### 📊 Overall Progress")
     
     # Grid Layout for Mobile (2 columns per row)
-    row1_c1, row1_c2 = st.columns(2)
-    
-    # 1. 학기 달성률
-    with row1_c1:
-        st.markdown(f"<div class='metric-card'><div style='text-align:center; margin-bottom:5px'>📚 학기 이수율</div>", unsafe_allow_html=True)
-        total_sub = sum(len(v) for v in st.session_state.semester_progress.values())
-        done_sub = sum(sum(1 for x in v.values() if x) for v in st.session_state.semester_progress.values())
-        # [수정] key 추가
-        st.plotly_chart(draw_pie_chart(done_sub, total_sub, "Semester"), use_container_width=True, key="chart_semester")
-        st.markdown("</div>", unsafe_allow_html=True)
-        
-    # 2. 월간 달성률
-    with row1_c2:
-        st.markdown(f"<div class='metric-card'><div style='text-align:center; margin-bottom:5px'>📅 이번달 목표</div>", unsafe_allow_html=True)
-        m_df = st.session_state.monthly_goals
-        # [수정] key 추가
-        st.plotly_chart(draw_pie_chart(len(m_df[m_df['Done']]), len(m_df), "Monthly"), use_container_width=True, key="chart_monthly")
-        st.markdown("</div>", unsafe_allow_html=True)
-        
-    row2_c1, row2_c2 = st.columns(2)
-    
-    # 3. 주간 달성률
-    with row2_c1:
-        st.markdown(f"<div class='metric-card'><div style='text-align:center; margin-bottom:5px'>📆 주간 할일</div>", unsafe_allow_html=True)
-        w_df = st.session_state.weekly_tasks
-        # [수정] key 추가
-        st.plotly_chart(draw_pie_chart(len(w_df[w_df['Done']]), len(w_df), "Weekly"), use_container_width=True, key="chart_weekly")
-        st.markdown("</div>", unsafe_allow_html=True)
-
-    # 4. 데일리 공부시간 (Bar Chart)
-    with row2_c2:
-        st.markdown(f"<div class='metric-card'><div style='text-align:center; margin-bottom:5px'>📝 오늘 공부</div>", unsafe_allow_html=True)
-        # 간단히 총 시간만 퍼센트로 시각화 (목표 6시간 가정)
-        d_df = st.session_state.daily_time_logs
-        total_min = 0
-        for _, r in d_df.iterrows():
-            try:
-                t1 = datetime.strptime(r['StartTime'], "%H:%M")
-                t2 = datetime.strptime(r['EndTime'], "%H:%M")
-                total_min += (t2-t1).seconds//60
-            except: pass
-        # [수정] key 추가
-        st.plotly_chart(draw_pie_chart(total_min, 360, "Daily"), use_container_width=True, key="chart_daily") # 6시간 기준
-        st.markdown(f"<div style='text-align:center; font-size:0.8rem'>{total_min//60}h {total_min%60}m</div></div>", unsafe_allow_html=True)
-        
-    row3_c1, row3_c2 = st.columns(2)
-    
-    # 5. 스터디 (Pie Chart - 총 진행률)
-    with row3_c1:
-        st.markdown(f"<div class='metric-card'><div style='text-align:center; margin-bottom:5px'>📖 스터디</div>", unsafe_allow_html=True)
-        s_df = st.session_state.study_sessions
-        s_done = s_df['Done'].sum() if 'Done' in s_df.columns else 0
-        s_total = s_df['Total'].sum() if 'Total' in s_df.columns else 1
-        # [수정] key 추가
-        st.plotly_chart(draw_pie_chart(int(s_done), int(s_total), "Study"), use_container_width=True, key="chart_study")
-        st.markdown("</div>", unsafe_allow_html=True)
-        
-    # 6. 프로젝트 (Pie Chart)
-    with row3_c2:
-        st.markdown(f"<div class='metric-card'><div style='text-align:center; margin-bottom:5px'>💼 프로젝트</div>", unsafe_allow_html=True)
-        p_df = st.session_state.project_data
-        p_done = p_df['Done'].sum() if 'Done' in p_df.columns else 0
-        p_total = p_df['Total'].sum() if 'Total' in p_df.columns else len(p_df)
-        # [수정] key 추가
-        st.plotly_chart(draw_pie_chart(int(p_done), int(p_total), "Project"), use_container_width=True, key="chart_project")
-        st.markdown("</div>", unsafe_allow_html=True)
-    
-    # 7. 습관 트래커 (진행률 표시)
-    row4_c1, row4_c2 = st.columns(2)
-    with row4_c1:
-        st.markdown(f"<div class='metric-card'><div style='text-align:center; margin-bottom:5px'>🎯 습관</div>", unsafe_allow_html=True)
-        today_date = datetime.now().date()
-        total_habits = len(st.session_state.habits)
-        today_done = sum(1 for _, h in st.session_state.habits.iterrows() 
-                        if str(today_date) in st.session_state.habit_logs.get(h['Name'], []))
-        # [수정] key 추가
-        st.plotly_chart(draw_pie_chart(today_done, total_habits if total_habits > 0 else 1, "Habit"), use_container_width=True, key="chart_habit")
-        st.markdown("</div>", unsafe_allow_html=True)
+    for start in range(0, len(DASHBOARD_CARDS), 2):
+        cols = st.columns(2)
+        for col, (card, label) in zip(cols, DASHBOARD_CARDS[start:start + 2]):
+            with col:
+                st.markdown(f"<div class='metric-card'><div style='text-align:center; margin-bottom:5px'>{label}</div></div>", unsafe_allow_html=True)
+                card_slots[card] = st.empty()
+                draw_card(card)
+    # 전체 실행에서 모든 카드를 새로 그렸으므로 대기 중인 갱신은 불필요
+    dashboard().take_dirty()
 
 # === [2] 학기 관리 ===
-with menu[1]:
+@st.fragment
+def semester_tab():
+    refresh_cards()
     st.markdown("### 📚 Semester Curriculum")
     for sem, subjects in st.session_state.semester_progress.items():
         with st.expander(sem, expanded=True):
@@ -558,11 +462,16 @@ with menu[1]:
                 checked = cols[i%2].checkbox(sub, value=done, key=f"sem_{sem}_{sub}")
                 if checked != done:
                     st.session_state.semester_progress[sem][sub] = checked
-                    sync_save_data()
-                    st.rerun()
+                    commit_change("semester_progress")
+
+with menu[1]:
+    semester_tab()
+
 
 # === [3] 월간 관리 ===
-with menu[2]:
+@st.fragment
+def monthly_tab():
+    refresh_cards()
     st.markdown("### 📅 Monthly Goals")
     
     # 토글 스위치 (추가 / 관리)
@@ -575,31 +484,34 @@ with menu[2]:
             new_goal = st.text_input("목표 입력", key="m_input")
             if st.button("등록하기", use_container_width=True, key="m_save"):
                 if new_goal:
-                    st.session_state.monthly_goals = pd.concat([st.session_state.monthly_goals, pd.DataFrame([{"Goal":new_goal, "Done":False}])], ignore_index=True)
-                    sync_save_data()
-                    st.rerun()
+                    st.session_state.monthly_goals.append({"Goal":new_goal, "Done":False})
+                    commit_change("monthly_goals")
 
     if show_manage:
         st.warning("항목을 삭제하려면 아래 버튼을 누르세요.")
-        for i, row in st.session_state.monthly_goals.iterrows():
+        for i, row in st.session_state.monthly_goals.records():
             c1, c2 = st.columns([3, 1])
             c1.markdown(f"#### {row['Goal']}")
             # 여기가 바로 보라색 삭제 버튼이 적용되는 부분
             if c2.button("삭제", key=f"m_del_{i}"):
-                st.session_state.monthly_goals = st.session_state.monthly_goals.drop(i).reset_index(drop=True)
-                sync_save_data()
-                st.rerun()
+                st.session_state.monthly_goals.delete(i)
+                commit_change("monthly_goals")
     else:
         # 일반 보기 모드 - 체크박스로 완료 토글
-        for i, row in st.session_state.monthly_goals.iterrows():
+        for i, row in st.session_state.monthly_goals.records():
             done = st.checkbox(f"🎯 {row['Goal']}", value=row['Done'], key=f"m_chk_{i}")
             if done != row['Done']:
-                st.session_state.monthly_goals.at[i, 'Done'] = done
-                sync_save_data()
-                st.rerun()
+                st.session_state.monthly_goals.set(i, 'Done', done)
+                commit_change("monthly_goals")
+
+with menu[2]:
+    monthly_tab()
+
 
 # === [4] 주간 관리 ===
-with menu[3]:
+@st.fragment
+def weekly_tab():
+    refresh_cards()
     st.markdown("### 📆 Weekly Tasks")
     
     col_t1, col_t2 = st.columns(2)
@@ -611,29 +523,32 @@ with menu[3]:
             d = st.selectbox("요일", ["Mon","Tue","Wed","Thu","Fri","Sat","Sun"])
             t = st.text_input("할일 입력")
             if st.button("등록하기", use_container_width=True, key="w_save"):
-                st.session_state.weekly_tasks = pd.concat([st.session_state.weekly_tasks, pd.DataFrame([{"Day":d, "Task":t, "Done":False}])], ignore_index=True)
-                sync_save_data()
-                st.rerun()
+                st.session_state.weekly_tasks.append({"Day":d, "Task":t, "Done":False})
+                commit_change("weekly_tasks")
                 
     if show_manage:
-        for i, row in st.session_state.weekly_tasks.iterrows():
+        for i, row in st.session_state.weekly_tasks.records():
             c1, c2 = st.columns([3, 1])
             c1.markdown(f"**{row['Day']}** : {row['Task']}")
             if c2.button("삭제", key=f"w_del_{i}"):
-                st.session_state.weekly_tasks = st.session_state.weekly_tasks.drop(i).reset_index(drop=True)
-                sync_save_data()
-                st.rerun()
+                st.session_state.weekly_tasks.delete(i)
+                commit_change("weekly_tasks")
     else:
         # 일반 보기 모드 - 체크박스로 완료 토글
-        for i, row in st.session_state.weekly_tasks.iterrows():
+        for i, row in st.session_state.weekly_tasks.records():
             done = st.checkbox(f"📅 {row['Day']} : {row['Task']}", value=row['Done'], key=f"w_chk_{i}")
             if done != row['Done']:
-                st.session_state.weekly_tasks.at[i, 'Done'] = done
-                sync_save_data()
-                st.rerun()
+                st.session_state.weekly_tasks.set(i, 'Done', done)
+                commit_change("weekly_tasks")
+
+with menu[3]:
+    weekly_tab()
+
 
 # === [5] 데일리 ===
-with menu[4]:
+@st.fragment
+def daily_tab():
+    refresh_cards()
     st.markdown("### 📝 Daily Log")
     col_t1, col_t2 = st.columns(2)
     show_add = col_t1.toggle("➕ 추가", key="d_add_t")
@@ -641,36 +556,51 @@ with menu[4]:
     
     if show_add:
         with st.container(border=True):
+            log_day = st.date_input("날짜", key="d_date")
             c1, c2 = st.columns(2)
             s = c1.text_input("시작", "09:00")
             e = c2.text_input("종료", "11:00")
             a = st.text_input("활동 내용")
             if st.button("기록하기", use_container_width=True):
-                st.session_state.daily_time_logs = pd.concat([st.session_state.daily_time_logs, pd.DataFrame([{"StartTime":s, "EndTime":e, "Activity":a, "Category":"Study"}])], ignore_index=True)
-                sync_save_data()
-                st.rerun()
+                st.session_state.daily_time_logs.append({"Date":str(log_day), "StartTime":s, "EndTime":e, "Activity":a, "Category":"Study"})
+                commit_change("daily_time_logs")
                 
+    today_date = datetime.now().date()
+    view = time_log_view(st.session_state.daily_time_logs, today_date)
     if show_manage:
-        for i, row in st.session_state.daily_time_logs.iterrows():
+        for row in view.rows:
             c1, c2 = st.columns([3, 1])
-            c1.markdown(f"{row['StartTime']}~{row['EndTime']} : {row['Activity']}")
-            if c2.button("삭제", key=f"d_del_{i}"):
-                st.session_state.daily_time_logs = st.session_state.daily_time_logs.drop(i).reset_index(drop=True)
-                sync_save_data()
-                st.rerun()
+            c1.markdown(f"{row.day:%m/%d} {row.start}~{row.end} : {row.activity}")
+            if c2.button("삭제", key=f"d_del_{row.id}"):
+                st.session_state.daily_time_logs.delete(row.id)
+                commit_change("daily_time_logs")
     else:
-        # 일반 보기 모드 (카드 스타일)
-        for i, row in st.session_state.daily_time_logs.iterrows():
-            st.markdown(f"<div class='metric-card' style='padding:12px; display:flex; align-items:center;'><span style='font-size:1rem;'>⏰ <b>{row['StartTime']} ~ {row['EndTime']}</b> : {row['Activity']}</span></div>", unsafe_allow_html=True)
+        # 최근 7일 공부 시간 (겹친 기록은 병합, 날짜별/카테고리별 한 번에 집계)
+        days = week_days(today_date)
+        if len(view.log):
+            st.plotly_chart(draw_week_chart(days, view.log.daily_covered(days[0], days[-1], by_category=True)), use_container_width=True, key="chart_week_time")
+
+        # 일반 보기 모드 (카드 스타일, 오늘 기록만)
+        for row in view.rows:
+            if row.day != today_date:
+                continue
+            st.markdown(f"<div class='metric-card' style='padding:12px; display:flex; align-items:center;'><span style='font-size:1rem;'>⏰ <b>{row.start} ~ {row.end}</b> : {row.activity}</span></div>", unsafe_allow_html=True)
         
     st.markdown("#### 📓 Memo")
     memo = st.text_area("", st.session_state.daily_memo, height=150)
     if memo != st.session_state.daily_memo:
         st.session_state.daily_memo = memo
-        sync_save_data()
+        if not save_collections("daily_memo"):
+            st.rerun()
+
+with menu[4]:
+    daily_tab()
+
 
 # === [6] 스터디 ===
-with menu[5]:
+@st.fragment
+def study_tab():
+    refresh_cards()
     st.markdown("### 📖 스터디 플랜")
     col_t1, col_t2 = st.columns(2)
     show_add = col_t1.toggle("➕ 추가", key="s_add_t")
@@ -681,41 +611,41 @@ with menu[5]:
             n = st.text_input("스터디 이름")
             t = st.number_input("목표 횟수", min_value=1, max_value=100, value=10)
             if st.button("생성하기", use_container_width=True):
-                st.session_state.study_sessions = pd.concat([st.session_state.study_sessions, pd.DataFrame([{"Name":n, "Total":int(t), "Done":0}])], ignore_index=True)
-                sync_save_data()
-                st.rerun()
+                st.session_state.study_sessions.append({"Name":n, "Total":int(t), "Done":0})
+                commit_change("study_sessions")
                 
     if show_manage:
-        for i, row in st.session_state.study_sessions.iterrows():
+        for i, row in st.session_state.study_sessions.records():
             c1, c2 = st.columns([3, 1])
             c1.markdown(f"**{row['Name']}**")
             if c2.button("삭제", key=f"s_del_{i}"):
-                st.session_state.study_sessions = st.session_state.study_sessions.drop(i).reset_index(drop=True)
-                sync_save_data()
-                st.rerun()
+                st.session_state.study_sessions.delete(i)
+                commit_change("study_sessions")
     else:
         # 일반 보기 모드 - 진행률 조절 가능
-        for i, row in st.session_state.study_sessions.iterrows():
-            pct = int(row['Done']/row['Total']*100) if row['Total'] > 0 else 0
-            
+        for row in study_view(st.session_state.study_sessions).rows:
             col1, col2, col3, col4 = st.columns([4, 2, 1, 1])
-            col1.markdown(f"**📖 {row['Name']}**")
-            col2.markdown(f"<span style='color:{T['accent']}; font-weight:600;'>{int(row['Done'])}/{int(row['Total'])} ({pct}%)</span>", unsafe_allow_html=True)
+            col1.markdown(f"**📖 {row.name}**")
+            col2.markdown(f"<span style='color:{T['accent']}; font-weight:600;'>{row.done}/{row.total} ({row.pct}%)</span>", unsafe_allow_html=True)
             
-            if col3.button("➖", key=f"s_minus_{i}"):
-                st.session_state.study_sessions.at[i, 'Done'] = max(0, row['Done'] - 1)
-                sync_save_data()
-                st.rerun()
+            if col3.button("➖", key=f"s_minus_{row.id}"):
+                st.session_state.study_sessions.set(row.id, 'Done', max(0, row.done - 1))
+                commit_change("study_sessions")
             
-            if col4.button("➕", key=f"s_plus_{i}"):
-                st.session_state.study_sessions.at[i, 'Done'] = min(row['Total'], row['Done'] + 1)
-                sync_save_data()
-                st.rerun()
+            if col4.button("➕", key=f"s_plus_{row.id}"):
+                st.session_state.study_sessions.set(row.id, 'Done', min(row.total, row.done + 1))
+                commit_change("study_sessions")
             
-            st.progress(pct / 100)
+            st.progress(min(row.pct, 100) / 100)
+
+with menu[5]:
+    study_tab()
+
 
 # === [7] 프로젝트 ===
-with menu[6]:
+@st.fragment
+def project_tab():
+    refresh_cards()
     st.markdown("### 💼 Projects")
     col_t1, col_t2 = st.columns(2)
     show_add = col_t1.toggle("➕ 추가", key="p_add_t")
@@ -728,51 +658,75 @@ with menu[6]:
             total = st.number_input("목표 단계", min_value=1, max_value=50, value=5)
             d = st.date_input("마감일")
             if st.button("추가하기", use_container_width=True):
-                st.session_state.project_data = pd.concat([st.session_state.project_data, pd.DataFrame([{"Subject":s, "Task":t, "Total":int(total), "Done":0, "Deadline":str(d)}])], ignore_index=True)
-                sync_save_data()
-                st.rerun()
+                st.session_state.project_data.append({"Subject":s, "Task":t, "Total":int(total), "Done":0, "Deadline":str(d)})
+                commit_change("project_data")
                 
     if show_manage:
-        for i, row in st.session_state.project_data.iterrows():
+        for i, row in st.session_state.project_data.records():
             c1, c2 = st.columns([3, 1])
             c1.markdown(f"**{row['Subject']}** : {row['Task']}")
             if c2.button("삭제", key=f"p_del_{i}"):
-                st.session_state.project_data = st.session_state.project_data.drop(i).reset_index(drop=True)
-                sync_save_data()
-                st.rerun()
+                st.session_state.project_data.delete(i)
+                commit_change("project_data")
     else:
         # 일반 보기 모드 - 진행률 조절 가능
-        for i, row in st.session_state.project_data.iterrows():
-            total = int(row['Total']) if 'Total' in row else 1
-            done = int(row['Done']) if isinstance(row['Done'], (int, float)) else (1 if row['Done'] else 0)
-            pct = int(done/total*100) if total > 0 else 0
-            
+        for row in project_view(st.session_state.project_data).rows:
             col1, col2, col3, col4 = st.columns([4, 2, 1, 1])
-            col1.markdown(f"**💼 {row['Subject']}** : {row['Task']}")
-            col2.markdown(f"<span style='color:{T['accent']}; font-weight:600;'>{done}/{total} ({pct}%)</span>", unsafe_allow_html=True)
+            col1.markdown(f"**💼 {row.subject}** : {row.task}")
+            col2.markdown(f"<span style='color:{T['accent']}; font-weight:600;'>{row.done}/{row.total} ({row.pct}%)</span>", unsafe_allow_html=True)
             
-            if col3.button("➖", key=f"p_minus_{i}"):
-                st.session_state.project_data.at[i, 'Done'] = max(0, done - 1)
-                sync_save_data()
-                st.rerun()
+            if col3.button("➖", key=f"p_minus_{row.id}"):
+                st.session_state.project_data.set(row.id, 'Done', max(0, row.done - 1))
+                commit_change("project_data")
             
-            if col4.button("➕", key=f"p_plus_{i}"):
-                st.session_state.project_data.at[i, 'Done'] = min(total, done + 1)
-                sync_save_data()
-                st.rerun()
+            if col4.button("➕", key=f"p_plus_{row.id}"):
+                st.session_state.project_data.set(row.id, 'Done', min(row.total, row.done + 1))
+                commit_change("project_data")
             
-            st.progress(pct / 100)
-            st.caption(f"📅 마감: {row['Deadline']}")
+            st.progress(min(row.pct, 100) / 100)
+            st.caption(f"📅 마감: {row.deadline}")
+
+with menu[6]:
+    project_tab()
+
 
 # === [8] 습관 트래커 ===
-with menu[7]:
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_habit_analytics(fingerprint, targets, end, _logs):
+    """습관 기록 지문/목표/날짜가 같으면 이전 분석 결과 재사용 (_logs 는 해시하지 않음)"""
+    return habit_analytics(_logs, targets, end)
+
+def render_habit_analytics():
+    logs = st.session_state.habit_logs
+    targets = tuple(
+        (name, to_int(target, 7))
+        for name, target in zip(st.session_state.habits.column('Name'), st.session_state.habits.column('Target', 7))
+    )
+    analytics = cached_habit_analytics(logs.fingerprint(), targets, datetime.now().date(), logs)
+
+    with st.container(border=True):
+        st.markdown("#### 📈 습관 분석")
+        for stat in analytics.habits:
+            this_week = stat.weekly[-1]
+            c1, c2 = st.columns([3, 2])
+            c1.markdown(f"**{stat.name}**")
+            c2.markdown(f"<span style='color:{T['accent']}; font-weight:600;'>🔥 {stat.current}일 · 최장 {stat.longest}일 · 이번 주 {this_week}/{stat.target}</span>", unsafe_allow_html=True)
+        st.caption("주간 목표 달성 습관 수 (최근 52주)")
+        st.plotly_chart(draw_attainment_chart(analytics), use_container_width=True, key="chart_habit_attainment")
+        st.caption("전체 습관 기록 (최근 52주)")
+        st.plotly_chart(draw_habit_heatmap(analytics), use_container_width=True, key="chart_habit_heatmap")
+
+@st.fragment
+def habit_tab():
+    refresh_cards()
     st.markdown("### 🎯 Habit Tracker")
     
     today = str(datetime.now().date())
     
-    col_t1, col_t2 = st.columns(2)
+    col_t1, col_t2, col_t3 = st.columns(3)
     show_add = col_t1.toggle("➕ 추가", key="h_add_t")
     show_manage = col_t2.toggle("⚙️ 관리", key="h_man_t")
+    show_stats = col_t3.toggle("📈 분석", key="h_stat_t")
     
     if show_add:
         with st.container(border=True):
@@ -782,37 +736,36 @@ with menu[7]:
             h_target = st.number_input("주간 목표 (회)", min_value=1, max_value=7, value=7)
             if st.button("추가하기", use_container_width=True, key="h_save"):
                 if h_name:
-                    st.session_state.habits = pd.concat([st.session_state.habits, pd.DataFrame([{"Name": h_name, "Icon": h_icon, "Target": int(h_target)}])], ignore_index=True)
-                    st.session_state.habit_logs[h_name] = []
-                    sync_save_data()
-                    st.rerun()
+                    # 체크 기록은 첫 체크인 때 생김 -> 습관 정의만 저장
+                    st.session_state.habits.append({"Name": h_name, "Icon": h_icon, "Target": int(h_target)})
+                    commit_change("habits")
+    
+    if show_stats:
+        render_habit_analytics()
     
     if show_manage:
-        for i, row in st.session_state.habits.iterrows():
+        for i, row in st.session_state.habits.records():
             c1, c2 = st.columns([3, 1])
             c1.markdown(f"{row['Icon']} **{row['Name']}**")
             if c2.button("삭제", key=f"h_del_{i}"):
                 habit_name = row['Name']
-                st.session_state.habits = st.session_state.habits.drop(i).reset_index(drop=True)
-                if habit_name in st.session_state.habit_logs:
-                    del st.session_state.habit_logs[habit_name]
-                sync_save_data()
-                st.rerun()
+                st.session_state.habits.delete(i)
+                st.session_state.habit_logs.remove(habit_name)
+                commit_change("habits", "habit_logs")
     else:
         # 습관별 체크인 UI
-        for i, row in st.session_state.habits.iterrows():
+        for i, row in st.session_state.habits.records():
             habit_name = row['Name']
-            logs = st.session_state.habit_logs.get(habit_name, [])
+            logs = st.session_state.habit_logs.get(habit_name)
             
             # 최근 7일 완료 횟수 계산 (스트릭 표시와 일치)
             seven_days_ago = datetime.now().date() - timedelta(days=6)
-            recent_logs = [d for d in logs if d >= str(seven_days_ago)]
-            done_count = len(recent_logs)
+            done_count = logs.count(seven_days_ago, datetime.now().date())
             target = int(row['Target'])
             pct = min(100, int(done_count / target * 100))
             
             # 오늘 체크 여부
-            checked_today = today in logs
+            checked_today = logs.contains(today)
             
             st.markdown(f"---")
             col1, col2, col3 = st.columns([3, 2, 1])
@@ -824,62 +777,24 @@ with menu[7]:
             # 완료(Red)는 secondary 타입 + CSS, 미완료(SkyBlue)는 primary 타입
             btn_label = "✅ 완료" if checked_today else "체크인"
             
-            # 색상 제어를 위한 글로벌 CSS (한 번만 선언해도 되지만 구조상 여기 유지)
-            st.markdown(f"""
-                <style>
-                /* [미완료/하늘색] Primary 버튼 스타일 덮어쓰기 */
-                div.stButton > button[kind="primary"] {{
-                    background-color: {T['accent']} !important;
-                    color: white !important;
-                    border: none !important;
-                    box-shadow: 0 4px 15px rgba(56, 189, 248, 0.3) !important;
-                }}
-                /* [완료/빨간색] Secondary 버튼 스타일 덮어쓰기 */
-                div.stButton > button[kind="secondary"] {{
-                    background-color: #FF4B4B !important;
-                    color: white !important;
-                    border: none !important;
-                    box-shadow: 0 4px 15px rgba(255, 75, 75, 0.3) !important;
-                }}
-                /* 호버 효과 */
-                div.stButton > button:hover {{
-                    opacity: 0.8 !important;
-                    transform: translateY(-1px) !important;
-                }}
-                </style>
-            """, unsafe_allow_html=True)
-
             if col3.button(btn_label, key=f"h_check_{i}", type="secondary" if checked_today else "primary", use_container_width=True):
-                if habit_name not in st.session_state.habit_logs:
-                    st.session_state.habit_logs[habit_name] = []
-                
-                if checked_today:
-                    st.session_state.habit_logs[habit_name].remove(today)
-                else:
-                    if today not in st.session_state.habit_logs[habit_name]:
-                        st.session_state.habit_logs[habit_name].append(today)
-                sync_save_data()
-                st.rerun()
+                st.session_state.habit_logs.toggle(habit_name, today)
+                commit_change("habit_logs")
             
             # 스트릭 (최근 7일 - 클릭하여 토글 가능)
             streak_cols = st.columns(7)
             for d in range(6, -1, -1):
                 day = datetime.now().date() - timedelta(days=d)
-                day_str = str(day)
                 day_name = ["월", "화", "수", "목", "금", "토", "일"][day.weekday()]
-                is_done = day_str in logs
+                is_done = logs.contains(day)
                 with streak_cols[6-d]:
                     # 완료된 날은 secondary(빨강), 미완료는 primary(하늘색)
                     s_label = f"{day_name}\n✓" if is_done else f"{day_name}\n-"
                     if st.button(s_label, key=f"h_day_{i}_{d}", type="secondary" if is_done else "primary", use_container_width=True):
-                        if habit_name not in st.session_state.habit_logs:
-                            st.session_state.habit_logs[habit_name] = []
-                        
-                        if is_done:
-                            st.session_state.habit_logs[habit_name].remove(day_str)
-                        else:
-                            st.session_state.habit_logs[habit_name].append(day_str)
-                        sync_save_data()
-                        st.rerun()
+                        st.session_state.habit_logs.toggle(habit_name, day)
+                        commit_change("habit_logs")
             
-            st.progress(pct / 100)
\ No newline at end of file
+            st.progress(pct / 100)
+
+with menu[7]:
+    habit_tab()
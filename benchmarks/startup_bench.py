@@ -0,0 +1,382 @@
+"""Headless startup/mutation benchmark for both front-ends.
+
+Generates synthetic stores from one day up to ten years of history, times
+`DataHandler` loading, every mutator, the timetable/completion-rate reads,
+the import of `mobile_app/main.py`, the data-loading path of `app.py`, (with
+Streamlit installed) `app.py` reruns through `AppTest` and the habit analytics
+page against a fixed latency budget, and writes the results as JSON so runs
+can be compared:
+
+    python benchmarks/startup_bench.py --output bench.json
+    python benchmarks/startup_bench.py --compare bench.json
+
+Nothing here starts a Flet or Streamlit server. `ft.app` is replaced with a
+no-op while `main.py` is imported; the import is skipped if Flet is missing.
+"""
+
+import argparse
+import datetime
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MOBILE_APP = ROOT / "mobile_app"
+for _path in (ROOT, MOBILE_APP):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from data_handler import DataHandler  # noqa: E402
+from columnar import ColumnTable  # noqa: E402
+from habit_log import HabitLogs, habit_analytics  # noqa: E402
+from web_store import FRAME_COLUMNS, FRAME_KEYS, read_store  # noqa: E402
+
+
+DEFAULT_SIZES = (1, 30, 365, 3650)
+DEFAULT_REPEAT = 5
+END_DATE = datetime.date(2026, 2, 16)
+WEEK_DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+TIMETABLE_DAYS = DataHandler.VALID_TIMETABLE_DAYS
+SUBJECTS = ["자료구조", "운영체제", "데이터베이스", "네트워크", "알고리즘", "영어"]
+REGRESSION_RATIO = 1.25
+HABIT_COUNT = 12
+HABIT_YEARS = 3
+HABIT_ANALYTICS_BUDGET_MS = 20.0  # 습관 분석 화면 1회 계산 (캐시 미스) 허용 시간
+
+
+# --- Synthetic Data ---
+def make_schedule_data(days, seed=0):
+    """A `schedule_data.json` document covering `days` days up to END_DATE."""
+    rng = random.Random(seed)
+    next_id = 0
+
+    def item(content, **extra):
+        nonlocal next_id
+        next_id += 1
+        return dict({"id": str(next_id), "content": content, "done": rng.random() < 0.6}, **extra)
+
+    daily, weekly, monthly = {}, {}, {}
+    for offset in range(days):
+        day = END_DATE - datetime.timedelta(days=offset)
+        daily[day.strftime("%Y-%m-%d")] = [
+            item(f"Task {offset}-{index}", category=rng.choice(["todo", "study", "work"]))
+            for index in range(rng.randint(2, 6))
+        ]
+        iso_year, iso_week, _ = day.isocalendar()
+        week = weekly.setdefault(f"{iso_year}-W{iso_week:02d}", {name: [] for name in WEEK_DAYS})
+        week[WEEK_DAYS[day.weekday()]].append(item(f"Weekly {offset}"))
+        month = day.strftime("%Y-%m")
+        if month not in monthly:
+            monthly[month] = [item(f"Goal {month}-{index}", group="Work") for index in range(4)]
+
+    timetable = []
+    for day_index, day_name in enumerate(TIMETABLE_DAYS):
+        for start in range(1, 9, 3):
+            next_id += 1
+            timetable.append({
+                "id": str(next_id),
+                "subject": SUBJECTS[(day_index + start) % len(SUBJECTS)],
+                "day": day_name,
+                "start_period": start,
+                "end_period": start + 1,
+            })
+
+    return {
+        "daily": daily,
+        "weekly": weekly,
+        "monthly": monthly,
+        "memo": "benchmark",
+        "timetable_entries": timetable,
+        "subject_colors": {subject: f"#{rng.randrange(0x1000000):06X}" for subject in SUBJECTS},
+        "id_seq": next_id,
+    }
+
+
+def make_web_data(days, seed=0):
+    """A `data.json` document for the Streamlit app covering `days` days."""
+    rng = random.Random(seed)
+    dates = [str(END_DATE - datetime.timedelta(days=offset)) for offset in range(days)]
+    habits = [{"Name": f"Habit {index}", "Icon": "✅", "Target": 7} for index in range(5)]
+    return {
+        "semester_progress": {"1-1": {"자료구조": True, "운영체제": False}},
+        "monthly_goals": [{"Goal": f"Goal {index}", "Done": index % 2 == 0} for index in range(12)],
+        "weekly_tasks": [{"Day": WEEK_DAYS[index % 7], "Task": f"Task {index}", "Done": False} for index in range(35)],
+        "daily_time_logs": [
+            {"Date": day, "StartTime": f"{hour:02d}:00", "EndTime": f"{hour + 1:02d}:00", "Activity": f"Log {day}", "Category": "Study"}
+            for day in dates
+            for hour in (9, 14)
+        ],
+        "study_sessions": [{"Name": subject, "Total": 10, "Done": rng.randint(0, 10)} for subject in SUBJECTS],
+        "project_data": [
+            {"Subject": subject, "Task": "Report", "Total": 5, "Done": 2, "Deadline": dates[0]}
+            for subject in SUBJECTS
+        ],
+        "daily_memo": "benchmark",
+        "habits": habits,
+        "habit_logs": {habit["Name"]: [day for day in dates if rng.random() < 0.7] for habit in habits},
+    }
+
+
+def make_habit_logs(habits=HABIT_COUNT, years=HABIT_YEARS, seed=0):
+    """`habit_logs` JSON ({name: [ISO dates]}) with ~70% of days checked."""
+    rng = random.Random(seed)
+    dates = [str(END_DATE - datetime.timedelta(days=offset)) for offset in range(365 * years)]
+    return {f"Habit {index}": [day for day in dates if rng.random() < 0.7] for index in range(habits)}
+
+
+def write_json(path, payload):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, indent=4, ensure_ascii=False)
+
+
+# --- Timing ---
+def measure(func, repeat, setup=None):
+    """Run `func` `repeat` times and return its timings in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(state) if setup is not None else func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "max_ms": round(max(samples), 4),
+        "repeat": repeat,
+    }
+
+
+def bench_data_handler(data_file, repeat):
+    results = {"load": measure(lambda: DataHandler(data_file=data_file), repeat)}
+    handler = DataHandler(data_file=data_file)
+    day, week, month = END_DATE.strftime("%Y-%m-%d"), "2026-W08", "2026-02"
+
+    def new_daily():
+        handler.add_daily_task(day, "bench")
+        return handler.get_daily_tasks(day)[-1]["id"]
+
+    def new_weekly():
+        handler.add_weekly_task(week, "Mon", "bench")
+        return handler.get_weekly_tasks(week)["Mon"][-1]["id"]
+
+    def new_monthly():
+        handler.add_monthly_goal(month, "bench")
+        return handler.get_monthly_goals(month)[-1]["id"]
+
+    def new_entry():
+        clear_entries()
+        return handler.add_timetable_entry("벤치마크", "토", 12, 13, "#123456")["id"]
+
+    def clear_entries():
+        for entry in handler.get_timetable_entries():
+            if entry["subject"] == "벤치마크":
+                handler.delete_timetable_entry(entry["id"])
+
+    results["add_daily_task"] = measure(lambda: handler.add_daily_task(day, "bench"), repeat)
+    results["toggle_daily_task"] = measure(lambda task_id: handler.toggle_daily_task(day, task_id), repeat, new_daily)
+    results["delete_daily_task"] = measure(lambda task_id: handler.delete_daily_task(day, task_id), repeat, new_daily)
+    results["add_daily_tasks_bulk"] = measure(
+        lambda: handler.add_daily_tasks_bulk([(day, f"bulk {index}") for index in range(50)]), repeat
+    )
+    results["add_weekly_task"] = measure(lambda: handler.add_weekly_task(week, "Mon", "bench"), repeat)
+    results["toggle_weekly_task"] = measure(
+        lambda task_id: handler.toggle_weekly_task(week, "Mon", task_id), repeat, new_weekly
+    )
+    results["delete_weekly_task"] = measure(
+        lambda task_id: handler.delete_weekly_task(week, "Mon", task_id), repeat, new_weekly
+    )
+    results["add_monthly_goal"] = measure(lambda: handler.add_monthly_goal(month, "bench"), repeat)
+    results["toggle_monthly_goal"] = measure(
+        lambda task_id: handler.toggle_monthly_goal(month, task_id), repeat, new_monthly
+    )
+    results["delete_monthly_goal"] = measure(
+        lambda task_id: handler.delete_monthly_goal(month, task_id), repeat, new_monthly
+    )
+    results["update_memo"] = measure(lambda: handler.update_memo("bench memo"), repeat)
+    results["add_timetable_entry"] = measure(lambda _: new_entry(), repeat, clear_entries)
+    results["delete_timetable_entry"] = measure(
+        lambda entry_id: handler.delete_timetable_entry(entry_id), repeat, new_entry
+    )
+    results["get_timetable_entries"] = measure(handler.get_timetable_entries, repeat)
+    results["get_completion_rate"] = measure(lambda: handler.get_completion_rate(day), repeat)
+    results["get_weekly_completion_rate"] = measure(lambda: handler.get_weekly_completion_rate(week), repeat)
+    results["get_monthly_completion_rate"] = measure(lambda: handler.get_monthly_completion_rate(month), repeat)
+    return results
+
+
+def bench_web_load(data_file, repeat):
+    """`app.py`'s `sync_load_data` path: JSON read plus session table construction."""
+    results = {"read_store": measure(lambda: read_store(data_file), repeat)}
+    data = read_store(data_file)
+    results["to_tables"] = measure(
+        lambda: {key: ColumnTable.from_records(data[key], FRAME_COLUMNS[key]) for key in FRAME_KEYS if key in data},
+        repeat,
+    )
+    return results
+
+
+def bench_streamlit_reruns(data_file, repeat):
+    """Full `app.py` run vs. the rerun triggered by one habit check-in.
+
+    Uses Streamlit's headless `AppTest`; with per-tab fragments the check-in
+    only reruns the habit tab (plus the dashboard card that depends on it).
+    """
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return {"skipped": "streamlit is not installed"}
+
+    previous_dir = os.getcwd()
+    os.chdir(os.path.dirname(data_file))
+    try:
+        def fresh_app():
+            app = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+            app.run()
+            return app
+
+        results = {"full_run": measure(fresh_app, repeat)}
+        app = fresh_app()
+        results["rerun"] = measure(app.run, repeat)
+        results["habit_check_in"] = measure(lambda: app.button(key="h_check_0").click().run(), repeat)
+    finally:
+        os.chdir(previous_dir)
+    return results
+
+
+def bench_habit_analytics(repeat, seed=0):
+    """Habit analytics page for a dozen habits with years of history.
+
+    `within_budget` compares the median of an uncached `habit_analytics` run
+    with HABIT_ANALYTICS_BUDGET_MS.
+    """
+    data = make_habit_logs(seed=seed)
+    targets = [(name, 5) for name in data]
+    results = {"from_json": measure(lambda: HabitLogs.from_json(data), repeat)}
+    logs = HabitLogs.from_json(data)
+    results["fingerprint"] = measure(logs.fingerprint, repeat)
+    results["habit_analytics"] = measure(lambda: habit_analytics(logs, targets, END_DATE), repeat)
+    results["budget_ms"] = HABIT_ANALYTICS_BUDGET_MS
+    results["within_budget"] = results["habit_analytics"]["median_ms"] <= HABIT_ANALYTICS_BUDGET_MS
+    return results
+
+
+def bench_flet_import(repeat):
+    """Import `mobile_app/main.py` (Color.kt parsing, constants) without a window."""
+    try:
+        import flet
+    except ImportError:
+        return {"skipped": "flet is not installed"}
+
+    def import_main():
+        spec = importlib.util.spec_from_file_location("_bench_main", MOBILE_APP / "main.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    original_app = flet.app
+    flet.app = lambda *args, **kwargs: None
+    try:
+        results = {"import_main": measure(import_main, repeat)}
+        module = import_main()
+        results["parse_material_colors"] = measure(module._parse_material_colors, repeat)
+    finally:
+        flet.app = original_app
+    return results
+
+
+def run_suite(sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT, seed=0):
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "import": bench_flet_import(repeat),
+        "habits": bench_habit_analytics(repeat, seed),
+        "sizes": {},
+    }
+    for days in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schedule_file = os.path.join(tmp_dir, "schedule_data.json")
+            web_file = os.path.join(tmp_dir, "data.json")
+            write_json(schedule_file, make_schedule_data(days, seed))
+            write_json(web_file, make_web_data(days, seed))
+            report["sizes"][f"{days}d"] = {
+                "file_bytes": os.path.getsize(schedule_file),
+                "data_handler": bench_data_handler(schedule_file, repeat),
+                "web": bench_web_load(web_file, repeat),
+                "streamlit": bench_streamlit_reruns(web_file, repeat),
+            }
+    return report
+
+
+# --- Comparison ---
+def _flatten(node, prefix=""):
+    if isinstance(node, dict):
+        if "median_ms" in node:
+            yield prefix, node["median_ms"]
+            return
+        for key, value in node.items():
+            yield from _flatten(value, f"{prefix}/{key}" if prefix else key)
+
+
+def compare(baseline, current, ratio=REGRESSION_RATIO):
+    """Return `[(metric, baseline_ms, current_ms)]` for medians slower than `ratio`."""
+    sections = ("import", "habits", "sizes")
+    before = dict(_flatten({key: baseline.get(key) for key in sections}))
+    regressions = []
+    for metric, value in _flatten({key: current.get(key) for key in sections}):
+        previous = before.get(metric)
+        if previous and value > previous * ratio:
+            regressions.append((metric, previous, value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="history lengths in days")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.repeat, args.seed)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+
+    status = 0
+    habits = report["habits"]
+    if not habits["within_budget"]:
+        print(
+            f"Over budget habits/habit_analytics: {habits['habit_analytics']['median_ms']:.3f}ms "
+            f"> {habits['budget_ms']:.1f}ms",
+            file=sys.stderr,
+        )
+        status = 1
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            regressions = compare(json.load(file), report)
+        for metric, previous, value in regressions:
+            print(f"Regression {metric}: {previous:.3f}ms -> {value:.3f}ms", file=sys.stderr)
+        return 1 if regressions else status
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# ---------------------------------------------------------
+# Streamlit 세션 컬렉션용 열(column) 기반 테이블
+# - 추가: 열 리스트 끝에 append (분할 상환 O(1), pd.concat 처럼 전체 복사 없음)
+# - 삭제: 묘비(tombstone) 표시 후 일정 비율이 넘으면 한 번에 압축
+# - 행 ID: 추가 순서대로 발급되어 삭제 후에도 바뀌지 않음 (위젯 key 로 사용)
+#   저장할 때 레코드의 "_id" 로 함께 저장 -> 다시 읽어도 같은 행은 같은 ID
+# - 파생 열/합계는 memo() 로 version 별 캐시 (데이터가 바뀔 때만 다시 계산)
+# ---------------------------------------------------------
+
+COMPACT_MIN_DEAD = 32  # 묘비가 이보다 적으면 압축하지 않음
+ID_FIELD = "_id"  # 저장된 레코드 안의 행 ID (열로 취급하지 않음)
+
+
+class ColumnTable:
+    def __init__(self, columns=(), records=()):
+        self.columns = []
+        self._values = {}
+        self._ids = []  # 슬롯별 행 ID (None = 삭제됨)
+        self._slots = {}  # 행 ID -> 슬롯
+        self._next_id = 0
+        self._dead = 0
+        self.version = 0  # 내용이 바뀔 때마다 증가 (캐시 무효화용)
+        self._memo = {}  # key -> (version, 값)
+        for name in columns:
+            self._add_column(name)
+        for record in records:
+            self.append(record)
+
+    @classmethod
+    def from_records(cls, records, columns=()):
+        return cls(columns, records)
+
+    def _add_column(self, name):
+        self.columns.append(name)
+        self._values[name] = [None] * len(self._ids)
+
+    def _touch(self):
+        self.version += 1
+
+    # --- 조회 ---
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, row_id):
+        return row_id in self._slots
+
+    def ids(self):
+        return [row_id for row_id in self._ids if row_id is not None]
+
+    def get(self, row_id, column, default=None):
+        values = self._values.get(column)
+        if values is None:
+            return default
+        return values[self._slots[row_id]]
+
+    def row(self, row_id):
+        slot = self._slots[row_id]
+        return {name: self._values[name][slot] for name in self.columns}
+
+    def items(self):
+        """살아 있는 행을 (행 ID, dict) 로 순서대로 반환"""
+        for slot, row_id in enumerate(self._ids):
+            if row_id is not None:
+                yield row_id, {name: self._values[name][slot] for name in self.columns}
+
+    def records(self):
+        """items() 결과를 version 별로 캐시한 리스트 (화면 렌더링용, 수정하지 말 것)"""
+        return self.memo("records", lambda table: list(table.items()))
+
+    def memo(self, key, compute):
+        """compute(table) 결과를 현재 version 에 대해 한 번만 계산"""
+        cached = self._memo.get(key)
+        if cached is None or cached[0] != self.version:
+            cached = self._memo[key] = (self.version, compute(self))
+        return cached[1]
+
+    def column(self, name, default=None):
+        """살아 있는 행의 한 열 값 리스트 (열이 없으면 default 로 채움)"""
+        values = self._values.get(name)
+        if values is None:
+            return [default] * len(self)
+        if not self._dead:
+            return list(values)
+        return [value for value, row_id in zip(values, self._ids) if row_id is not None]
+
+    # --- 변경 ---
+    def append(self, record):
+        """행을 추가하고 행 ID 반환
+
+        저장된 레코드에 쓰이지 않은 "_id" 가 있으면 그 ID 를 그대로 사용,
+        없거나 겹치면 새 ID 발급 (새 ID 는 항상 지금까지의 최대 ID 보다 큼)
+        """
+        for name in record:
+            if name not in self._values and name != ID_FIELD:
+                self._add_column(name)
+        for name in self.columns:
+            self._values[name].append(record.get(name))
+        row_id = record.get(ID_FIELD)
+        if type(row_id) is not int or row_id < 0 or row_id in self._slots:
+            row_id = self._next_id
+        self._next_id = max(self._next_id, row_id + 1)
+        self._slots[row_id] = len(self._ids)
+        self._ids.append(row_id)
+        self._touch()
+        return row_id
+
+    def set(self, row_id, column, value):
+        if column not in self._values:
+            self._add_column(column)
+        self._values[column][self._slots[row_id]] = value
+        self._touch()
+
+    def delete(self, row_id):
+        slot = self._slots.pop(row_id)
+        self._ids[slot] = None
+        self._dead += 1
+        self._touch()
+        if self._dead >= COMPACT_MIN_DEAD and self._dead * 2 >= len(self._ids):
+            self.compact()
+
+    def compact(self):
+        """묘비 슬롯을 제거 (행 ID 는 그대로 유지)"""
+        if not self._dead:
+            return
+        live = [slot for slot, row_id in enumerate(self._ids) if row_id is not None]
+        for name in self.columns:
+            values = self._values[name]
+            self._values[name] = [values[slot] for slot in live]
+        self._ids = [self._ids[slot] for slot in live]
+        self._slots = {row_id: slot for slot, row_id in enumerate(self._ids)}
+        self._dead = 0
+
+    # --- 변환 ---
+    def to_records(self):
+        """JSON 저장용 dict 리스트 (행 ID 는 "_id" 로 함께 저장)"""
+        return [dict(row, **{ID_FIELD: row_id}) for row_id, row in self.items()]
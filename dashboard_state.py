@@ -0,0 +1,78 @@
+# ---------------------------------------------------------
+# 대시보드 카드 갱신 상태 (app.py 의 st.session_state.dashboard)
+# - 탭 본문은 st.fragment: 탭에서 데이터를 바꾸면 저장 후 그 탭만 다시 실행
+# - 바뀐 컬렉션에 의존하는 카드만 다음 fragment 실행 때 다시 그림
+# - 저장이 실패하거나 다른 세션의 데이터를 다시 읽었으면 앱 전체 다시 실행
+# - 카드 값은 지문 (의존 컬렉션의 변경 번호 + 테마 [+ 날짜]) 이 같으면 재사용
+#   데이터 자체는 해시하지 않음: 변경은 모두 commit 을 거치고, 다시 읽으면 reset
+# Streamlit 없이 동작 (단위 테스트용)
+# ---------------------------------------------------------
+
+CARD_DEPENDENCIES = {
+    "semester": ("semester_progress",),
+    "monthly": ("monthly_goals",),
+    "weekly": ("weekly_tasks",),
+    "daily": ("daily_time_logs",),
+    "study": ("study_sessions",),
+    "project": ("project_data",),
+    "habit": ("habits", "habit_logs"),
+}
+DATED_CARDS = ("daily", "habit")  # 오늘 기준으로 계산하는 카드 (날짜가 바뀌면 재계산)
+
+
+class DashboardState:
+    def __init__(self, dependencies=CARD_DEPENDENCIES):
+        self.dependencies = dependencies
+        self.revisions = {}  # 컬렉션 -> 변경 번호 (commit 때마다 증가)
+        self.dirty = set()  # 다음 fragment 실행 때 다시 그릴 카드
+        self.cache = {}  # 카드 -> (지문, 값)
+        self.hits = 0
+        self.misses = 0
+
+    def cards_for(self, collections):
+        """collections 중 하나라도 의존하는 카드"""
+        changed = set(collections)
+        return {card for card, deps in self.dependencies.items() if changed.intersection(deps)}
+
+    def changed(self, *collections):
+        for name in collections:
+            self.revisions[name] = self.revisions.get(name, 0) + 1
+        self.dirty |= self.cards_for(collections)
+
+    def commit(self, collections, save):
+        """save() 후 다시 실행할 범위 반환
+
+        - save() 가 True: 의존 카드만 갱신 대상으로 표시하고 "fragment" (현재 탭만)
+        - False (저장 실패, 충돌/다른 세션 변경으로 다시 읽음): "app" (전체)
+        """
+        if not save():
+            return "app"
+        self.changed(*collections)
+        return "fragment"
+
+    def take_dirty(self):
+        """갱신 대상 카드를 꺼내고 비움"""
+        cards, self.dirty = self.dirty, set()
+        return cards
+
+    def reset(self):
+        """세션 데이터를 다시 읽었을 때: 캐시된 카드 값 폐기"""
+        self.cache = {}
+
+    def fingerprint(self, card, theme, today):
+        fingerprint = (theme,) + tuple(self.revisions.get(name, 0) for name in self.dependencies[card])
+        if card in DATED_CARDS:
+            fingerprint += (today,)
+        return fingerprint
+
+    def values(self, card, compute, theme, today):
+        """지문이 같으면 이전 compute() 결과 재사용"""
+        fingerprint = self.fingerprint(card, theme, today)
+        cached = self.cache.get(card)
+        if cached is not None and cached[0] == fingerprint:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        value = compute()
+        self.cache[card] = (fingerprint, value)
+        return value
@@ -0,0 +1,245 @@
+import datetime
+from collections import namedtuple
+
+# ---------------------------------------------------------
+# 습관 체크 기록 (습관 이름 -> 날짜 bitset)
+# - 비트 i = (기준일 + i) 에 체크했는지. 기준일은 습관별 가장 이른 체크 날짜
+# - 체크/해제/조회 O(1), 기간 내 횟수는 popcount, 연속 일수는 비트 연산
+# - JSON 의 {이름: ["YYYY-MM-DD", ...]} 와 손실 없이 변환
+#   (날짜가 아닌 문자열도 그대로 보관했다가 다시 저장)
+#   바꾸지 않은 습관은 읽은 리스트 그대로 저장 (순서/중복 유지 -> 저장 파일이 흔들리지 않음)
+#   바꾼 습관은 정렬된 중복 없는 날짜 + 날짜가 아닌 값 순으로 정규화
+# ---------------------------------------------------------
+
+
+def _popcount(value):
+    try:
+        return value.bit_count()
+    except AttributeError:  # Python < 3.10
+        return bin(value).count("1")
+
+
+HabitStats = namedtuple("HabitStats", "name target current longest weekly")
+HabitAnalytics = namedtuple("HabitAnalytics", "habits week_starts attainment heatmap")
+
+
+def _ordinal(day):
+    if isinstance(day, str):
+        day = datetime.date.fromisoformat(day)
+    return day.toordinal()
+
+
+class HabitDays:
+    """한 습관의 체크 날짜 bitset"""
+
+    __slots__ = ("base", "bits", "extras", "source")
+
+    def __init__(self):
+        self.base = None  # 비트 0 에 해당하는 날짜 ordinal
+        self.bits = 0
+        self.extras = []  # 날짜로 읽을 수 없는 원본 문자열 (저장 시 그대로 복원)
+        self.source = None  # 읽은 JSON 리스트 (변경 전까지 그대로 저장)
+
+    def __len__(self):
+        return _popcount(self.bits)
+
+    def _index(self, ordinal):
+        return ordinal - self.base
+
+    def contains(self, day):
+        if self.base is None:
+            return False
+        index = self._index(_ordinal(day))
+        return index >= 0 and (self.bits >> index) & 1 == 1
+
+    def add(self, day):
+        ordinal = _ordinal(day)
+        self.source = None
+        if self.base is None:
+            self.base = ordinal
+        elif ordinal < self.base:
+            self.bits <<= self.base - ordinal
+            self.base = ordinal
+        self.bits |= 1 << self._index(ordinal)
+
+    def discard(self, day):
+        if self.base is None:
+            return
+        self.source = None
+        index = self._index(_ordinal(day))
+        if index >= 0:
+            self.bits &= ~(1 << index)
+
+    def toggle(self, day):
+        """체크 상태를 뒤집고 새 상태 반환"""
+        if self.contains(day):
+            self.discard(day)
+            return False
+        self.add(day)
+        return True
+
+    def _window(self, start, end):
+        """[start, end] 구간의 비트 (비트 0 = start)"""
+        if self.base is None:
+            return 0
+        lo, hi = _ordinal(start) - self.base, _ordinal(end) - self.base
+        if hi < 0 or hi < lo:
+            return 0
+        if lo < 0:
+            return (self.bits & ((1 << (hi + 1)) - 1)) << -lo
+        return (self.bits >> lo) & ((1 << (hi - lo + 1)) - 1)
+
+    def count(self, start, end):
+        """start ~ end (포함) 체크 횟수"""
+        return _popcount(self._window(start, end))
+
+    def current_streak(self, end):
+        """end 까지 이어진 연속 체크 일수 (end 가 체크되지 않았으면 0)"""
+        if self.base is None:
+            return 0
+        index = self._index(_ordinal(end))
+        if index < 0:
+            return 0
+        gaps = ~self.bits & ((1 << (index + 1)) - 1)
+        if gaps == 0:
+            return index + 1
+        return index - (gaps.bit_length() - 1)
+
+    def longest_streak(self, start=None, end=None):
+        bits = self.bits
+        if start is not None or end is not None:
+            if self.base is None:
+                return 0
+            start = start if start is not None else datetime.date.fromordinal(self.base)
+            end = end if end is not None else datetime.date.fromordinal(self.base + max(bits.bit_length() - 1, 0))
+            bits = self._window(start, end)
+        # x &= x << 1 을 반복할 때마다 가장 긴 연속 구간이 1 씩 줄어듦
+        best = 0
+        while bits:
+            bits &= bits << 1
+            best += 1
+        return best
+
+    def days(self):
+        """체크한 날짜 리스트 (오름차순)"""
+        result = []
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            result.append(datetime.date.fromordinal(self.base + low.bit_length() - 1))
+            bits ^= low
+        return result
+
+    def to_json(self):
+        if self.source is not None:
+            return list(self.source)
+        return [str(day) for day in self.days()] + list(self.extras)
+
+
+class HabitLogs:
+    """습관 이름 -> HabitDays. app.py 의 st.session_state.habit_logs"""
+
+    def __init__(self):
+        self._habits = {}
+
+    @classmethod
+    def from_json(cls, data):
+        """기록이 리스트가 아닌 습관: 문자열 하나면 [값] 으로, 그 밖의 값은 건너뜀"""
+        logs = cls()
+        for name, values in (data or {}).items():
+            if isinstance(values, str):
+                values = [values]
+            elif not isinstance(values, list):
+                print(f"Error loading habit log {name!r}: {type(values).__name__}")
+                continue
+            habit = logs.ensure(name)
+            for value in values:
+                try:
+                    habit.add(value)
+                except (AttributeError, TypeError, ValueError):
+                    habit.extras.append(value)
+            habit.source = list(values)
+        return logs
+
+    def to_json(self):
+        return {name: habit.to_json() for name, habit in self._habits.items()}
+
+    def __contains__(self, name):
+        return name in self._habits
+
+    def __iter__(self):
+        return iter(self._habits)
+
+    def __len__(self):
+        return len(self._habits)
+
+    def ensure(self, name):
+        habit = self._habits.get(name)
+        if habit is None:
+            habit = self._habits[name] = HabitDays()
+        return habit
+
+    def get(self, name):
+        """없는 습관이면 빈 HabitDays (저장하지 않음)"""
+        habit = self._habits.get(name)
+        return habit if habit is not None else HabitDays()
+
+    def remove(self, name):
+        self._habits.pop(name, None)
+
+    def contains(self, name, day):
+        habit = self._habits.get(name)
+        return habit is not None and habit.contains(day)
+
+    def toggle(self, name, day):
+        return self.ensure(name).toggle(day)
+
+    def fingerprint(self):
+        """기록 내용의 지문 (캐시 키). bitset 이라 전체 날짜 리스트보다 훨씬 작음"""
+        return tuple((name, habit.base, habit.bits, tuple(habit.extras)) for name, habit in self._habits.items())
+
+
+def _as_date(day):
+    return day if isinstance(day, datetime.date) else datetime.date.fromisoformat(day)
+
+
+def _weeks_start(end, weeks):
+    """end 가 속한 주를 마지막으로 하는 weeks 주의 첫 월요일"""
+    return end - datetime.timedelta(days=end.weekday() + 7 * (weeks - 1))
+
+
+def _add_to_grid(grid, window):
+    while window:
+        low = window & -window
+        index = low.bit_length() - 1
+        grid[index % 7][index // 7] += 1
+        window ^= low
+
+
+def habit_analytics(logs, targets, end, weeks=52):
+    """습관 분석 화면 데이터를 습관별 bitset 한 번씩만 읽어서 계산
+
+    targets: [(습관 이름, 주간 목표 횟수)]. 반환 HabitAnalytics:
+    - habits: 습관별 현재/최장 연속 일수와 주별 체크 수
+      (오늘 아직 체크 전이면 어제까지의 연속 일수를 현재 값으로 사용)
+    - week_starts / attainment: 주별 (월요일, 목표를 채운 습관 수)
+    - heatmap: 전체 습관 합계 [요일][주]
+    """
+    end = _as_date(end)
+    first = _weeks_start(end, weeks)
+    yesterday = end - datetime.timedelta(days=1)
+    grid = [[0] * weeks for _ in range(7)]
+    attainment = [0] * weeks
+    stats = []
+    for name, target in targets:
+        habit = logs.get(name)
+        window = habit._window(first, end)
+        weekly = [_popcount((window >> (7 * week)) & 0x7F) for week in range(weeks)]
+        for week, count in enumerate(weekly):
+            if count >= target:
+                attainment[week] += 1
+        _add_to_grid(grid, window)
+        current = habit.current_streak(end) or habit.current_streak(yesterday)
+        stats.append(HabitStats(name, target, current, habit.longest_streak(), weekly))
+    week_starts = [first + datetime.timedelta(days=7 * week) for week in range(weeks)]
+    return HabitAnalytics(stats, week_starts, attainment, grid)
@@ -0,0 +1,238 @@
+import datetime
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+ALL = None  # category / weekday wildcard
+
+
+def parse_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    try:
+        return datetime.date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def is_perfect_day(done, total):
+    """A streak day has at least one task and every task done."""
+    return total > 0 and done == total
+
+
+def longest_run(flags):
+    best = run = 0
+    for flag in flags:
+        run = run + 1 if flag else 0
+        best = max(best, run)
+    return best
+
+
+# --- Array backend (NumPy when available, `array` otherwise) ---
+def _zeros(length):
+    if np is not None:
+        return np.zeros(length, dtype=np.int64)
+    return array("q", bytes(8 * length))
+
+
+def _cumulative(values):
+    """Prefix sums with a leading zero: `cum[j] - cum[i]` sums `values[i:j]`."""
+    if np is not None:
+        cum = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(values, out=cum[1:])
+        return cum
+    cum = array("q", [0])
+    total = 0
+    for value in values:
+        total += value
+        cum.append(total)
+    return cum
+
+
+def _add_suffix(values, start, delta):
+    if np is not None:
+        values[start:] += delta
+        return
+    for index in range(start, len(values)):
+        values[index] += delta
+
+
+def _pad(values, count, fill=0):
+    if np is not None:
+        return np.concatenate([values, np.full(count, fill, dtype=np.int64)])
+    values.extend([fill] * count)
+    return values
+
+
+class DailyRollup:
+    """Per-day done/total counts with prefix sums for O(1) range queries.
+
+    Days are indexed by ordinal offset from the first date seen. Per-day
+    counts are kept per category (and for all categories); prefix arrays for
+    a (category, weekday) pair are built on first use and then shifted in
+    place when a day changes, so a range query is two lookups.
+    """
+
+    def __init__(self):
+        self._base = None
+        self._length = 0
+        self._days = {}  # category -> (done per day, total per day)
+        self._prefix = {}  # (category, weekday) -> (cum done, cum total)
+        self._runs = None  # perfect-day run length ending at each index
+
+    def __len__(self):
+        return self._length
+
+    def _index(self, day):
+        return day.toordinal() - self._base
+
+    def _ensure_range(self, day):
+        ordinal = day.toordinal()
+        if self._base is None:
+            self._base = ordinal
+            self._length = 1
+            return
+        if ordinal < self._base:
+            self._rebase(ordinal)
+        elif ordinal >= self._base + self._length:
+            extra = ordinal - self._base - self._length + 1
+            self._length += extra
+            for category, (done, total) in list(self._days.items()):
+                self._days[category] = (_pad(done, extra), _pad(total, extra))
+            for key, (cum_done, cum_total) in list(self._prefix.items()):
+                self._prefix[key] = (_pad(cum_done, extra, cum_done[-1]), _pad(cum_total, extra, cum_total[-1]))
+
+    def _rebase(self, ordinal):
+        # History grew backwards: rebuild with the earlier start (rare).
+        shift = self._base - ordinal
+        days = {}
+        for category, (done, total) in self._days.items():
+            new_done, new_total = _zeros(shift + self._length), _zeros(shift + self._length)
+            new_done[shift:] = done
+            new_total[shift:] = total
+            days[category] = (new_done, new_total)
+        self._base = ordinal
+        self._length += shift
+        self._days = days
+        self._prefix = {}
+
+    def _arrays(self, category):
+        arrays = self._days.get(category)
+        if arrays is None:
+            arrays = self._days[category] = (_zeros(self._length), _zeros(self._length))
+        return arrays
+
+    def set_day(self, day, counts):
+        """Replace one day's counts with `{category: (done, total)}`."""
+        day = parse_date(day)
+        if day is None:
+            return
+        if not counts and (self._base is None or not 0 <= day.toordinal() - self._base < self._length):
+            return
+        self._ensure_range(day)
+        index = self._index(day)
+        overall = [0, 0]
+        for category in set(self._days) | set(counts):
+            if category is ALL:
+                continue
+            done, total = counts.get(category, (0, 0))
+            overall[0] += done
+            overall[1] += total
+            self._update(category, day, index, done, total)
+        self._update(ALL, day, index, *overall)
+        self._runs = None
+
+    def _update(self, category, day, index, done, total):
+        done_values, total_values = self._arrays(category)
+        delta_done = done - int(done_values[index])
+        delta_total = total - int(total_values[index])
+        if not delta_done and not delta_total:
+            return
+        done_values[index] = done
+        total_values[index] = total
+        for (key_category, weekday), (cum_done, cum_total) in self._prefix.items():
+            if key_category != category or (weekday is not ALL and weekday != day.weekday()):
+                continue
+            _add_suffix(cum_done, index + 1, delta_done)
+            _add_suffix(cum_total, index + 1, delta_total)
+
+    def _prefix_for(self, category, weekday):
+        key = (category, weekday)
+        cached = self._prefix.get(key)
+        if cached is None:
+            done, total = self._days.get(category, (_zeros(self._length), _zeros(self._length)))
+            if weekday is not ALL:
+                done, total = self._mask_weekday(done, weekday), self._mask_weekday(total, weekday)
+            cached = self._prefix[key] = (_cumulative(done), _cumulative(total))
+        return cached
+
+    def _mask_weekday(self, values, weekday):
+        first = datetime.date.fromordinal(self._base).weekday()
+        offset = (weekday - first) % 7
+        masked = _zeros(self._length)
+        masked[offset::7] = values[offset::7]
+        return masked
+
+    def _clamp(self, start, end):
+        start, end = parse_date(start), parse_date(end)
+        if self._base is None or start is None or end is None:
+            return None
+        low = max(start.toordinal() - self._base, 0)
+        high = min(end.toordinal() - self._base, self._length - 1)
+        return (low, high) if low <= high else None
+
+    def range_counts(self, start, end, category=ALL, weekday=ALL):
+        """Return `(done, total)` over `[start, end]` (inclusive)."""
+        bounds = self._clamp(start, end)
+        if bounds is None:
+            return 0, 0
+        low, high = bounds
+        cum_done, cum_total = self._prefix_for(category, weekday)
+        return int(cum_done[high + 1] - cum_done[low]), int(cum_total[high + 1] - cum_total[low])
+
+    def day_counts(self, day, category=ALL):
+        day = parse_date(day)
+        if day is None or self._base is None or not 0 <= self._index(day) < self._length:
+            return 0, 0
+        done, total = self._days.get(category, (None, None))
+        if done is None:
+            return 0, 0
+        index = self._index(day)
+        return int(done[index]), int(total[index])
+
+    def _run_lengths(self):
+        if self._runs is None:
+            done, total = self._days.get(ALL, (_zeros(self._length), _zeros(self._length)))
+            runs = _zeros(self._length)
+            run = 0
+            for index in range(self._length):
+                run = run + 1 if is_perfect_day(int(done[index]), int(total[index])) else 0
+                runs[index] = run
+            self._runs = runs
+        return self._runs
+
+    def current_streak(self, end):
+        """Consecutive perfect days ending at `end`."""
+        day = parse_date(end)
+        if day is None or self._base is None:
+            return 0
+        index = self._index(day)
+        if not 0 <= index < self._length:
+            return 0
+        return int(self._run_lengths()[index])
+
+    def longest_streak(self, start, end):
+        bounds = self._clamp(start, end)
+        if bounds is None:
+            return 0
+        low, high = bounds
+        runs = self._run_lengths()
+        best = 0
+        for index in range(low, high + 1):
+            # Runs that began before `start` only count from `start` on.
+            best = max(best, min(int(runs[index]), index - low + 1))
+        return best
@@ -1,7 +1,20 @@
+import atexit
+import bisect
+import contextlib
+import copy
 import datetime
+import functools
+import itertools
 import json
 import os
-import shutil
+import threading
+import time
+
+from analytics import DailyRollup, parse_date
+from planner_rules import PlannerRules
+from shard_store import (
+    SHARDED_SECTIONS, ShardedSection, ShardStore, copy_document, shard_for, split_sections, write_text_atomic,
+)
 
 
 def _resolve_data_file():
@@ -16,185 +29,640 @@ def _resolve_data_file():
 DATA_FILE = _resolve_data_file()
 
 
-class DataHandler:
-    VALID_TIMETABLE_DAYS = ["월", "화", "수", "목", "금", "토"]
-    MIN_PERIOD = 0
-    MAX_PERIOD = 14
-    DEFAULT_SUBJECT_COLOR = "#6CAB45"
+def _synchronized(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _SaveWorker:
+    """Background writer that coalesces saves within a debounce window."""
+
+    def __init__(self, handler, debounce_seconds):
+        self.handler = handler
+        self.debounce_seconds = debounce_seconds
+        self._condition = threading.Condition()
+        self._due = None
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="DataHandlerSaveWorker", daemon=True)
+        self._thread.start()
+
+    def schedule(self):
+        with self._condition:
+            if self._due is None:
+                self._due = time.monotonic() + self.debounce_seconds
+                self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if self._due is not None:
+                        remaining = self._due - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait()
+                if self._stopped:
+                    return
+                self._due = None
+            self.handler.flush()
+
+
+class DataHandler(PlannerRules):
+    JOURNAL_COMPACT_THRESHOLD = 200
+    DEFAULT_DEBOUNCE_SECONDS = 0.5
+    BACKENDS = ("json", "sqlite")
+    LAYOUTS = ("single", "sharded")
+    MAX_LOADED_SHARDS = 4
+
+    def __new__(cls, data_file=DATA_FILE, *args, backend="json", **kwargs):
+        if backend not in cls.BACKENDS:
+            raise ValueError(f"Unknown storage backend: {backend}")
+        if backend == "sqlite":
+            # Journal, write-behind and layout only apply to the JSON files.
+            if args or kwargs:
+                options = ", ".join(sorted(kwargs)) or "positional storage options"
+                raise TypeError(f"The sqlite backend does not support: {options}")
+            from sqlite_handler import SqliteDataHandler
+
+            return SqliteDataHandler.for_json_file(data_file)
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        data_file=DATA_FILE,
+        journal=False,
+        compact_threshold=JOURNAL_COMPACT_THRESHOLD,
+        *,
+        backend="json",
+        write_behind=False,
+        debounce_seconds=DEFAULT_DEBOUNCE_SECONDS,
+        layout="single",
+        max_loaded_shards=MAX_LOADED_SHARDS,
+    ):
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unknown storage layout: {layout}")
+        if layout == "sharded" and journal:
+            raise ValueError("The sharded layout cannot be combined with journal mode.")
 
-    def __init__(self, data_file=DATA_FILE):
         self.data_file = data_file
         self.backup_file = f"{data_file}.bak"
+        # Sharded layout: `data_file` keeps memo/timetable/colors and every
+        # `YYYY-MM` partition of daily/weekly/monthly lives in its own file
+        # under `<data_file stem>.shards/`, loaded on first access.
+        self.layout = layout
+        self.shard_dir = f"{os.path.splitext(data_file)[0]}.shards"
+        self._shards = None
+        self._root_dirty = False
+        if layout == "sharded":
+            self._shards = ShardStore(
+                self.shard_dir,
+                max_loaded=max_loaded_shards,
+                on_load=self._on_shard_load,
+                on_evict=self._on_shard_evict,
+            )
+        # Journal mode: each mutation appends the touched buckets to
+        # `<data_file>.journal`; the snapshot is rewritten only on compaction.
+        self.journal = bool(journal)
+        self.journal_file = f"{data_file}.journal"
+        self.previous_journal_file = f"{data_file}.journal.prev"
+        self.compact_threshold = max(1, int(compact_threshold))
+        self._journal_records = 0
+        # A journal left behind by a journal-mode session is always replayed;
+        # outside journal mode it is folded into the snapshot and removed so it
+        # can never be replayed over newer data later.
+        self._stale_journal = not self.journal and self._has_journal()
+        self._batch_depth = 0
+        self._batch_paths = []
+        self._batch_full_save = False
+        # Write-behind mode: mutators only mark buckets dirty and a worker
+        # thread persists them, so UI handlers never wait on file I/O.
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        self._pending_paths = []
+        self._pending_full_save = False
+        self._writer = None
+        self._migrated_ids = 0
+        # (section, bucket...) -> (bucket list, {id: position of first match})
+        self._id_index = {}
+        self._occupancy = None
+        self._day_masks = {}
+        # (section, date/week/month) -> [done, total]; filled on first query
+        self._counters = {}
+        self._rollup = None
+        self._rollup_stale = set()
+        self._key_cache = {}
         self.data = self._load_data()
+        self._rebuild_id_index()
+        if self._migrated_ids or self._root_dirty or self._stale_journal:
+            self._persist(())
+        if write_behind:
+            self._writer = _SaveWorker(self, max(0.0, float(debounce_seconds)))
+            atexit.register(self.close)
 
-    def _default_data(self):
-        return {
-            "daily": {},   # Format: "YYYY-MM-DD": [{"id": ..., "content": ..., "done": ..., "category": "todo"}]
-            "weekly": {},  # Format: "YYYY-W##": {"Mon": [], ...}
-            "monthly": {}, # Format: "YYYY-MM": []
-            "memo": "",
-            "timetable_entries": [],  # Format: [{"id": ..., "subject": ..., "day": ..., "start_period": ..., "end_period": ...}]
-            "subject_colors": {},     # Format: {"subject": "#RRGGBB"}
-        }
-
-    def _default_week(self):
-        return {day: [] for day in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]}
+    # --- Ids ---
+    def _new_id(self):
+        # Monotonic per document; persisted with the data as `id_seq`.
+        self.data["id_seq"] = self.data.get("id_seq", 0) + 1
+        return str(self.data["id_seq"])
 
-    def _normalize_hex_color(self, value):
-        if isinstance(value, str):
-            text = value.strip()
-            if len(text) == 7 and text[0] == "#":
-                hex_part = text[1:]
-                if all(ch in "0123456789abcdefABCDEF" for ch in hex_part):
-                    return f"#{hex_part.upper()}"
-        return self.DEFAULT_SUBJECT_COLOR
+    def _encode_snapshot(self, payload):
+        return json.dumps(payload, indent=4, ensure_ascii=False)
 
-    def _normalize_subject_colors(self, raw):
-        if not isinstance(raw, dict):
-            return {}
+    def _write_text_atomic(self, text, create_backup=True):
+        write_text_atomic(self.data_file, text, create_backup=create_backup)
 
-        normalized = {}
-        for subject, color in raw.items():
-            if not isinstance(subject, str):
-                continue
-            subject_name = subject.strip()
-            if not subject_name:
-                continue
-            normalized[subject_name] = self._normalize_hex_color(color)
-        return normalized
-
-    def _normalize_timetable_entries(self, raw):
-        if not isinstance(raw, list):
-            return []
-
-        normalized = []
-        for entry in raw:
-            if not isinstance(entry, dict):
-                continue
+    def _write_json_atomic(self, payload, create_backup=True):
+        self._write_text_atomic(self._encode_snapshot(payload), create_backup=create_backup)
 
-            subject = str(entry.get("subject", "")).strip()
-            day = str(entry.get("day", "")).strip()
-            if not subject or day not in self.VALID_TIMETABLE_DAYS:
+    # --- Journal ---
+    def _read_journal(self, path):
+        records = []
+        if not os.path.exists(path):
+            return records
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn trailing line means the process died mid-append;
+                    # everything before it is intact.
+                    break
+                if isinstance(record, dict) and isinstance(record.get("ops"), list):
+                    records.append(record)
+        return records
+
+    def _apply_journal_record(self, raw, record):
+        for op in record.get("ops", []):
+            if not isinstance(op, list) or len(op) != 2 or not isinstance(op[0], list):
                 continue
-
+            path, value = op
+            if len(path) == 1:
+                raw[path[0]] = value
+            elif len(path) == 2:
+                section = raw.get(path[0])
+                if not isinstance(section, dict):
+                    section = {}
+                    raw[path[0]] = section
+                section[path[1]] = value
+
+    def _has_journal(self):
+        return os.path.exists(self.journal_file) or os.path.exists(self.previous_journal_file)
+
+    def _replay_journal(self, raw, include_previous=False):
+        if not isinstance(raw, dict):
+            raw = {}
+        paths = [self.previous_journal_file, self.journal_file] if include_previous else [self.journal_file]
+        for path in paths:
             try:
-                start_period = int(entry.get("start_period"))
-                end_period = int(entry.get("end_period"))
-            except (TypeError, ValueError):
+                records = self._read_journal(path)
+            except Exception as exc:
+                print(f"Error reading journal file: {exc}")
                 continue
-
-            if start_period < self.MIN_PERIOD or end_period > self.MAX_PERIOD or start_period > end_period:
+            for record in records:
+                self._apply_journal_record(raw, record)
+            if path == self.journal_file:
+                self._journal_records = len(records)
+        return raw
+
+    def _resolve_path(self, path):
+        if len(path) == 1:
+            return self.data.get(path[0])
+        return self.data.get(path[0], {}).get(path[1])
+
+    def _journal_ops(self, paths):
+        return [[list(path), copy_document(self._resolve_path(path))] for path in paths]
+
+    def _encode_journal_record(self, ops):
+        return json.dumps({"ops": ops}, ensure_ascii=False, separators=(",", ":"))
+
+    def _discard_journal(self):
+        for path in (self.journal_file, self.previous_journal_file):
+            if os.path.exists(path):
+                os.remove(path)
+        self._stale_journal = False
+
+    def _append_journal_line(self, line):
+        with open(self.journal_file, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        self._journal_records += 1
+
+    def compact_journal(self):
+        """Fold the journal into the JSON snapshot.
+
+        The snapshot is written with the usual tmp + backup + replace sequence,
+        then the journal is rotated to `.journal.prev` so that the backup file
+        plus both journal generations can still rebuild the latest state.
+        """
+        self._write_out(lambda: ())
+
+    # --- Sharded Layout ---
+    def _root_payload(self):
+        payload = {"layout": "sharded"}
+        payload.update((key, value) for key, value in self.data.items() if key not in SHARDED_SECTIONS)
+        return payload
+
+    def _merge_shards(self, raw):
+        # A sharded root opened with the single-file layout: inline the shards
+        # so the next save writes one self-contained document again.
+        if isinstance(raw, dict) and raw.get("layout") == "sharded" and os.path.isdir(self.shard_dir):
+            raw = dict(raw, **ShardStore(self.shard_dir).read_all())
+            raw.pop("layout", None)
+        return raw
+
+    def _load_sharded(self):
+        raw = None
+        from_backup = False
+        for path in (self.data_file, self.backup_file):
+            if not os.path.exists(path):
                 continue
-
-            entry_id = entry.get("id")
-            if not isinstance(entry_id, str) or not entry_id:
-                entry_id = datetime.datetime.now().isoformat()
-
-            normalized.append(
-                {
-                    "id": entry_id,
-                    "subject": subject,
-                    "day": day,
-                    "start_period": start_period,
-                    "end_period": end_period,
-                }
-            )
-        return normalized
-
-    def _normalize_data(self, raw):
-        default = self._default_data()
+            try:
+                raw = self._load_json_file(path)
+                from_backup = path == self.backup_file
+                break
+            except Exception as exc:
+                print(f"Error loading data file: {exc}")
         if not isinstance(raw, dict):
-            return default
-
-        daily = raw.get("daily")
-        weekly = raw.get("weekly")
-        monthly = raw.get("monthly")
-        memo = raw.get("memo")
-        timetable_entries = raw.get("timetable_entries")
-        subject_colors = raw.get("subject_colors")
-
-        default["daily"] = daily if isinstance(daily, dict) else {}
-        default["weekly"] = weekly if isinstance(weekly, dict) else {}
-        default["monthly"] = monthly if isinstance(monthly, dict) else {}
-        default["memo"] = memo if isinstance(memo, str) else ""
-        default["timetable_entries"] = self._normalize_timetable_entries(timetable_entries)
-        default["subject_colors"] = self._normalize_subject_colors(subject_colors)
-        return default
-
-    def _load_json_file(self, path):
-        with open(path, "r", encoding="utf-8") as file:
-            return json.load(file)
-
-    def _write_json_atomic(self, payload, create_backup=True):
-        tmp_file = f"{self.data_file}.tmp"
-        try:
-            with open(tmp_file, "w", encoding="utf-8") as file:
-                json.dump(payload, file, indent=4, ensure_ascii=False)
-
-            if create_backup and os.path.exists(self.data_file):
-                shutil.copy2(self.data_file, self.backup_file)
-
-            os.replace(tmp_file, self.data_file)
-        except Exception:
-            if os.path.exists(tmp_file):
-                os.remove(tmp_file)
-            raise
+            raw = {}
+
+        if self._has_journal():
+            # Journal left by a single-file journal-mode session: rebuild the
+            # full document, replay it and re-split below.
+            raw = self._replay_journal(self._merge_shards(raw), include_previous=from_backup or not raw)
+
+        if raw.get("layout") != "sharded" and any(section in raw for section in SHARDED_SECTIONS):
+            # Single-file document: split it into monthly shards once. The root
+            # is rewritten afterwards, so a crash in between simply re-splits.
+            legacy = self._normalize_data(raw)
+            self._shards.replace_all(split_sections(legacy))
+            raw = legacy
+            self._root_dirty = True
+
+        data = self._normalize_data({key: value for key, value in raw.items() if key not in SHARDED_SECTIONS})
+        for section in SHARDED_SECTIONS:
+            data[section] = ShardedSection(self._shards, section)
+        return data
+
+    def _on_shard_load(self, name, shard):
+        data = dict(shard, timetable_entries=[], id_seq=self.data.get("id_seq", 0))
+        if self._assign_unique_ids(data):
+            self._shards.mark_dirty(name)
+        if data["id_seq"] != self.data.get("id_seq", 0):
+            self.data["id_seq"] = data["id_seq"]
+            self._root_dirty = True
+
+    def _on_shard_evict(self, name, shard):
+        stale = [key for key in list(self._id_index) if key[0] in SHARDED_SECTIONS and shard_for(key[0], key[1]) == name]
+        for key in stale:
+            del self._id_index[key]
 
     def _load_data(self):
+        if self._shards is not None:
+            return self._load_sharded()
+
         if os.path.exists(self.data_file):
             try:
-                return self._normalize_data(self._load_json_file(self.data_file))
+                raw = self._merge_shards(self._load_json_file(self.data_file))
+                return self._normalize_data(self._replay_journal(raw))
             except Exception as exc:
                 print(f"Error loading data file: {exc}")
 
         if os.path.exists(self.backup_file):
             try:
-                recovered = self._normalize_data(self._load_json_file(self.backup_file))
+                raw = self._merge_shards(self._load_json_file(self.backup_file))
+                raw = self._replay_journal(raw, include_previous=True)
+                recovered = self._normalize_data(raw)
                 self._write_json_atomic(recovered, create_backup=False)
                 print("Recovered data from backup file.")
                 return recovered
             except Exception as exc:
                 print(f"Error loading backup file: {exc}")
 
+        if self._has_journal():
+            return self._normalize_data(self._replay_journal({}, include_previous=True))
         return self._default_data()
 
-    def _save_data(self):
+    def _prepare_write(self, paths):
+        # Runs under `_lock`: only copy what has to reach the disk (down to the
+        # records); encoding and file I/O in `_commit_write` run without it.
+        if self._shards is not None:
+            root_dirty = self._root_dirty or not paths or any(path[0] not in SHARDED_SECTIONS for path in paths)
+            self._root_dirty = False
+            payload = copy_document(self._root_payload()) if root_dirty else None
+            return None, payload, self._shards.copy_dirty()
+        if not self.journal or not paths:
+            return None, copy_document(self.data), ()
+
+        ops = self._journal_ops(paths)
+        payload = None
+        if self._journal_records + 1 >= self.compact_threshold:
+            payload = copy_document(self.data)
+        return ops, payload, ()
+
+    def _commit_write(self, ops, payload, shard_plan=()):
+        # Shards first: the root document never references data that is not
+        # on disk yet.
+        for name, version, shard in shard_plan:
+            self._shards.write(name, self._encode_snapshot(shard))
+            self._shards.mark_saved(name, version)
+        if ops is not None:
+            self._append_journal_line(self._encode_journal_record(ops))
+        if payload is not None:
+            self._write_text_atomic(self._encode_snapshot(payload), create_backup=True)
+            if self.journal:
+                if os.path.exists(self.journal_file):
+                    os.replace(self.journal_file, self.previous_journal_file)
+                self._journal_records = 0
+            elif self._stale_journal:
+                self._discard_journal()
+
+    def _write_out(self, take_paths):
+        # `take_paths` runs under `_lock` and returns the paths to persist, or
+        # None when there is nothing to write.
+        self._lock.acquire()
+        try:
+            paths = take_paths()
+            if paths is None:
+                return
+            plan = self._prepare_write(paths)
+            # Take `_io_lock` before releasing `_lock` so commits reach the
+            # disk in the order they were prepared.
+            self._io_lock.acquire()
+        finally:
+            self._lock.release()
+        try:
+            self._commit_write(*plan)
+        finally:
+            self._io_lock.release()
+
+    def _persist(self, paths):
+        try:
+            self._write_out(lambda: paths)
+        except Exception as exc:
+            print(f"Error saving data: {exc}")
+
+    def _save_data(self, *paths):
+        # `paths` name the buckets a mutation touched, e.g. ("daily", "2026-02-16").
+        # Without them (or outside journal mode) the whole document is rewritten.
+        if self._shards is not None:
+            # Pin touched shards right away so they cannot be evicted unsaved.
+            for path in paths:
+                if path[0] in SHARDED_SECTIONS:
+                    self._shards.mark_dirty(shard_for(path[0], path[1]))
+        if self._batch_depth:
+            self._mark_pending(paths, self._batch_paths, "_batch_full_save")
+            return
+        if self._writer is not None:
+            with self._lock:
+                self._mark_pending(paths, self._pending_paths, "_pending_full_save")
+            self._writer.schedule()
+            return
+        self._persist(paths)
+
+    def _mark_pending(self, paths, pending, full_flag):
+        if not paths:
+            setattr(self, full_flag, True)
+        for path in paths:
+            if path not in pending:
+                pending.append(path)
+
+    def _take_pending(self):
+        if self._pending_full_save:
+            paths = ()
+        elif self._pending_paths:
+            paths = tuple(self._pending_paths)
+        elif self._shards is not None and (self._root_dirty or self._shards.has_dirty()):
+            paths = ()
+        else:
+            return None
+        self._pending_paths = []
+        self._pending_full_save = False
+        return paths
+
+    def flush(self):
+        """Write any mutations still waiting for the write-behind worker."""
         try:
-            self._write_json_atomic(self.data, create_backup=True)
+            self._write_out(self._take_pending)
         except Exception as exc:
             print(f"Error saving data: {exc}")
 
+    def close(self):
+        """Flush pending writes and stop the write-behind worker."""
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.stop()
+            atexit.unregister(self.close)
+        self.flush()
+
+    def _snapshot_state(self):
+        if self._shards is None:
+            return copy.deepcopy(self.data), None
+        root = {key: copy.deepcopy(value) for key, value in self.data.items() if key not in SHARDED_SECTIONS}
+        return root, self._shards.snapshot()
+
+    def _restore_state(self, state):
+        root, shards = state
+        if self._shards is None:
+            self.data = root
+            return
+        self.data.update(root)
+        self._shards.restore(shards)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Apply several mutations and persist them once on exit.
+
+        If the block raises, the in-memory data is rolled back to its state at
+        entry and nothing is written. Nested batches join the outermost one.
+        """
+        with self._lock:
+            if self._batch_depth:
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                return
+
+            snapshot = self._snapshot_state()
+            self._batch_depth = 1
+            self._batch_paths = []
+            self._batch_full_save = False
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth = 0
+                self._restore_state(snapshot)
+                self._rebuild_id_index()
+                raise
+            self._batch_depth = 0
+            if self._batch_full_save:
+                self._save_data()
+            elif self._batch_paths:
+                self._save_data(*self._batch_paths)
+
+    # --- Id Index ---
+    def _bucket(self, key):
+        section = key[0]
+        if section == "timetable_entries":
+            items = self.data.get("timetable_entries")
+        else:
+            items = self.data.get(section, {}).get(key[1])
+            if section == "weekly":
+                items = items.get(key[2]) if isinstance(items, dict) else None
+        return items if isinstance(items, list) else None
+
+    def _iter_bucket_keys(self):
+        for date_str in self.data.get("daily", {}):
+            yield ("daily", date_str)
+        for week_str, week_data in self.data.get("weekly", {}).items():
+            if isinstance(week_data, dict):
+                for day in week_data:
+                    yield ("weekly", week_str, day)
+        for month_str in self.data.get("monthly", {}):
+            yield ("monthly", month_str)
+        yield ("timetable_entries",)
+
+    def _index_items(self, items):
+        positions = {}
+        for position, item in enumerate(items):
+            if isinstance(item, dict):
+                positions.setdefault(item.get("id"), position)
+        return positions
+
+    def _bucket_index(self, key):
+        items = self._bucket(key)
+        if items is None:
+            return None, {}
+        cached = self._id_index.get(key)
+        # A bucket replaced wholesale (normalization, reload) gets re-indexed.
+        if cached is None or cached[0] is not items:
+            cached = (items, self._index_items(items))
+            self._id_index[key] = cached
+        return cached
+
+    def _rebuild_id_index(self):
+        self._id_index = {}
+        self._occupancy = None
+        self._counters = {}
+        self._rollup = None
+        self._key_cache = {}
+        if self._shards is not None:
+            # Sharded buckets are indexed lazily as their shard is touched.
+            return
+        for key in self._iter_bucket_keys():
+            self._bucket_index(key)
+
+    def _find_item(self, key, item_id):
+        items, positions = self._bucket_index(key)
+        position = positions.get(item_id)
+        return None if position is None else items[position]
+
+    def _append_item(self, key, item):
+        items, positions = self._bucket_index(key)
+        positions.setdefault(item.get("id"), len(items))
+        items.append(item)
+
+    def _insert_item(self, key, position, item):
+        items, positions = self._bucket_index(key)
+        items.insert(position, item)
+        # Only the tail shifts; move each id whose first match was pushed right.
+        for index in range(position + 1, len(items)):
+            other_id = items[index].get("id") if isinstance(items[index], dict) else None
+            if positions.get(other_id) == index - 1:
+                positions[other_id] = index
+        item_id = item.get("id")
+        if positions.get(item_id, position + 1) > position:
+            positions[item_id] = position
+
+    def _remove_item(self, key, item_id):
+        items, positions = self._bucket_index(key)
+        removed = False
+        while item_id in positions:
+            position = positions.pop(item_id)
+            del items[position]
+            # Only the tail shifts; re-point ids whose first match moved.
+            for index in range(position, len(items)):
+                other_id = items[index].get("id") if isinstance(items[index], dict) else None
+                if other_id == item_id and item_id not in positions:
+                    positions[item_id] = index
+                elif positions.get(other_id) == index + 1:
+                    positions[other_id] = index
+            removed = True
+        return removed
+
+    def check_id_index(self):
+        """Return a list of id-index inconsistencies (empty when consistent)."""
+        problems = []
+        for key in self._iter_bucket_keys():
+            items = self._bucket(key)
+            cached = self._id_index.get(key)
+            if items is None or cached is None or cached[0] is not items:
+                continue
+            expected = self._index_items(items)
+            if cached[1] != expected:
+                problems.append(f"{key}: indexed {cached[1]!r}, expected {expected!r}")
+        return problems
+
     # --- Daily Operations ---
     def get_daily_tasks(self, date_str):
         # date_str format: "YYYY-MM-DD"
         return self.data.get("daily", {}).get(date_str, [])
 
+    @_synchronized
     def add_daily_task(self, date_str, content, category="todo"):
         daily_map = self.data.setdefault("daily", {})
         if date_str not in daily_map or not isinstance(daily_map[date_str], list):
             daily_map[date_str] = []
+            self._counters.pop(("daily", date_str), None)
+            self._key_cache.pop("daily", None)
 
         new_task = {
-            "id": datetime.datetime.now().isoformat(),
+            "id": self._new_id(),
             "content": content,
             "done": False,
             "category": category,
         }
-        daily_map[date_str].append(new_task)
-        self._save_data()
+        self._append_item(("daily", date_str), new_task)
+        self._adjust_counts("daily", date_str, total=1)
+        self._save_data(("daily", date_str), ("id_seq",))
 
+    def add_daily_tasks_bulk(self, tasks):
+        # tasks: iterable of (date_str, content) or (date_str, content, category)
+        with self.batch():
+            for task in tasks:
+                self.add_daily_task(*task)
+
+    @_synchronized
     def toggle_daily_task(self, date_str, task_id):
-        for task in self.data.get("daily", {}).get(date_str, []):
-            if task.get("id") == task_id:
-                task["done"] = not bool(task.get("done"))
-                self._save_data()
-                return
+        task = self._find_item(("daily", date_str), task_id)
+        if task is not None:
+            task["done"] = not bool(task.get("done"))
+            self._adjust_counts("daily", date_str, done=1 if task["done"] else -1)
+            self._save_data(("daily", date_str))
 
+    @_synchronized
     def delete_daily_task(self, date_str, task_id):
-        daily_map = self.data.get("daily", {})
-        if date_str in daily_map:
-            daily_map[date_str] = [task for task in daily_map[date_str] if task.get("id") != task_id]
-            self._save_data()
+        task = self._find_item(("daily", date_str), task_id)
+        if self._remove_item(("daily", date_str), task_id):
+            self._adjust_counts("daily", date_str, done=-1 if task.get("done") else 0, total=-1)
+            self._save_data(("daily", date_str))
 
     # --- Weekly Operations ---
     def get_weekly_tasks(self, week_str):
@@ -209,50 +677,67 @@ class DataHandler:
                 normalized[day] = week_data[day]
         return normalized
 
+    @_synchronized
     def add_weekly_task(self, week_str, day, content):
         weekly_map = self.data.setdefault("weekly", {})
         if week_str not in weekly_map or not isinstance(weekly_map[week_str], dict):
             weekly_map[week_str] = self._default_week()
+            self._counters.pop(("weekly", week_str), None)
+            self._key_cache.pop("weekly", None)
 
         if day not in weekly_map[week_str] or not isinstance(weekly_map[week_str][day], list):
             weekly_map[week_str][day] = []
+            self._counters.pop(("weekly", week_str), None)
 
         new_task = {
-            "id": datetime.datetime.now().isoformat(),
+            "id": self._new_id(),
             "content": content,
             "done": False,
         }
-        weekly_map[week_str][day].append(new_task)
-        self._save_data()
-
+        self._append_item(("weekly", week_str, day), new_task)
+        if day in self.WEEK_DAYS:
+            self._adjust_counts("weekly", week_str, total=1)
+        self._save_data(("weekly", week_str), ("id_seq",))
+
+    def add_weekly_tasks_bulk(self, week_str, tasks):
+        # tasks: iterable of (day, content)
+        with self.batch():
+            for day, content in tasks:
+                self.add_weekly_task(week_str, day, content)
+
+    @_synchronized
     def delete_weekly_task(self, week_str, day, task_id):
-        weekly_map = self.data.get("weekly", {})
-        if week_str in weekly_map and day in weekly_map[week_str]:
-            weekly_map[week_str][day] = [task for task in weekly_map[week_str][day] if task.get("id") != task_id]
-            self._save_data()
+        task = self._find_item(("weekly", week_str, day), task_id)
+        if self._remove_item(("weekly", week_str, day), task_id):
+            if day in self.WEEK_DAYS:
+                self._adjust_counts("weekly", week_str, done=-1 if task.get("done") else 0, total=-1)
+            self._save_data(("weekly", week_str))
 
+    @_synchronized
     def toggle_weekly_task(self, week_str, day, task_id):
-        weekly_map = self.data.get("weekly", {})
-        if week_str in weekly_map and day in weekly_map[week_str]:
-            for task in weekly_map[week_str][day]:
-                if task.get("id") == task_id:
-                    task["done"] = not bool(task.get("done"))
-                    self._save_data()
-                    return
+        task = self._find_item(("weekly", week_str, day), task_id)
+        if task is not None:
+            task["done"] = not bool(task.get("done"))
+            if day in self.WEEK_DAYS:
+                self._adjust_counts("weekly", week_str, done=1 if task["done"] else -1)
+            self._save_data(("weekly", week_str))
 
     # --- Monthly Operations (Goal Oriented) ---
+    @_synchronized
     def get_monthly_goals(self, month_str):
         # month_str format: "YYYY-MM"
         monthly_map = self.data.setdefault("monthly", {})
         goals = monthly_map.get(month_str, [])
         if isinstance(goals, dict):
             monthly_map[month_str] = []
-            self._save_data()
+            self._counters.pop(("monthly", month_str), None)
+            self._save_data(("monthly", month_str))
             return []
         if not isinstance(goals, list):
             return []
         return goals
 
+    @_synchronized
     def add_monthly_goal(
         self,
         month_str,
@@ -266,9 +751,11 @@ class DataHandler:
         monthly_map = self.data.setdefault("monthly", {})
         if month_str not in monthly_map or isinstance(monthly_map[month_str], dict):
             monthly_map[month_str] = []
+            self._counters.pop(("monthly", month_str), None)
+            self._key_cache.pop("monthly", None)
 
         new_goal = {
-            "id": datetime.datetime.now().isoformat(),
+            "id": self._new_id(),
             "content": content,
             "done": False,
         }
@@ -284,78 +771,288 @@ class DataHandler:
         if isinstance(end, str) and end.strip():
             new_goal["end"] = end.strip()
 
-        monthly_map[month_str].append(new_goal)
-        self._save_data()
+        self._append_item(("monthly", month_str), new_goal)
+        self._adjust_counts("monthly", month_str, total=1)
+        self._save_data(("monthly", month_str), ("id_seq",))
 
+    @_synchronized
     def toggle_monthly_goal(self, month_str, task_id):
-        monthly_map = self.data.get("monthly", {})
-        if month_str in monthly_map:
-            for goal in monthly_map[month_str]:
-                if goal.get("id") == task_id:
-                    goal["done"] = not bool(goal.get("done"))
-                    self._save_data()
-                    return
+        goal = self._find_item(("monthly", month_str), task_id)
+        if goal is not None:
+            goal["done"] = not bool(goal.get("done"))
+            self._adjust_counts("monthly", month_str, done=1 if goal["done"] else -1)
+            self._save_data(("monthly", month_str))
 
+    @_synchronized
     def delete_monthly_goal(self, month_str, task_id):
-        monthly_map = self.data.get("monthly", {})
-        if month_str in monthly_map:
-            monthly_map[month_str] = [goal for goal in monthly_map[month_str] if goal.get("id") != task_id]
-            self._save_data()
+        goal = self._find_item(("monthly", month_str), task_id)
+        if self._remove_item(("monthly", month_str), task_id):
+            self._adjust_counts("monthly", month_str, done=-1 if goal.get("done") else 0, total=-1)
+            self._save_data(("monthly", month_str))
 
     # --- Memo Operations ---
     def get_memo(self):
         return self.data.get("memo", "")
 
+    @_synchronized
     def update_memo(self, text):
         self.data["memo"] = text
-        self._save_data()
+        self._save_data(("memo",))
 
     # --- Dashboard Stats ---
+    # --- Completion Counters ---
+    def _count_bucket(self, section, key):
+        if section == "weekly":
+            buckets = self.get_weekly_tasks(key).values()
+        else:
+            items = self.data.get(section, {}).get(key)
+            buckets = [items if isinstance(items, list) else []]
+        done = total = 0
+        for items in buckets:
+            total += len(items)
+            done += sum(1 for item in items if isinstance(item, dict) and item.get("done"))
+        return [done, total]
+
+    def _counts(self, section, key):
+        counter = self._counters.get((section, key))
+        if counter is None:
+            counter = self._counters[(section, key)] = self._count_bucket(section, key)
+        return counter
+
+    def _adjust_counts(self, section, key, done=0, total=0):
+        # Buckets nobody has asked about yet are counted lazily on first query.
+        counter = self._counters.get((section, key))
+        if counter is not None:
+            counter[0] += done
+            counter[1] += total
+        if section == "daily" and self._rollup is not None:
+            self._rollup_stale.add(key)
+
+    @_synchronized
+    def get_daily_counts(self, date_str):
+        """Return `(done, total)` for a date."""
+        return tuple(self._counts("daily", date_str))
+
+    @_synchronized
+    def get_weekly_counts(self, week_str):
+        """Return `(done, total)` for an ISO week."""
+        return tuple(self._counts("weekly", week_str))
+
+    @_synchronized
+    def get_monthly_counts(self, month_str):
+        """Return `(done, total)` for a month's goals."""
+        return tuple(self._counts("monthly", month_str))
+
     def get_completion_rate(self, date_str):
-        tasks = self.get_daily_tasks(date_str)
-        if not tasks:
-            return 0.0
-        return sum(1 for task in tasks if task.get("done")) / len(tasks)
+        done, total = self.get_daily_counts(date_str)
+        return done / total if total else 0.0
 
     def get_weekly_completion_rate(self, week_str):
-        week_data = self.get_weekly_tasks(week_str)
-        total_tasks = 0
-        done_tasks = 0
-        for tasks in week_data.values():
-            total_tasks += len(tasks)
-            done_tasks += sum(1 for task in tasks if task.get("done"))
-
-        if total_tasks == 0:
-            return 0.0
-        return done_tasks / total_tasks
+        done, total = self.get_weekly_counts(week_str)
+        return done / total if total else 0.0
 
     def get_monthly_completion_rate(self, month_str):
-        goals = self.get_monthly_goals(month_str)
-        if not goals:
-            return 0.0
-        return sum(1 for goal in goals if goal.get("done")) / len(goals)
+        done, total = self.get_monthly_counts(month_str)
+        return done / total if total else 0.0
+
+    # --- Range Analytics ---
+    def _category_counts(self, tasks):
+        counts = {}
+        for task in tasks if isinstance(tasks, list) else []:
+            if not isinstance(task, dict):
+                continue
+            counter = counts.setdefault(str(task.get("category") or "todo"), [0, 0])
+            counter[0] += 1 if task.get("done") else 0
+            counter[1] += 1
+        return counts
+
+    def _daily_rollup(self):
+        """Prefix-sum rollup over the daily history, built once (O(n)) and then
+        patched for the dates touched since the last query."""
+        if self._rollup is None:
+            self._rollup = DailyRollup()
+            self._rollup_stale = set()
+            for date_str, tasks in self.data.get("daily", {}).items():
+                self._rollup.set_day(date_str, self._category_counts(tasks))
+        elif self._rollup_stale:
+            daily_map = self.data.get("daily", {})
+            for date_str in self._rollup_stale:
+                self._rollup.set_day(date_str, self._category_counts(daily_map.get(date_str)))
+            self._rollup_stale = set()
+        return self._rollup
+
+    @_synchronized
+    def get_range_stats(self, start_date, end_date, category=None, weekday=None):
+        """Return `{"done", "total", "rate"}` for daily tasks in `[start_date, end_date]`.
+
+        `category` limits it to one task category, `weekday` (0=Mon..6=Sun) to
+        one day of the week.
+        """
+        done, total = self._daily_rollup().range_counts(start_date, end_date, category, weekday)
+        return {"done": done, "total": total, "rate": done / total if total else 0.0}
+
+    @_synchronized
+    def get_daily_series(self, start_date, end_date, category=None):
+        """Return `[(date_str, done, total)]` for every date in the range."""
+        start, end = parse_date(start_date), parse_date(end_date)
+        if start is None or end is None:
+            return []
+        rollup = self._daily_rollup()
+        series = []
+        for ordinal in range(start.toordinal(), end.toordinal() + 1):
+            day = datetime.date.fromordinal(ordinal)
+            series.append((day.isoformat(), *rollup.day_counts(day, category)))
+        return series
+
+    @_synchronized
+    def get_streak(self, end_date):
+        """Days in a row, ending at `end_date`, with every daily task done."""
+        return self._daily_rollup().current_streak(end_date)
+
+    @_synchronized
+    def get_longest_streak(self, start_date, end_date):
+        return self._daily_rollup().longest_streak(start_date, end_date)
 
     def get_tasks(self):
-        tasks = []
-        for day_tasks in self.data.get("daily", {}).values():
-            if isinstance(day_tasks, list):
-                tasks.extend(day_tasks)
-        return tasks
+        return [task for _, task in self.iter_tasks()]
+
+    # --- Streaming Queries ---
+    def _sorted_keys(self, section):
+        # Bucket keys only ever get added; mutators drop the cache when they do.
+        keys = self._key_cache.get(section)
+        if keys is None:
+            keys = self._key_cache[section] = sorted(self.data.get(section, {}))
+        return keys
+
+    def _iter_bucket_range(self, section, start, end):
+        keys = self._sorted_keys(section)
+        position = bisect.bisect_left(keys, start) if start is not None else 0
+        bucket_map = self.data.get(section, {})
+        for key in itertools.islice(keys, position, None):
+            if end is not None and key > end:
+                return
+            bucket = bucket_map.get(key)
+            if bucket is not None:
+                yield key, bucket
+
+    def _matches(self, item, done, category=None):
+        if not isinstance(item, dict):
+            return False
+        if done is not None and bool(item.get("done")) != bool(done):
+            return False
+        return category is None or item.get("category") == category
+
+    def iter_tasks(self, start=None, end=None, category=None, done=None):
+        """Yield `(date_str, task)` in date order for `start <= date <= end`.
+
+        Keys are walked lazily and the walk stops past `end`; nothing is
+        copied. Do not mutate the store while consuming the iterator.
+        """
+        for date_str, tasks in self._iter_bucket_range("daily", start, end):
+            if isinstance(tasks, list):
+                for task in tasks:
+                    if self._matches(task, done, category):
+                        yield date_str, task
+
+    def iter_weekly_tasks(self, start=None, end=None, done=None):
+        """Yield `(week_str, day, task)` in week order, Mon..Sun within a week."""
+        for week_str, week in self._iter_bucket_range("weekly", start, end):
+            if not isinstance(week, dict):
+                continue
+            for day in self.WEEK_DAYS:
+                tasks = week.get(day)
+                if isinstance(tasks, list):
+                    for task in tasks:
+                        if self._matches(task, done):
+                            yield week_str, day, task
+
+    def iter_monthly_goals(self, start=None, end=None, done=None):
+        """Yield `(month_str, goal)` in month order."""
+        for month_str, goals in self._iter_bucket_range("monthly", start, end):
+            if isinstance(goals, list):
+                for goal in goals:
+                    if self._matches(goal, done):
+                        yield month_str, goal
+
+    # --- Timetable Occupancy ---
+    def _timetable_grid(self):
+        """`{day: [entry id or None per period]}`, built once and then kept in sync.
+
+        `_day_masks` mirrors it as one int per day (bit `period - MIN_PERIOD`
+        set when occupied) so overlap checks are a single `&`.
+        """
+        if self._occupancy is None:
+            periods = self.MAX_PERIOD - self.MIN_PERIOD + 1
+            self._occupancy = {day: [None] * periods for day in self.VALID_TIMETABLE_DAYS}
+            self._day_masks = dict.fromkeys(self.VALID_TIMETABLE_DAYS, 0)
+            for entry in self.data.get("timetable_entries", []):
+                self._mark_cells(entry, entry.get("id"))
+        return self._occupancy
+
+    def _mark_cells(self, entry, entry_id):
+        # Legacy overlaps: the later entry in canonical order owns the cell,
+        # the same precedence the timetable view has always drawn.
+        day = entry.get("day")
+        row = self._occupancy.get(day)
+        if row is None:
+            return
+        mask = self._day_masks[day]
+        for period in range(int(entry.get("start_period", 0)), int(entry.get("end_period", -1)) + 1):
+            index = period - self.MIN_PERIOD
+            row[index] = entry_id
+            mask |= 1 << index
+        self._day_masks[day] = mask
+
+    def _remark_day(self, day):
+        """Rebuild one day's row from the remaining entries.
+
+        Cells a deleted entry shared with a legacy overlapping entry stay
+        occupied by that entry.
+        """
+        row = self._occupancy.get(day)
+        if row is None:
+            return
+        row[:] = [None] * len(row)
+        self._day_masks[day] = 0
+        for entry in self.data.get("timetable_entries", []):
+            if entry.get("day") == day:
+                self._mark_cells(entry, entry.get("id"))
+
+    def _occupied_masks(self):
+        self._timetable_grid()
+        return dict(self._day_masks)
+
+    @_synchronized
+    def get_timetable_grid(self):
+        """Return `{(day, period): entry_id}` for every occupied timetable cell."""
+        return {
+            (day, self.MIN_PERIOD + index): entry_id
+            for day, row in self._timetable_grid().items()
+            for index, entry_id in enumerate(row)
+            if entry_id is not None
+        }
 
     # --- Timetable Operations ---
     def get_timetable_entries(self):
+        # Kept in canonical order by normalization and sorted insertion.
         entries = self.data.get("timetable_entries", [])
         if not isinstance(entries, list):
             return []
-        return sorted(
-            entries,
-            key=lambda item: (
-                self.VALID_TIMETABLE_DAYS.index(item.get("day", "월")) if item.get("day", "월") in self.VALID_TIMETABLE_DAYS else 99,
-                int(item.get("start_period", 0)),
-                int(item.get("end_period", 0)),
-                item.get("subject", ""),
-            ),
-        )
+        return list(entries)
+
+    def get_timetable_entries_for_day(self, day):
+        entries = self.data.get("timetable_entries", [])
+        day_index = self._DAY_INDEX.get(str(day).strip())
+        if not isinstance(entries, list) or day_index is None:
+            return []
+        key = self._timetable_sort_key
+        low = bisect.bisect_left(entries, (day_index,), key=key)
+        high = bisect.bisect_left(entries, (day_index + 1,), key=key)
+        return entries[low:high]
+
+    def count_timetable_entries(self):
+        entries = self.data.get("timetable_entries", [])
+        return len(entries) if isinstance(entries, list) else 0
 
     def get_subject_colors(self):
         colors = self.data.get("subject_colors", {})
@@ -369,40 +1066,17 @@ class DataHandler:
             return self.DEFAULT_SUBJECT_COLOR
         return self.get_subject_colors().get(subject_name, self.DEFAULT_SUBJECT_COLOR)
 
+    @_synchronized
     def add_timetable_entry(self, subject, day, start_period, end_period, color):
-        subject_name = str(subject).strip()
-        day_name = str(day).strip()
-
-        if not subject_name:
-            raise ValueError("과목명을 입력해 주세요.")
-        if day_name not in self.VALID_TIMETABLE_DAYS:
-            raise ValueError("월~토 중에서 요일을 선택해 주세요.")
-
-        try:
-            start = int(start_period)
-            end = int(end_period)
-        except (TypeError, ValueError):
-            raise ValueError("교시는 숫자여야 합니다.")
-
-        if start < self.MIN_PERIOD or end > self.MAX_PERIOD:
-            raise ValueError("교시 범위는 0교시~14교시입니다.")
-        if start > end:
-            raise ValueError("시작 교시는 종료 교시보다 클 수 없습니다.")
+        subject_name, day_name, start, end = self._validate_timetable_slot(subject, day, start_period, end_period)
 
         entries = self.data.setdefault("timetable_entries", [])
         if not isinstance(entries, list):
             entries = []
             self.data["timetable_entries"] = entries
 
-        for entry in entries:
-            if entry.get("day") != day_name:
-                continue
-
-            existing_start = int(entry.get("start_period", -1))
-            existing_end = int(entry.get("end_period", -1))
-            is_overlap = not (end < existing_start or start > existing_end)
-            if is_overlap:
-                raise ValueError("선택한 시간대에 이미 다른 과목이 있습니다.")
+        if self._occupied_masks()[day_name] & self._period_mask(start, end):
+            raise ValueError("선택한 시간대에 이미 다른 과목이 있습니다.")
 
         subject_colors = self.data.setdefault("subject_colors", {})
         if not isinstance(subject_colors, dict):
@@ -416,22 +1090,22 @@ class DataHandler:
             subject_colors[subject_name] = color_value
 
         new_entry = {
-            "id": datetime.datetime.now().isoformat(),
+            "id": self._new_id(),
             "subject": subject_name,
             "day": day_name,
             "start_period": start,
             "end_period": end,
         }
-        entries.append(new_entry)
-        self._save_data()
+        position = bisect.bisect_right(entries, self._timetable_sort_key(new_entry), key=self._timetable_sort_key)
+        self._insert_item(("timetable_entries",), position, new_entry)
+        self._mark_cells(new_entry, new_entry["id"])
+        self._save_data(("timetable_entries",), ("subject_colors",), ("id_seq",))
         return dict(new_entry, color=color_value)
 
+    @_synchronized
     def delete_timetable_entry(self, entry_id):
-        entries = self.data.get("timetable_entries", [])
-        if not isinstance(entries, list):
-            return
-
-        before_count = len(entries)
-        self.data["timetable_entries"] = [entry for entry in entries if entry.get("id") != entry_id]
-        if len(self.data["timetable_entries"]) != before_count:
-            self._save_data()
+        entry = self._find_item(("timetable_entries",), entry_id)
+        if self._remove_item(("timetable_entries",), entry_id):
+            self._timetable_grid()
+            self._remark_day(entry.get("day"))
+            self._save_data(("timetable_entries",))
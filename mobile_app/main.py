@@ -1,5 +1,7 @@
 import flet as ft
 from data_handler import DataHandler
+from view_model import CellGrid, KeyedControls
+import functools
 import traceback
 from pathlib import Path
 import re
@@ -97,6 +99,22 @@ TYPE_HEADLINE_SMALL = 22
 TYPE_HEADLINE_MEDIUM = 24
 
 
+@functools.lru_cache(maxsize=256)
+def text_color_for_background(hex_color: str):
+    # Subject colors come from a small palette; parse each one only once.
+    try:
+        clean = hex_color.strip().lstrip("#")
+        if len(clean) != 6:
+            return TEXT_PRIMARY
+        red = int(clean[0:2], 16)
+        green = int(clean[2:4], 16)
+        blue = int(clean[4:6], 16)
+        luminance = (0.299 * red + 0.587 * green + 0.114 * blue) / 255
+        return TEXT_PRIMARY if luminance >= 0.62 else ON_PRIMARY
+    except Exception:
+        return TEXT_PRIMARY
+
+
 def _build_app(page: ft.Page):
     page.title = "Task Management"
     page.theme_mode = ft.ThemeMode.LIGHT
@@ -118,7 +136,10 @@ def _build_app(page: ft.Page):
         except Exception:
             pass
 
-    db = DataHandler()
+    db = DataHandler(write_behind=True)
+    # Saves run on a background worker; make sure nothing is left behind.
+    page.on_disconnect = lambda e: db.flush()
+    page.on_close = lambda e: db.close()
     timetable_days = ["월", "화", "수", "목", "금", "토"]
     timetable_periods = list(range(0, 15))
     timetable_color_options = [
@@ -141,6 +162,7 @@ def _build_app(page: ft.Page):
     }
 
     desktop_nav = None
+    timetable_grid_parts = None
     page_content = ft.Column(expand=True)
 
     def m3_icon(rounded_name: str, fallback_icon: str) -> str:
@@ -197,37 +219,28 @@ def _build_app(page: ft.Page):
             ),
         )
 
-    def chip_button(label, selected, on_click):
-        return ft.TextButton(
-            label,
-            on_click=on_click,
-            style=ft.ButtonStyle(
-                bgcolor={ft.ControlState.DEFAULT: PRIMARY_PURPLE if selected else SURFACE_SOFT},
-                color={ft.ControlState.DEFAULT: ON_PRIMARY if selected else TEXT_SECONDARY},
-                shape=ft.RoundedRectangleBorder(radius=999),
-                padding={ft.ControlState.DEFAULT: ft.Padding(16, 10, 16, 10)},
-            ),
+    def chip_style(selected):
+        return ft.ButtonStyle(
+            bgcolor={ft.ControlState.DEFAULT: PRIMARY_PURPLE if selected else SURFACE_SOFT},
+            color={ft.ControlState.DEFAULT: ON_PRIMARY if selected else TEXT_SECONDARY},
+            shape=ft.RoundedRectangleBorder(radius=999),
+            padding={ft.ControlState.DEFAULT: ft.Padding(16, 10, 16, 10)},
         )
 
+    def chip_button(label, selected, on_click):
+        return ft.TextButton(label, on_click=on_click, style=chip_style(selected))
+
+    def update_controls(controls):
+        # Send only the patched controls instead of diffing the whole page.
+        for control in controls:
+            control.update()
+
     def format_period_label(period: int):
         if period == 0:
             return "0교시"
         start_hour = 8 + period
         return f"{period}교시\n{start_hour:02d}:00~{start_hour:02d}:50"
 
-    def text_color_for_background(hex_color: str):
-        try:
-            clean = hex_color.strip().lstrip("#")
-            if len(clean) != 6:
-                return TEXT_PRIMARY
-            red = int(clean[0:2], 16)
-            green = int(clean[2:4], 16)
-            blue = int(clean[4:6], 16)
-            luminance = (0.299 * red + 0.587 * green + 0.114 * blue) / 255
-            return TEXT_PRIMARY if luminance >= 0.62 else ON_PRIMARY
-        except Exception:
-            return TEXT_PRIMARY
-
     def _today_tasks():
         return [t for t in db.get_daily_tasks(to_date_str()) if t.get("category") == "todo"]
 
@@ -423,16 +436,18 @@ def _build_app(page: ft.Page):
         )
 
     def build_today_view():
-        nonlocal today_filter
         today_str = to_date_str()
-        tasks = _today_tasks()
 
-        if today_filter == "To do":
-            visible_tasks = [task for task in tasks if not task.get("done")]
-        elif today_filter == "Done":
-            visible_tasks = [task for task in tasks if task.get("done")]
-        else:
-            visible_tasks = tasks
+        def visible_tasks():
+            tasks = _today_tasks()
+            if today_filter == "To do":
+                return [task for task in tasks if not task.get("done")]
+            if today_filter == "Done":
+                return [task for task in tasks if task.get("done")]
+            return tasks
+
+        def refresh_tasks():
+            update_controls(task_cards.sync(visible_tasks()))
 
         def add_today_task(e):
             content = (task_input.value or "").strip()
@@ -442,24 +457,72 @@ def _build_app(page: ft.Page):
                 return
             db.add_daily_task(today_str, content, "todo")
             task_input.value = ""
-            build_today_view()
-            page.update()
+            refresh_tasks()
+            task_input.update()
 
         def toggle_today_task(e, task_id):
             db.toggle_daily_task(today_str, task_id)
-            build_today_view()
-            page.update()
+            refresh_tasks()
 
         def delete_today_task(e, task_id):
             db.delete_daily_task(today_str, task_id)
-            build_today_view()
-            page.update()
+            refresh_tasks()
 
         def set_filter(value):
             nonlocal today_filter
             today_filter = value
-            build_today_view()
-            page.update()
+            changed = []
+            for label, chip in filter_chips.items():
+                selected = label == value
+                if chip.data != selected:
+                    chip.data = selected
+                    chip.style = chip_style(selected)
+                    changed.append(chip)
+            update_controls(changed)
+            refresh_tasks()
+
+        def create_task_card(task):
+            task_id = task.get("id")
+            checkbox = ft.Checkbox(
+                check_color=ON_PRIMARY,
+                active_color=PRIMARY_PURPLE,
+                on_change=lambda e: toggle_today_task(e, task_id),
+                expand=True,
+            )
+            badge_text = ft.Text(size=TYPE_LABEL_MEDIUM)
+            badge = ft.Container(
+                content=badge_text,
+                border_radius=999,
+                padding=ft.Padding(8, 4, 8, 4),
+            )
+            control = card(
+                ft.Row(
+                    [
+                        checkbox,
+                        badge,
+                        ft.IconButton(
+                            icon_delete,
+                            icon_size=18,
+                            icon_color=ERROR_RED,
+                            on_click=lambda e: delete_today_task(e, task_id),
+                        ),
+                    ],
+                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                ),
+                padding=8,
+            )
+            control.data = (checkbox, badge, badge_text)
+            patch_task_card(control, task)
+            return control
+
+        def patch_task_card(control, task):
+            checkbox, badge, badge_text = control.data
+            done = bool(task.get("done"))
+            checkbox.label = task.get("content", "")
+            checkbox.value = done
+            badge_text.value = "Done" if done else "To do"
+            badge_text.color = SUCCESS_GREEN if done else INFO_BLUE
+            badge.bgcolor = BADGE_DONE_BG if done else BADGE_TODO_BG
 
         task_input = ft.TextField(
             hint_text="오늘 할 일 추가",
@@ -498,45 +561,23 @@ def _build_app(page: ft.Page):
                 )
             )
 
-        task_cards = []
-        if visible_tasks:
-            for task in visible_tasks:
-                done = bool(task.get("done"))
-                badge_text = "Done" if done else "To do"
-                badge_bg = BADGE_DONE_BG if done else BADGE_TODO_BG
-                badge_color = SUCCESS_GREEN if done else INFO_BLUE
-                task_cards.append(
-                    card(
-                        ft.Row(
-                            [
-                                ft.Checkbox(
-                                    label=task.get("content", ""),
-                                    value=done,
-                                    check_color=ON_PRIMARY,
-                                    active_color=PRIMARY_PURPLE,
-                                    on_change=lambda e, task_id=task.get("id"): toggle_today_task(e, task_id),
-                                    expand=True,
-                                ),
-                                ft.Container(
-                                    content=ft.Text(badge_text, size=TYPE_LABEL_MEDIUM, color=badge_color),
-                                    bgcolor=badge_bg,
-                                    border_radius=999,
-                                    padding=ft.Padding(8, 4, 8, 4),
-                                ),
-                                ft.IconButton(
-                                    icon_delete,
-                                    icon_size=18,
-                                    icon_color=ERROR_RED,
-                                    on_click=lambda e, task_id=task.get("id"): delete_today_task(e, task_id),
-                                ),
-                            ],
-                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                        ),
-                        padding=8,
-                    )
-                )
-        else:
-            task_cards.append(card(ft.Text("표시할 작업이 없습니다.", color=TEXT_SECONDARY)))
+        filter_chips = {}
+        for label in ["All", "To do", "Done"]:
+            chip = chip_button(label, today_filter == label, lambda e, value=label: set_filter(value))
+            chip.data = today_filter == label
+            filter_chips[label] = chip
+
+        # One persistent card per task id; handlers patch it instead of rebuilding the view.
+        task_column = ft.Column(spacing=12)
+        task_cards = KeyedControls(
+            task_column,
+            key=lambda task: task.get("id"),
+            create=create_task_card,
+            patch=patch_task_card,
+            state=lambda task: (task.get("content", ""), bool(task.get("done"))),
+            empty=lambda: card(ft.Text("표시할 작업이 없습니다.", color=TEXT_SECONDARY)),
+        )
+        task_cards.sync(visible_tasks())
 
         page_content.controls.clear()
         page_content.controls.append(
@@ -551,14 +592,7 @@ def _build_app(page: ft.Page):
                         alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                     ),
                     ft.Row(date_strip_items, alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                    ft.Row(
-                        [
-                            chip_button("All", today_filter == "All", lambda e: set_filter("All")),
-                            chip_button("To do", today_filter == "To do", lambda e: set_filter("To do")),
-                            chip_button("Done", today_filter == "Done", lambda e: set_filter("Done")),
-                        ],
-                        spacing=12,
-                    ),
+                    ft.Row(list(filter_chips.values()), spacing=12),
                     card(
                         ft.Row(
                             [
@@ -570,7 +604,7 @@ def _build_app(page: ft.Page):
                         ),
                         padding=12,
                     ),
-                    ft.Column(task_cards, spacing=12),
+                    task_column,
                 ],
                 expand=True,
                 scroll=ft.ScrollMode.AUTO,
@@ -728,21 +762,31 @@ def _build_app(page: ft.Page):
             )
         )
 
-    def build_timetable_grid(entries, subject_colors):
+    def timetable_cell_states(entries, subject_colors):
+        # Occupancy comes precomputed from the handler; no per-render expansion.
+        entries_by_id = {entry.get("id"): entry for entry in entries}
+        states = {}
+        for (day, period), entry_id in db.get_timetable_grid().items():
+            entry = entries_by_id.get(entry_id)
+            if entry is None:
+                continue
+            subject = entry.get("subject", "")
+            bg_color = subject_colors.get(subject, db.DEFAULT_SUBJECT_COLOR)
+            cell_text = subject if int(entry.get("start_period", period)) == period else ""
+            states[(day, period)] = (bg_color, cell_text, text_color_for_background(bg_color))
+        return states
+
+    def paint_timetable_cell(cell, state):
+        bg_color, cell_text, text_color = state or (SURFACE, "", None)
+        cell.bgcolor = bg_color
+        cell.content.value = cell_text
+        cell.content.color = text_color
+
+    def build_timetable_grid():
         row_height = 54
         header_height = 44
         left_col_width = 76
 
-        day_period_map = {day: {} for day in timetable_days}
-        for entry in entries:
-            day = entry.get("day")
-            if day not in day_period_map:
-                continue
-            start_period = int(entry.get("start_period", 0))
-            end_period = int(entry.get("end_period", 0))
-            for period in range(start_period, end_period + 1):
-                day_period_map[day][period] = entry
-
         header_cells = [
             ft.Container(
                 content=ft.Text("교시", size=TYPE_LABEL_MEDIUM, color=TEXT_SECONDARY, text_align=ft.TextAlign.CENTER),
@@ -767,6 +811,8 @@ def _build_app(page: ft.Page):
             )
 
         rows = [ft.Row(header_cells, spacing=0)]
+        # Cells are created once and repainted in place when entries change.
+        cells = CellGrid(paint_timetable_cell)
 
         for period in timetable_periods:
             left_cell = ft.Container(
@@ -780,46 +826,33 @@ def _build_app(page: ft.Page):
 
             day_cells = []
             for day in timetable_days:
-                entry = day_period_map[day].get(period)
-                if entry:
-                    subject = entry.get("subject", "")
-                    bg_color = subject_colors.get(subject, db.DEFAULT_SUBJECT_COLOR)
-                    text_color = text_color_for_background(bg_color)
-                    show_text = int(entry.get("start_period", period)) == period
-                    cell_text = subject if show_text else ""
-                    content = ft.Text(
-                        cell_text,
-                        size=TYPE_LABEL_SMALL,
-                        color=text_color,
-                        weight=ft.FontWeight.W_600,
-                        max_lines=2,
-                        overflow=ft.TextOverflow.ELLIPSIS,
-                        text_align=ft.TextAlign.CENTER,
-                    )
-                else:
-                    bg_color = SURFACE
-                    content = ft.Text("", size=TYPE_LABEL_SMALL)
-
                 day_cells.append(
-                    ft.Container(
-                        content=content,
-                        expand=True,
-                        height=row_height,
-                        alignment=ft.Alignment(0, 0),
-                        border=ft.border.all(1, BORDER),
-                        bgcolor=bg_color,
-                        padding=4,
+                    cells.add(
+                        (day, period),
+                        ft.Container(
+                            content=ft.Text(
+                                "",
+                                size=TYPE_LABEL_SMALL,
+                                weight=ft.FontWeight.W_600,
+                                max_lines=2,
+                                overflow=ft.TextOverflow.ELLIPSIS,
+                                text_align=ft.TextAlign.CENTER,
+                            ),
+                            expand=True,
+                            height=row_height,
+                            alignment=ft.Alignment(0, 0),
+                            border=ft.border.all(1, BORDER),
+                            bgcolor=SURFACE,
+                            padding=4,
+                        ),
                     )
                 )
 
             rows.append(ft.Row([left_cell, *day_cells], spacing=0))
 
-        return ft.Column(rows, spacing=0)
+        return ft.Column(rows, spacing=0), cells
 
     def build_timetable_view():
-        entries = db.get_timetable_entries()
-        subject_colors = db.get_subject_colors()
-
         subject_input = ft.TextField(label="과목명", width=130, dense=True)
         day_dropdown = ft.Dropdown(
             label="요일",
@@ -878,11 +911,16 @@ def _build_app(page: ft.Page):
             try:
                 db.add_timetable_entry(subject, day, start_period, end_period, selected_color)
             except ValueError as exc:
-                show_snack(str(exc), ERROR_RED)
+                message = str(exc)
+                free_slots = db.find_free_slots(day, end_period - start_period + 1)
+                if free_slots:
+                    slot_start, slot_end = free_slots[0]
+                    message = f"{message} ({day} {slot_start}~{slot_end}교시 가능)"
+                show_snack(message, ERROR_RED)
                 page.update()
                 return
 
-            build_timetable_view()
+            refresh_timetable()
             if had_color and color_map_before.get(subject, "").upper() != selected_color.upper():
                 show_snack("같은 과목은 기존 색상을 유지했습니다.", INFO_BLUE)
             else:
@@ -891,59 +929,79 @@ def _build_app(page: ft.Page):
 
         def delete_timetable_entry_ui(e, entry_id):
             db.delete_timetable_entry(entry_id)
-            build_timetable_view()
+            refresh_timetable()
             show_snack("과목을 삭제했습니다.", INFO_BLUE)
             page.update()
 
-        legend = []
-        for subject_name in sorted(subject_colors):
-            color = subject_colors[subject_name]
-            legend.append(
-                ft.Container(
-                    content=ft.Row(
-                        [
-                            ft.Container(width=12, height=12, bgcolor=color, border_radius=3),
-                            ft.Text(subject_name, size=TYPE_LABEL_MEDIUM, color=TEXT_PRIMARY),
-                        ],
-                        spacing=6,
-                    ),
-                    padding=ft.Padding(8, 6, 8, 6),
-                    bgcolor=SURFACE,
-                    border=ft.border.all(1, BORDER),
-                    border_radius=999,
-                )
+        def refresh_timetable():
+            entries = db.get_timetable_entries()
+            subject_colors = db.get_subject_colors()
+            changed = grid_cells.repaint(timetable_cell_states(entries, subject_colors))
+            changed += legend.sync([(name, subject_colors[name]) for name in sorted(subject_colors)])
+            changed += entry_rows.sync([dict(entry, color=subject_colors.get(entry.get("subject", ""), db.DEFAULT_SUBJECT_COLOR)) for entry in entries])
+            return changed
+
+        def create_legend_chip(item):
+            subject_name, color = item
+            return ft.Container(
+                content=ft.Row(
+                    [
+                        ft.Container(width=12, height=12, bgcolor=color, border_radius=3),
+                        ft.Text(subject_name, size=TYPE_LABEL_MEDIUM, color=TEXT_PRIMARY),
+                    ],
+                    spacing=6,
+                ),
+                padding=ft.Padding(8, 6, 8, 6),
+                bgcolor=SURFACE,
+                border=ft.border.all(1, BORDER),
+                border_radius=999,
             )
 
-        timetable_grid = build_timetable_grid(entries, subject_colors)
-
-        entry_rows = []
-        for entry in entries:
+        def create_entry_row(entry):
+            entry_id = entry.get("id")
             subject = entry.get("subject", "")
             day = entry.get("day", "")
             start_period = entry.get("start_period", 0)
             end_period = entry.get("end_period", 0)
-            color = subject_colors.get(subject, db.DEFAULT_SUBJECT_COLOR)
-            entry_rows.append(
-                card(
-                    ft.Row(
-                        [
-                            ft.Container(width=12, height=12, bgcolor=color, border_radius=2),
-                            ft.Text(f"{subject} | {day} {start_period}~{end_period}교시", expand=True, size=TYPE_BODY_SMALL),
-                            ft.IconButton(
-                                icon_delete,
-                                icon_size=18,
-                                icon_color=ERROR_RED,
-                                on_click=lambda e, entry_id=entry.get("id"): delete_timetable_entry_ui(e, entry_id),
-                            ),
-                        ],
-                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                    padding=8,
-                )
+            return card(
+                ft.Row(
+                    [
+                        ft.Container(width=12, height=12, bgcolor=entry["color"], border_radius=2),
+                        ft.Text(f"{subject} | {day} {start_period}~{end_period}교시", expand=True, size=TYPE_BODY_SMALL),
+                        ft.IconButton(
+                            icon_delete,
+                            icon_size=18,
+                            icon_color=ERROR_RED,
+                            on_click=lambda e: delete_timetable_entry_ui(e, entry_id),
+                        ),
+                    ],
+                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                ),
+                padding=8,
             )
 
-        if not entry_rows:
-            entry_rows.append(card(ft.Text("등록된 과목이 없습니다.", color=TEXT_SECONDARY)))
+        nonlocal timetable_grid_parts
+        if timetable_grid_parts is None:
+            # The grid widget survives tab switches; later renders only repaint cells.
+            timetable_grid_parts = build_timetable_grid()
+        timetable_grid, grid_cells = timetable_grid_parts
+        legend_row = ft.Row(wrap=True, spacing=12)
+        legend = KeyedControls(
+            legend_row,
+            key=lambda item: item[0],
+            create=create_legend_chip,
+            state=lambda item: item[1],
+            empty=lambda: ft.Text("과목 색상 정보가 없습니다.", color=TEXT_SECONDARY),
+        )
+        entry_column = ft.Column(spacing=12)
+        entry_rows = KeyedControls(
+            entry_column,
+            key=lambda entry: entry.get("id"),
+            create=create_entry_row,
+            state=lambda entry: (entry.get("subject"), entry.get("day"), entry.get("start_period"), entry.get("end_period"), entry["color"]),
+            empty=lambda: card(ft.Text("등록된 과목이 없습니다.", color=TEXT_SECONDARY)),
+        )
+        refresh_timetable()
 
         page_content.controls.clear()
         page_content.controls.append(
@@ -971,7 +1029,7 @@ def _build_app(page: ft.Page):
                         ),
                         padding=12,
                     ),
-                    ft.Row(legend, wrap=True, spacing=12) if legend else ft.Text("과목 색상 정보가 없습니다.", color=TEXT_SECONDARY),
+                    legend_row,
                     card(
                         ft.Column(
                             [timetable_grid],
@@ -981,7 +1039,7 @@ def _build_app(page: ft.Page):
                         padding=0,
                     ),
                     ft.Text("등록된 과목", size=TYPE_TITLE_SMALL, weight=ft.FontWeight.BOLD),
-                    ft.Column(entry_rows, spacing=12),
+                    entry_column,
                 ],
                 expand=True,
                 scroll=ft.ScrollMode.AUTO,
@@ -1024,7 +1082,7 @@ def _build_app(page: ft.Page):
             card(
                 ft.Row(
                     [
-                        ft.Column([ft.Text("TimeTable Entries", color=TEXT_SECONDARY), ft.Text(str(len(db.get_timetable_entries())), size=TYPE_HEADLINE_MEDIUM, weight=ft.FontWeight.BOLD)]),
+                        ft.Column([ft.Text("TimeTable Entries", color=TEXT_SECONDARY), ft.Text(str(db.count_timetable_entries()), size=TYPE_HEADLINE_MEDIUM, weight=ft.FontWeight.BOLD)]),
                         ft.Column([ft.Text("Task Count", color=TEXT_SECONDARY), ft.Text(str(len(_today_tasks())), size=TYPE_HEADLINE_MEDIUM, weight=ft.FontWeight.BOLD)]),
                     ],
                     alignment=ft.MainAxisAlignment.SPACE_AROUND,
@@ -1032,6 +1090,66 @@ def _build_app(page: ft.Page):
             )
         )
 
+        # Range rollups come from the handler's prefix sums; no scan of the daily history here.
+        import datetime as _dt
+
+        today_date = _dt.date.fromisoformat(to_date_str())
+        range_rows = []
+        for label, days in [("30 days", 30), ("90 days", 90), ("365 days", 365)]:
+            start = (today_date - _dt.timedelta(days=days - 1)).isoformat()
+            stats = db.get_range_stats(start, today_date.isoformat())
+            range_rows.append(
+                ft.Row(
+                    [
+                        ft.Text(label, size=TYPE_BODY_MEDIUM, color=TEXT_SECONDARY, width=72),
+                        ft.ProgressBar(value=stats["rate"], color=PRIMARY_PURPLE, bgcolor=SURFACE_SOFT, height=8, expand=True),
+                        ft.Text(f"{int(stats['rate'] * 100)}%", size=TYPE_BODY_MEDIUM, weight=ft.FontWeight.BOLD, width=44, text_align=ft.TextAlign.RIGHT),
+                    ],
+                    spacing=12,
+                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                )
+            )
+
+        bar_height = 72
+        trend_bars = []
+        series = db.get_daily_series((today_date - _dt.timedelta(days=13)).isoformat(), today_date.isoformat())
+        for date_str, done, total in series:
+            rate = done / total if total else 0
+            trend_bars.append(
+                ft.Column(
+                    [
+                        ft.Container(
+                            content=ft.Container(height=max(2, int(bar_height * rate)), bgcolor=PRIMARY_PURPLE if total else SURFACE_SOFT, border_radius=4),
+                            height=bar_height,
+                            alignment=ft.Alignment(0, 1),
+                        ),
+                        ft.Text(date_str[-2:], size=TYPE_LABEL_SMALL, color=TEXT_SECONDARY),
+                    ],
+                    spacing=4,
+                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                    expand=True,
+                )
+            )
+
+        rows.append(
+            card(
+                ft.Column(
+                    [
+                        ft.Row(
+                            [
+                                ft.Text("Trend", size=TYPE_TITLE_SMALL, weight=ft.FontWeight.BOLD),
+                                ft.Text(f"Streak {db.get_streak(today_date.isoformat())}d", size=TYPE_BODY_MEDIUM, color=SUCCESS_GREEN, weight=ft.FontWeight.BOLD),
+                            ],
+                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                        ),
+                        ft.Row(trend_bars, spacing=4, vertical_alignment=ft.CrossAxisAlignment.END),
+                        *range_rows,
+                    ],
+                    spacing=12,
+                )
+            )
+        )
+
         page_content.controls.clear()
         page_content.controls.append(
             ft.Column(
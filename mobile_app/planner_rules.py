@@ -0,0 +1,226 @@
+import json
+
+
+class PlannerRules:
+    """Validation, normalization and timetable rules shared by both backends.
+
+    `DataHandler` (JSON) and `SqliteDataHandler` inherit from it, so the two
+    stores accept and reject exactly the same input. Subclasses provide
+    `_lock`, `_migrated_ids` and `_occupied_masks()`.
+    """
+
+    VALID_TIMETABLE_DAYS = ["월", "화", "수", "목", "금", "토"]
+    _DAY_INDEX = {day: index for index, day in enumerate(VALID_TIMETABLE_DAYS)}
+    WEEK_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+    MIN_PERIOD = 0
+    MAX_PERIOD = 14
+    DEFAULT_SUBJECT_COLOR = "#6CAB45"
+
+    # --- Normalization ---
+    def _default_data(self):
+        return {
+            "daily": {},   # Format: "YYYY-MM-DD": [{"id": ..., "content": ..., "done": ..., "category": "todo"}]
+            "weekly": {},  # Format: "YYYY-W##": {"Mon": [], ...}
+            "monthly": {}, # Format: "YYYY-MM": []
+            "memo": "",
+            "timetable_entries": [],  # Format: [{"id": ..., "subject": ..., "day": ..., "start_period": ..., "end_period": ...}]
+            "subject_colors": {},     # Format: {"subject": "#RRGGBB"}
+            "id_seq": 0,              # Last id handed out by `_new_id`
+        }
+
+    def _default_week(self):
+        return {day: [] for day in self.WEEK_DAYS}
+
+    def _normalize_hex_color(self, value):
+        if isinstance(value, str):
+            text = value.strip()
+            if len(text) == 7 and text[0] == "#":
+                hex_part = text[1:]
+                if all(ch in "0123456789abcdefABCDEF" for ch in hex_part):
+                    return f"#{hex_part.upper()}"
+        return self.DEFAULT_SUBJECT_COLOR
+
+    def _normalize_subject_colors(self, raw):
+        if not isinstance(raw, dict):
+            return {}
+
+        normalized = {}
+        for subject, color in raw.items():
+            if not isinstance(subject, str):
+                continue
+            subject_name = subject.strip()
+            if not subject_name:
+                continue
+            normalized[subject_name] = self._normalize_hex_color(color)
+        return normalized
+
+    def _normalize_timetable_entries(self, raw):
+        if not isinstance(raw, list):
+            return []
+
+        normalized = []
+        for entry in raw:
+            if not isinstance(entry, dict):
+                continue
+
+            subject = str(entry.get("subject", "")).strip()
+            day = str(entry.get("day", "")).strip()
+            if not subject or day not in self.VALID_TIMETABLE_DAYS:
+                continue
+
+            try:
+                start_period = int(entry.get("start_period"))
+                end_period = int(entry.get("end_period"))
+            except (TypeError, ValueError):
+                continue
+
+            if start_period < self.MIN_PERIOD or end_period > self.MAX_PERIOD or start_period > end_period:
+                continue
+
+            # Missing ids are filled in by `_assign_unique_ids`.
+            entry_id = entry.get("id")
+
+            normalized.append(
+                {
+                    "id": entry_id,
+                    "subject": subject,
+                    "day": day,
+                    "start_period": start_period,
+                    "end_period": end_period,
+                }
+            )
+        normalized.sort(key=self._timetable_sort_key)
+        return normalized
+
+    def _timetable_sort_key(self, entry):
+        # Canonical order: (day, start, end, subject). Entries are validated on
+        # the way in, so the fields are already ints / known days here.
+        return (
+            self._DAY_INDEX.get(entry.get("day"), len(self._DAY_INDEX)),
+            entry.get("start_period", 0),
+            entry.get("end_period", 0),
+            entry.get("subject", ""),
+        )
+
+    def _normalize_data(self, raw):
+        default = self._default_data()
+        if not isinstance(raw, dict):
+            return default
+
+        daily = raw.get("daily")
+        weekly = raw.get("weekly")
+        monthly = raw.get("monthly")
+        memo = raw.get("memo")
+        timetable_entries = raw.get("timetable_entries")
+        subject_colors = raw.get("subject_colors")
+
+        default["daily"] = daily if isinstance(daily, dict) else {}
+        default["weekly"] = weekly if isinstance(weekly, dict) else {}
+        default["monthly"] = monthly if isinstance(monthly, dict) else {}
+        default["memo"] = memo if isinstance(memo, str) else ""
+        default["timetable_entries"] = self._normalize_timetable_entries(timetable_entries)
+        default["subject_colors"] = self._normalize_subject_colors(subject_colors)
+        id_seq = raw.get("id_seq")
+        default["id_seq"] = id_seq if isinstance(id_seq, int) and id_seq > 0 else 0
+        self._assign_unique_ids(default)
+        return default
+
+    # --- Ids ---
+    def _iter_items(self, data):
+        for tasks in data["daily"].values():
+            if isinstance(tasks, list):
+                yield from (task for task in tasks if isinstance(task, dict))
+        for week_data in data["weekly"].values():
+            if isinstance(week_data, dict):
+                for tasks in week_data.values():
+                    if isinstance(tasks, list):
+                        yield from (task for task in tasks if isinstance(task, dict))
+        for goals in data["monthly"].values():
+            if isinstance(goals, list):
+                yield from (goal for goal in goals if isinstance(goal, dict))
+        yield from data["timetable_entries"]
+
+    def _assign_unique_ids(self, data):
+        """Give every record a unique id, migrating missing or colliding ones.
+
+        Older files used `datetime.now().isoformat()` ids, which collide when
+        records are created in a tight loop. The first occurrence keeps its id;
+        later duplicates get a fresh one from the counter.
+        """
+        id_seq = data["id_seq"]
+        for item in self._iter_items(data):
+            item_id = item.get("id")
+            if isinstance(item_id, str) and item_id.isdigit():
+                id_seq = max(id_seq, int(item_id))
+
+        seen = set()
+        migrated = 0
+        for item in self._iter_items(data):
+            item_id = item.get("id")
+            if not isinstance(item_id, str) or not item_id or item_id in seen:
+                id_seq += 1
+                item_id = str(id_seq)
+                item["id"] = item_id
+                migrated += 1
+            seen.add(item_id)
+
+        data["id_seq"] = id_seq
+        self._migrated_ids += migrated
+        return migrated
+
+    # --- Files ---
+    def _load_json_file(self, path):
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    # --- Timetable Rules ---
+    def _validate_timetable_slot(self, subject, day, start_period, end_period):
+        subject_name = str(subject).strip()
+        day_name = str(day).strip()
+
+        if not subject_name:
+            raise ValueError("과목명을 입력해 주세요.")
+        if day_name not in self.VALID_TIMETABLE_DAYS:
+            raise ValueError("월~토 중에서 요일을 선택해 주세요.")
+
+        try:
+            start = int(start_period)
+            end = int(end_period)
+        except (TypeError, ValueError):
+            raise ValueError("교시는 숫자여야 합니다.")
+
+        if start < self.MIN_PERIOD or end > self.MAX_PERIOD:
+            raise ValueError("교시 범위는 0교시~14교시입니다.")
+        if start > end:
+            raise ValueError("시작 교시는 종료 교시보다 클 수 없습니다.")
+        return subject_name, day_name, start, end
+
+    def _period_mask(self, start, end):
+        return ((1 << (end - start + 1)) - 1) << (start - self.MIN_PERIOD)
+
+    def find_free_slots(self, day, length=1):
+        """Return every `(start, end)` run of `length` free periods on `day`."""
+        day_name = str(day).strip()
+        if day_name not in self.VALID_TIMETABLE_DAYS:
+            raise ValueError("월~토 중에서 요일을 선택해 주세요.")
+        try:
+            length = int(length)
+        except (TypeError, ValueError):
+            raise ValueError("교시는 숫자여야 합니다.")
+        if length < 1:
+            raise ValueError("교시 수는 1 이상이어야 합니다.")
+
+        with self._lock:
+            mask = self._occupied_masks()[day_name]
+        slots = []
+        for start in range(self.MIN_PERIOD, self.MAX_PERIOD - length + 2):
+            if not mask & self._period_mask(start, start + length - 1):
+                slots.append((start, start + length - 1))
+        return slots
+
+    def free_periods_matrix(self):
+        """Return `{day: [is_free for each period MIN_PERIOD..MAX_PERIOD]}`."""
+        periods = range(self.MAX_PERIOD - self.MIN_PERIOD + 1)
+        with self._lock:
+            masks = self._occupied_masks()
+        return {day: [not mask >> index & 1 for index in periods] for day, mask in masks.items()}
@@ -0,0 +1,278 @@
+import collections
+import copy
+import datetime
+import json
+import os
+import re
+import shutil
+import threading
+from collections.abc import MutableMapping
+
+
+SHARDED_SECTIONS = ("daily", "weekly", "monthly")
+MISC_SHARD = "misc"
+
+_MONTH_KEY = re.compile(r"^(\d{4}-\d{2})")
+_WEEK_KEY = re.compile(r"^(\d{4})-W(\d{2})$")
+
+
+def write_text_atomic(path, text, create_backup=True):
+    tmp_file = f"{path}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as file:
+            file.write(text)
+
+        if create_backup and os.path.exists(path):
+            shutil.copy2(path, f"{path}.bak")
+
+        os.replace(tmp_file, path)
+    except Exception:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def copy_document(value):
+    """Copy dicts/lists down to the records, which are copied shallowly.
+
+    Records only hold scalars, so this is enough for a writer to encode the
+    copy while mutators keep changing the original, and far cheaper than
+    `copy.deepcopy` or encoding under a lock.
+    """
+    if isinstance(value, dict):
+        return {key: copy_document(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    return value
+
+
+def shard_for(section, key):
+    """Return the `YYYY-MM` partition a daily/weekly/monthly key belongs to.
+
+    Weeks live in the month of their Monday; keys that do not parse go to a
+    shared `misc` shard.
+    """
+    if section == "weekly":
+        match = _WEEK_KEY.match(str(key))
+        if match:
+            try:
+                monday = datetime.date.fromisocalendar(int(match.group(1)), int(match.group(2)), 1)
+            except ValueError:
+                return MISC_SHARD
+            return monday.strftime("%Y-%m")
+        return MISC_SHARD
+
+    match = _MONTH_KEY.match(str(key))
+    return match.group(1) if match else MISC_SHARD
+
+
+def _empty_shard():
+    return {section: {} for section in SHARDED_SECTIONS}
+
+
+class ShardStore:
+    """One JSON file per month, loaded on first access.
+
+    At most `max_loaded` shards stay in memory; the least recently used clean
+    shard is evicted when another one is loaded. A shard is dirty while its
+    `version` is ahead of the version last written to disk.
+    """
+
+    def __init__(self, directory, max_loaded=4, on_load=None, on_evict=None):
+        self.directory = directory
+        self.max_loaded = max(1, int(max_loaded))
+        self.on_load = on_load
+        self.on_evict = on_evict
+        self._lock = threading.RLock()
+        self._loaded = collections.OrderedDict()  # name -> shard dict
+        self._versions = {}  # name -> [version, saved_version]
+        os.makedirs(directory, exist_ok=True)
+        self._names = set(self._list_names())
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _list_names(self):
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith(".json"):
+                yield file_name[: -len(".json")]
+
+    def names(self):
+        with self._lock:
+            return sorted(self._names)
+
+    def loaded_names(self):
+        with self._lock:
+            return list(self._loaded)
+
+    def _read(self, name):
+        path = self._path(name)
+        for candidate in (path, f"{path}.bak"):
+            if not os.path.exists(candidate):
+                continue
+            try:
+                with open(candidate, "r", encoding="utf-8") as file:
+                    raw = json.load(file)
+            except Exception as exc:
+                print(f"Error loading shard {candidate}: {exc}")
+                continue
+            shard = _empty_shard()
+            if isinstance(raw, dict):
+                for section in SHARDED_SECTIONS:
+                    if isinstance(raw.get(section), dict):
+                        shard[section] = raw[section]
+            return shard
+        return _empty_shard()
+
+    def shard(self, name, create=False):
+        with self._lock:
+            shard = self._loaded.get(name)
+            if shard is not None:
+                self._loaded.move_to_end(name)
+                return shard
+            if name not in self._names:
+                if not create:
+                    return None
+                self._names.add(name)
+                shard = _empty_shard()
+                self._versions[name] = [1, 0]
+            else:
+                shard = self._read(name)
+                self._versions[name] = [0, 0]
+            self._loaded[name] = shard
+            if self.on_load is not None:
+                self.on_load(name, shard)
+            self._evict(keep=name)
+            return shard
+
+    def _evict(self, keep):
+        excess = len(self._loaded) - self.max_loaded
+        for name in list(self._loaded):
+            if excess <= 0:
+                break
+            if name == keep or self.is_dirty(name):
+                continue
+            shard = self._loaded.pop(name)
+            excess -= 1
+            if self.on_evict is not None:
+                self.on_evict(name, shard)
+
+    def is_dirty(self, name):
+        with self._lock:
+            version, saved = self._versions.get(name, (0, 0))
+            return version != saved
+
+    def has_dirty(self):
+        with self._lock:
+            return any(self.is_dirty(name) for name in self._loaded)
+
+    def mark_dirty(self, name):
+        with self._lock:
+            self._versions.setdefault(name, [0, 0])[0] += 1
+
+    def mark_saved(self, name, version):
+        with self._lock:
+            versions = self._versions.get(name)
+            if versions is not None and version > versions[1]:
+                versions[1] = version
+            self._evict(keep=None)
+
+    def copy_dirty(self):
+        """Copy every dirty shard as (name, version, shard) for encoding later."""
+        with self._lock:
+            return [
+                (name, self._versions[name][0], copy_document(self._loaded[name]))
+                for name in self._loaded if self.is_dirty(name)
+            ]
+
+    def write(self, name, text):
+        write_text_atomic(self._path(name), text)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: (copy.deepcopy(shard), list(self._versions[name]))
+                for name, shard in self._loaded.items()
+            }
+
+    def restore(self, snapshot):
+        with self._lock:
+            for name in list(self._loaded):
+                if name not in snapshot:
+                    shard = self._loaded.pop(name)
+                    if self.is_dirty(name):
+                        # Created or modified after the snapshot: forget it.
+                        self._versions[name] = [0, 0]
+                        if not os.path.exists(self._path(name)):
+                            self._names.discard(name)
+                    if self.on_evict is not None:
+                        self.on_evict(name, shard)
+            for name, (shard, versions) in snapshot.items():
+                self._loaded[name] = shard
+                self._versions[name] = versions
+
+    def replace_all(self, shards):
+        """Rewrite the store from `{name: shard}` and drop stale shard files."""
+        with self._lock:
+            for name, shard in shards.items():
+                self.write(name, json.dumps(shard, indent=4, ensure_ascii=False))
+            for name in set(self._names) - set(shards):
+                for path in (self._path(name), f"{self._path(name)}.bak"):
+                    if os.path.exists(path):
+                        os.remove(path)
+            self._names = set(shards)
+            self._loaded.clear()
+            self._versions = {}
+
+    def read_all(self):
+        """Merge every shard into plain section dicts (no caching)."""
+        merged = _empty_shard()
+        for name in self.names():
+            shard = self._read(name)
+            for section in SHARDED_SECTIONS:
+                merged[section].update(shard[section])
+        return merged
+
+
+def split_sections(data):
+    shards = {}
+    for section in SHARDED_SECTIONS:
+        for key, value in data.get(section, {}).items():
+            shards.setdefault(shard_for(section, key), _empty_shard())[section][key] = value
+    return shards
+
+
+class ShardedSection(MutableMapping):
+    """Dict-like view of one section (`daily`, `weekly`, `monthly`) across shards."""
+
+    def __init__(self, store, section):
+        self.store = store
+        self.section = section
+
+    def __getitem__(self, key):
+        shard = self.store.shard(shard_for(self.section, key))
+        if shard is None:
+            raise KeyError(key)
+        return shard[self.section][key]
+
+    def __setitem__(self, key, value):
+        name = shard_for(self.section, key)
+        self.store.shard(name, create=True)[self.section][key] = value
+        self.store.mark_dirty(name)
+
+    def __delitem__(self, key):
+        name = shard_for(self.section, key)
+        shard = self.store.shard(name)
+        if shard is None:
+            raise KeyError(key)
+        del shard[self.section][key]
+        self.store.mark_dirty(name)
+
+    def __iter__(self):
+        for name in self.store.names():
+            shard = self.store.shard(name)
+            if shard is not None:
+                yield from list(shard[self.section])
+
+    def __len__(self):
+        return sum(1 for _ in self)
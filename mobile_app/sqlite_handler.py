@@ -0,0 +1,670 @@
+import contextlib
+import datetime
+import json
+import os
+import sqlite3
+import threading
+
+from analytics import is_perfect_day, longest_run, parse_date
+from data_handler import DATA_FILE
+from planner_rules import PlannerRules
+
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS daily_tasks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    done INTEGER NOT NULL DEFAULT 0,
+    category TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_daily_date ON daily_tasks (date, seq);
+CREATE INDEX IF NOT EXISTS idx_daily_id ON daily_tasks (id);
+CREATE TABLE IF NOT EXISTS weekly_tasks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    week TEXT NOT NULL,
+    day TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    done INTEGER NOT NULL DEFAULT 0,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_weekly_week ON weekly_tasks (week, day, seq);
+CREATE INDEX IF NOT EXISTS idx_weekly_id ON weekly_tasks (id);
+CREATE TABLE IF NOT EXISTS monthly_goals (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    month TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    done INTEGER NOT NULL DEFAULT 0,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_monthly_month ON monthly_goals (month, seq);
+CREATE INDEX IF NOT EXISTS idx_monthly_id ON monthly_goals (id);
+CREATE TABLE IF NOT EXISTS timetable_entries (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    subject TEXT NOT NULL,
+    day TEXT NOT NULL,
+    day_index INTEGER NOT NULL,
+    start_period INTEGER NOT NULL,
+    end_period INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_timetable_day ON timetable_entries (day_index, start_period, end_period, subject);
+CREATE TABLE IF NOT EXISTS subject_colors (
+    subject TEXT PRIMARY KEY,
+    color TEXT NOT NULL
+);
+"""
+
+_DAILY_COLUMNS = ("id", "content", "done", "category")
+_WEEKLY_COLUMNS = ("id", "content", "done")
+_MONTHLY_COLUMNS = ("id", "content", "done")
+
+
+def default_sqlite_file(data_file=DATA_FILE):
+    root, _ = os.path.splitext(data_file)
+    return f"{root}.sqlite3"
+
+
+class SqliteDataHandler(PlannerRules):
+    """SQLite implementation of the `DataHandler` API.
+
+    Tables are indexed by date, ISO week, month and task id, so toggles and
+    deletes are single-row statements instead of a rewrite of the whole
+    document. The database runs in WAL mode. Validation and normalization
+    are shared with the JSON backend through `PlannerRules`.
+    """
+
+    def __init__(self, db_file, import_from=None):
+        self.db_file = db_file
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._migrated_ids = 0
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        if self._get_meta("schema_version") is None:
+            # Marked initialized only together with a successful import, so a
+            # failed import is retried on the next open.
+            with self.batch():
+                if not import_from or self._import_first_readable(import_from):
+                    self._set_meta("schema_version", str(SCHEMA_VERSION))
+
+    @classmethod
+    def for_json_file(cls, data_file=DATA_FILE):
+        """Open the database next to `data_file`, importing it on first use."""
+        return cls(default_sqlite_file(data_file), import_from=data_file)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Run several mutations in one transaction, rolled back on error."""
+        with self._lock:
+            if self._batch_depth:
+                self._batch_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._batch_depth -= 1
+                return
+
+            self._batch_depth = 1
+            try:
+                with self._conn:
+                    yield self
+            finally:
+                self._batch_depth = 0
+
+    def flush(self):
+        # Every mutation commits its own transaction; nothing is buffered.
+        with self._lock:
+            if not self._batch_depth:
+                self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --- Meta ---
+    def _get_meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row["value"]
+
+    def _set_meta(self, key, value):
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _current_id_seq(self):
+        return int(self._get_meta("id_seq") or 0)
+
+    def _new_id(self):
+        # Same counter scheme as the JSON backend; callers hold a batch.
+        id_seq = self._current_id_seq() + 1
+        self._set_meta("id_seq", str(id_seq))
+        return str(id_seq)
+
+    # --- Row conversion ---
+    def _split_extra(self, item, columns):
+        extra = {key: value for key, value in item.items() if key not in columns}
+        return json.dumps(extra, ensure_ascii=False) if extra else None
+
+    def _row_to_item(self, row, columns):
+        item = {}
+        for column in columns:
+            value = row[column]
+            if column == "done":
+                value = bool(value)
+            if column == "category" and value is None:
+                continue
+            item[column] = value
+        if row["extra"]:
+            try:
+                extra = json.loads(row["extra"])
+            except ValueError:
+                extra = {}
+            if isinstance(extra, dict):
+                item.update(extra)
+        return item
+
+    # --- Import ---
+    def import_json_file(self, path):
+        """One-shot import of a `schedule_data.json` document."""
+        data = self._normalize_data(self._load_json_file(path))
+        with self.batch():
+            self._import_data(data)
+            self._set_meta("imported_from", os.path.abspath(path))
+            self._set_meta("id_seq", str(max(data["id_seq"], self._current_id_seq())))
+
+    def _import_first_readable(self, data_file):
+        """Import `data_file`, or its backup when it is unreadable.
+
+        Same recovery order as the JSON backend. Returns False when files
+        exist but none could be read, so the import is retried next time.
+        """
+        paths = [path for path in (data_file, f"{data_file}.bak") if os.path.exists(path)]
+        for path in paths:
+            try:
+                self.import_json_file(path)
+                return True
+            except Exception as exc:
+                print(f"Error importing {path}: {exc}")
+        return not paths
+
+    def _import_data(self, data):
+        for date_str, tasks in data["daily"].items():
+            if not isinstance(tasks, list):
+                continue
+            for task in tasks:
+                if isinstance(task, dict):
+                    self._insert_daily(date_str, task)
+
+        for week_str, week_data in data["weekly"].items():
+            if not isinstance(week_data, dict):
+                continue
+            for day, tasks in week_data.items():
+                if not isinstance(tasks, list):
+                    continue
+                for task in tasks:
+                    if isinstance(task, dict):
+                        self._insert_weekly(week_str, day, task)
+
+        for month_str, goals in data["monthly"].items():
+            if not isinstance(goals, list):
+                continue
+            for goal in goals:
+                if isinstance(goal, dict):
+                    self._insert_monthly(month_str, goal)
+
+        self._set_meta("memo", data["memo"])
+        for entry in data["timetable_entries"]:
+            self._insert_timetable_entry(entry)
+        for subject, color in data["subject_colors"].items():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO subject_colors (subject, color) VALUES (?, ?)",
+                (subject, color),
+            )
+
+    def _insert_daily(self, date_str, task):
+        self._conn.execute(
+            "INSERT INTO daily_tasks (id, date, content, done, category, extra) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                str(task.get("id", "")),
+                date_str,
+                str(task.get("content", "")),
+                int(bool(task.get("done"))),
+                task.get("category"),
+                self._split_extra(task, _DAILY_COLUMNS),
+            ),
+        )
+
+    def _insert_weekly(self, week_str, day, task):
+        self._conn.execute(
+            "INSERT INTO weekly_tasks (id, week, day, content, done, extra) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                str(task.get("id", "")),
+                week_str,
+                day,
+                str(task.get("content", "")),
+                int(bool(task.get("done"))),
+                self._split_extra(task, _WEEKLY_COLUMNS),
+            ),
+        )
+
+    def _insert_monthly(self, month_str, goal):
+        self._conn.execute(
+            "INSERT INTO monthly_goals (id, month, content, done, extra) VALUES (?, ?, ?, ?, ?)",
+            (
+                str(goal.get("id", "")),
+                month_str,
+                str(goal.get("content", "")),
+                int(bool(goal.get("done"))),
+                self._split_extra(goal, _MONTHLY_COLUMNS),
+            ),
+        )
+
+    def _insert_timetable_entry(self, entry):
+        self._conn.execute(
+            "INSERT OR IGNORE INTO timetable_entries (id, subject, day, day_index, start_period, end_period) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                entry["id"],
+                entry["subject"],
+                entry["day"],
+                self.VALID_TIMETABLE_DAYS.index(entry["day"]),
+                entry["start_period"],
+                entry["end_period"],
+            ),
+        )
+
+    # --- Daily Operations ---
+    def get_daily_tasks(self, date_str):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM daily_tasks WHERE date = ? ORDER BY seq", (date_str,)
+            ).fetchall()
+        return [self._row_to_item(row, _DAILY_COLUMNS) for row in rows]
+
+    def add_daily_task(self, date_str, content, category="todo"):
+        with self.batch():
+            new_task = {
+                "id": self._new_id(),
+                "content": content,
+                "done": False,
+                "category": category,
+            }
+            self._insert_daily(date_str, new_task)
+
+    def add_daily_tasks_bulk(self, tasks):
+        # tasks: iterable of (date_str, content) or (date_str, content, category)
+        with self.batch():
+            for task in tasks:
+                self.add_daily_task(*task)
+
+    def toggle_daily_task(self, date_str, task_id):
+        with self.batch():
+            self._conn.execute(
+                "UPDATE daily_tasks SET done = 1 - done WHERE seq = "
+                "(SELECT seq FROM daily_tasks WHERE date = ? AND id = ? ORDER BY seq LIMIT 1)",
+                (date_str, task_id),
+            )
+
+    def delete_daily_task(self, date_str, task_id):
+        with self.batch():
+            self._conn.execute("DELETE FROM daily_tasks WHERE date = ? AND id = ?", (date_str, task_id))
+
+    # --- Weekly Operations ---
+    def get_weekly_tasks(self, week_str):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM weekly_tasks WHERE week = ? ORDER BY seq", (week_str,)
+            ).fetchall()
+        week = self._default_week()
+        for row in rows:
+            week.setdefault(row["day"], []).append(self._row_to_item(row, _WEEKLY_COLUMNS))
+        return week
+
+    def add_weekly_task(self, week_str, day, content):
+        with self.batch():
+            new_task = {
+                "id": self._new_id(),
+                "content": content,
+                "done": False,
+            }
+            self._insert_weekly(week_str, day, new_task)
+
+    def add_weekly_tasks_bulk(self, week_str, tasks):
+        # tasks: iterable of (day, content)
+        with self.batch():
+            for day, content in tasks:
+                self.add_weekly_task(week_str, day, content)
+
+    def delete_weekly_task(self, week_str, day, task_id):
+        with self.batch():
+            self._conn.execute(
+                "DELETE FROM weekly_tasks WHERE week = ? AND day = ? AND id = ?",
+                (week_str, day, task_id),
+            )
+
+    def toggle_weekly_task(self, week_str, day, task_id):
+        with self.batch():
+            self._conn.execute(
+                "UPDATE weekly_tasks SET done = 1 - done WHERE seq = "
+                "(SELECT seq FROM weekly_tasks WHERE week = ? AND day = ? AND id = ? ORDER BY seq LIMIT 1)",
+                (week_str, day, task_id),
+            )
+
+    # --- Monthly Operations (Goal Oriented) ---
+    def get_monthly_goals(self, month_str):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM monthly_goals WHERE month = ? ORDER BY seq", (month_str,)
+            ).fetchall()
+        return [self._row_to_item(row, _MONTHLY_COLUMNS) for row in rows]
+
+    def add_monthly_goal(
+        self,
+        month_str,
+        content,
+        group=None,
+        name=None,
+        description=None,
+        start=None,
+        end=None,
+    ):
+        new_goal = {
+            "content": content,
+            "done": False,
+        }
+
+        if isinstance(group, str) and group.strip():
+            new_goal["group"] = group.strip()
+        if isinstance(name, str) and name.strip():
+            new_goal["name"] = name.strip()
+        if isinstance(description, str) and description.strip():
+            new_goal["description"] = description.strip()
+        if isinstance(start, str) and start.strip():
+            new_goal["start"] = start.strip()
+        if isinstance(end, str) and end.strip():
+            new_goal["end"] = end.strip()
+
+        with self.batch():
+            new_goal = {"id": self._new_id(), **new_goal}
+            self._insert_monthly(month_str, new_goal)
+
+    def toggle_monthly_goal(self, month_str, task_id):
+        with self.batch():
+            self._conn.execute(
+                "UPDATE monthly_goals SET done = 1 - done WHERE seq = "
+                "(SELECT seq FROM monthly_goals WHERE month = ? AND id = ? ORDER BY seq LIMIT 1)",
+                (month_str, task_id),
+            )
+
+    def delete_monthly_goal(self, month_str, task_id):
+        with self.batch():
+            self._conn.execute("DELETE FROM monthly_goals WHERE month = ? AND id = ?", (month_str, task_id))
+
+    # --- Memo Operations ---
+    def get_memo(self):
+        with self._lock:
+            return self._get_meta("memo") or ""
+
+    def update_memo(self, text):
+        with self.batch():
+            self._set_meta("memo", text)
+
+    # --- Dashboard Stats ---
+    def _rate(self, query, params):
+        with self._lock:
+            total, done = self._conn.execute(query, params).fetchone()
+        if not total:
+            return 0.0
+        return (done or 0) / total
+
+    def _counts(self, query, params):
+        with self._lock:
+            total, done = self._conn.execute(query, params).fetchone()
+        return (done or 0, total)
+
+    def get_daily_counts(self, date_str):
+        return self._counts("SELECT COUNT(*), SUM(done) FROM daily_tasks WHERE date = ?", (date_str,))
+
+    def _week_days_clause(self):
+        # The JSON backend only counts the seven known day buckets.
+        return " AND day IN ({})".format(", ".join("?" * len(self.WEEK_DAYS)))
+
+    def get_weekly_counts(self, week_str):
+        return self._counts(
+            "SELECT COUNT(*), SUM(done) FROM weekly_tasks WHERE week = ?" + self._week_days_clause(),
+            (week_str, *self.WEEK_DAYS),
+        )
+
+    def get_monthly_counts(self, month_str):
+        return self._counts("SELECT COUNT(*), SUM(done) FROM monthly_goals WHERE month = ?", (month_str,))
+
+    def get_completion_rate(self, date_str):
+        return self._rate("SELECT COUNT(*), SUM(done) FROM daily_tasks WHERE date = ?", (date_str,))
+
+    def get_weekly_completion_rate(self, week_str):
+        return self._rate(
+            "SELECT COUNT(*), SUM(done) FROM weekly_tasks WHERE week = ?" + self._week_days_clause(),
+            (week_str, *self.WEEK_DAYS),
+        )
+
+    def get_monthly_completion_rate(self, month_str):
+        return self._rate("SELECT COUNT(*), SUM(done) FROM monthly_goals WHERE month = ?", (month_str,))
+
+    # --- Range Analytics ---
+    def _range_query(self, select, start_date, end_date, category=None, weekday=None, group_by=""):
+        start, end = parse_date(start_date), parse_date(end_date)
+        if start is None or end is None:
+            return []
+        query = f"SELECT {select} FROM daily_tasks WHERE date BETWEEN ? AND ?"
+        params = [start.isoformat(), end.isoformat()]
+        if category is not None:
+            query += " AND COALESCE(NULLIF(category, ''), 'todo') = ?"
+            params.append(str(category))
+        if weekday is not None:
+            # SQLite counts weekdays from Sunday.
+            query += " AND CAST(strftime('%w', date) AS INTEGER) = ?"
+            params.append((int(weekday) + 1) % 7)
+        with self._lock:
+            return self._conn.execute(query + group_by, params).fetchall()
+
+    def get_range_stats(self, start_date, end_date, category=None, weekday=None):
+        rows = self._range_query("COUNT(*), SUM(done)", start_date, end_date, category, weekday)
+        total, done = rows[0] if rows else (0, 0)
+        done = done or 0
+        return {"done": done, "total": total, "rate": done / total if total else 0.0}
+
+    def get_daily_series(self, start_date, end_date, category=None):
+        rows = self._range_query(
+            "date, SUM(done), COUNT(*)", start_date, end_date, category, group_by=" GROUP BY date"
+        )
+        by_date = {row[0]: (row[1] or 0, row[2]) for row in rows}
+        start, end = parse_date(start_date), parse_date(end_date)
+        if start is None or end is None:
+            return []
+        series = []
+        for ordinal in range(start.toordinal(), end.toordinal() + 1):
+            date_str = datetime.date.fromordinal(ordinal).isoformat()
+            series.append((date_str, *by_date.get(date_str, (0, 0))))
+        return series
+
+    def get_streak(self, end_date):
+        end = parse_date(end_date)
+        if end is None:
+            return 0
+        with self._lock:
+            first = self._conn.execute("SELECT MIN(date) FROM daily_tasks").fetchone()[0]
+        if first is None or first > end.isoformat():
+            return 0
+        streak = 0
+        for _, done, total in reversed(self.get_daily_series(first, end)):
+            if not is_perfect_day(done, total):
+                break
+            streak += 1
+        return streak
+
+    def get_longest_streak(self, start_date, end_date):
+        return longest_run(is_perfect_day(done, total) for _, done, total in self.get_daily_series(start_date, end_date))
+
+    def get_tasks(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM daily_tasks ORDER BY seq").fetchall()
+        return [self._row_to_item(row, _DAILY_COLUMNS) for row in rows]
+
+    # --- Streaming Queries ---
+    def _iter_rows(self, query, params, batch_size=256):
+        # Rows are fetched in small batches; the lock is only held per batch.
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+    def _range_filter(self, column, start, end, done, category=None):
+        clauses, params = [], []
+        if start is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append(f"{column} <= ?")
+            params.append(end)
+        if done is not None:
+            clauses.append("done = ?")
+            params.append(1 if done else 0)
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def iter_tasks(self, start=None, end=None, category=None, done=None):
+        where, params = self._range_filter("date", start, end, done, category)
+        for row in self._iter_rows(f"SELECT * FROM daily_tasks{where} ORDER BY date, seq", params):
+            yield row["date"], self._row_to_item(row, _DAILY_COLUMNS)
+
+    def iter_weekly_tasks(self, start=None, end=None, done=None):
+        where, params = self._range_filter("week", start, end, done)
+        day_order = " ".join(f"WHEN '{day}' THEN {index}" for index, day in enumerate(self.WEEK_DAYS))
+        query = f"SELECT * FROM weekly_tasks{where} ORDER BY week, CASE day {day_order} ELSE 7 END, seq"
+        for row in self._iter_rows(query, params):
+            if row["day"] in self.WEEK_DAYS:
+                yield row["week"], row["day"], self._row_to_item(row, _WEEKLY_COLUMNS)
+
+    def iter_monthly_goals(self, start=None, end=None, done=None):
+        where, params = self._range_filter("month", start, end, done)
+        for row in self._iter_rows(f"SELECT * FROM monthly_goals{where} ORDER BY month, seq", params):
+            yield row["month"], self._row_to_item(row, _MONTHLY_COLUMNS)
+
+    # --- Timetable Operations ---
+    def _timetable_row_to_entry(self, row):
+        return {
+            "id": row["id"],
+            "subject": row["subject"],
+            "day": row["day"],
+            "start_period": row["start_period"],
+            "end_period": row["end_period"],
+        }
+
+    def get_timetable_entries(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM timetable_entries ORDER BY day_index, start_period, end_period, subject"
+            ).fetchall()
+        return [self._timetable_row_to_entry(row) for row in rows]
+
+    def get_timetable_entries_for_day(self, day):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM timetable_entries WHERE day = ? ORDER BY start_period, end_period, subject",
+                (str(day).strip(),),
+            ).fetchall()
+        return [self._timetable_row_to_entry(row) for row in rows]
+
+    def count_timetable_entries(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM timetable_entries").fetchone()[0]
+
+    def get_timetable_grid(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, day, start_period, end_period FROM timetable_entries "
+                "ORDER BY day_index, start_period, end_period, subject"
+            ).fetchall()
+        grid = {}
+        for row in rows:
+            # Same precedence as the JSON backend: the later entry owns overlapping cells.
+            for period in range(row["start_period"], row["end_period"] + 1):
+                grid[(row["day"], period)] = row["id"]
+        return grid
+
+    def _occupied_masks(self):
+        masks = dict.fromkeys(self.VALID_TIMETABLE_DAYS, 0)
+        for (day, period), _ in self.get_timetable_grid().items():
+            if day in masks:
+                masks[day] |= 1 << (period - self.MIN_PERIOD)
+        return masks
+
+    def get_subject_colors(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT subject, color FROM subject_colors").fetchall()
+        return {row["subject"]: row["color"] for row in rows}
+
+    def get_subject_color(self, subject):
+        subject_name = str(subject).strip()
+        if not subject_name:
+            return self.DEFAULT_SUBJECT_COLOR
+        with self._lock:
+            row = self._conn.execute("SELECT color FROM subject_colors WHERE subject = ?", (subject_name,)).fetchone()
+        return row["color"] if row else self.DEFAULT_SUBJECT_COLOR
+
+    def add_timetable_entry(self, subject, day, start_period, end_period, color):
+        subject_name, day_name, start, end = self._validate_timetable_slot(subject, day, start_period, end_period)
+
+        with self.batch():
+            overlap = self._conn.execute(
+                "SELECT 1 FROM timetable_entries WHERE day = ? AND NOT (? < start_period OR ? > end_period) LIMIT 1",
+                (day_name, end, start),
+            ).fetchone()
+            if overlap:
+                raise ValueError("선택한 시간대에 이미 다른 과목이 있습니다.")
+
+            row = self._conn.execute("SELECT color FROM subject_colors WHERE subject = ?", (subject_name,)).fetchone()
+            if row:
+                color_value = row["color"]
+            else:
+                color_value = self._normalize_hex_color(color)
+                self._conn.execute(
+                    "INSERT INTO subject_colors (subject, color) VALUES (?, ?)",
+                    (subject_name, color_value),
+                )
+
+            new_entry = {
+                "id": self._new_id(),
+                "subject": subject_name,
+                "day": day_name,
+                "start_period": start,
+                "end_period": end,
+            }
+            self._insert_timetable_entry(new_entry)
+        return dict(new_entry, color=color_value)
+
+    def delete_timetable_entry(self, entry_id):
+        with self.batch():
+            self._conn.execute("DELETE FROM timetable_entries WHERE id = ?", (entry_id,))
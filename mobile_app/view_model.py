@@ -0,0 +1,96 @@
+class KeyedControls:
+    """Persistent controls for a keyed list of items inside one container.
+
+    Each key (task id, entry id, subject, ...) owns a single control for the
+    lifetime of the view. `sync()` patches controls whose `state(item)`
+    changed, creates controls for new keys and drops the ones that went away,
+    then returns the controls that actually need `.update()`: the container
+    itself when membership or order changed, otherwise just the patched items.
+    Flet only sends what differs from the last update, so the payload stays
+    proportional to the change instead of the screen.
+    """
+
+    def __init__(self, container, key, create, patch=None, state=None, empty=None):
+        self.container = container
+        self.key = key
+        self.create = create
+        self.patch = patch
+        self.state = state or (lambda item: None)
+        self.empty = empty
+        self._controls = {}
+        self._states = {}
+        self._empty_control = None
+
+    def __len__(self):
+        return len(self._controls)
+
+    def control(self, key):
+        return self._controls.get(key)
+
+    def sync(self, items):
+        previous = list(self.container.controls)
+        ordered = []
+        patched = []
+        seen = set()
+
+        for item in items:
+            key = self.key(item)
+            if key in seen:
+                continue
+            seen.add(key)
+            state = self.state(item)
+            control = self._controls.get(key)
+            if control is None:
+                control = self.create(item)
+                self._controls[key] = control
+            elif state != self._states.get(key):
+                if self.patch is not None:
+                    self.patch(control, item)
+                else:
+                    control = self.create(item)
+                    self._controls[key] = control
+                patched.append(control)
+            self._states[key] = state
+            ordered.append(control)
+
+        for key in [key for key in self._controls if key not in seen]:
+            del self._controls[key]
+            self._states.pop(key, None)
+
+        if not ordered and self.empty is not None:
+            if self._empty_control is None:
+                self._empty_control = self.empty()
+            ordered.append(self._empty_control)
+
+        if len(ordered) != len(previous) or any(a is not b for a, b in zip(ordered, previous)):
+            self.container.controls[:] = ordered
+            return [self.container]
+        return patched
+
+
+class CellGrid:
+    """Fixed set of cells (e.g. one per timetable day/period) repainted in place.
+
+    `repaint(states)` calls `paint(control, state)` only for cells whose state
+    differs from the last paint and returns those cells.
+    """
+
+    def __init__(self, paint):
+        self.paint = paint
+        self.cells = {}
+        self._states = {}
+
+    def add(self, key, control, state=None):
+        self.cells[key] = control
+        self._states[key] = state
+        return control
+
+    def repaint(self, states, default=None):
+        changed = []
+        for key, control in self.cells.items():
+            state = states.get(key, default)
+            if state != self._states.get(key):
+                self.paint(control, state)
+                self._states[key] = state
+                changed.append(control)
+        return changed
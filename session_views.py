@@ -0,0 +1,112 @@
+import datetime
+from collections import namedtuple
+
+from time_log import TimeLog, to_interval
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+# ---------------------------------------------------------
+# 세션 컬렉션(ColumnTable)의 타입 변환된 열과 합계
+# 데이터가 바뀔 때(version 변경) 한 번만 계산하고, 화면은 결과 튜플만 순회
+# ---------------------------------------------------------
+TimeLogRow = namedtuple("TimeLogRow", "id day start end activity category start_min end_min")
+StudyRow = namedtuple("StudyRow", "id name done total pct")
+ProjectRow = namedtuple("ProjectRow", "id subject task deadline done total pct")
+
+TimeLogView = namedtuple("TimeLogView", "rows log")
+ProgressView = namedtuple("ProgressView", "rows done total")
+
+
+def parse_minutes(value):
+    """'HH:MM' -> 자정 이후 분. 형식이 틀리면 None"""
+    try:
+        hour, minute = (int(part) for part in str(value).split(":"))
+    except ValueError:
+        return None
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return None
+    return hour * 60 + minute
+
+
+def parse_day(value, default=None):
+    """'YYYY-MM-DD' -> date. 없거나 형식이 틀리면 default"""
+    try:
+        return datetime.date.fromisoformat(str(value))
+    except ValueError:
+        return default
+
+
+def to_int(value, default=0):
+    """JSON/입력값(bool, float, 문자열, NaN)을 int 로"""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def percentages(done, total):
+    """행별 진행률(%) 리스트 (total <= 0 이면 0)"""
+    if np is not None and done:
+        done_arr = np.asarray(done, dtype=np.int64)
+        total_arr = np.asarray(total, dtype=np.int64)
+        return np.where(total_arr > 0, done_arr * 100 // np.maximum(total_arr, 1), 0).tolist()
+    return [d * 100 // t if t > 0 else 0 for d, t in zip(done, total)]
+
+
+# --- 데일리 시간 기록 ---
+def _build_time_log_view(table, default_day):
+    days = [parse_day(value, default_day) for value in table.column("Date")]
+    starts = [parse_minutes(value) for value in table.column("StartTime")]
+    ends = [parse_minutes(value) for value in table.column("EndTime")]
+    categories = table.column("Category")
+    rows = [
+        TimeLogRow(*values)
+        for values in zip(table.ids(), days, table.column("StartTime"), table.column("EndTime"),
+                          table.column("Activity"), categories, starts, ends)
+    ]
+    intervals = []
+    for day, start, end, category in zip(days, starts, ends, categories):
+        interval = to_interval(day, start, end)
+        if interval is not None:
+            intervals.append(interval + (category,))
+    return TimeLogView(rows, TimeLog(intervals))
+
+
+def time_log_view(table, today=None):
+    """날짜(Date)가 없는 예전 기록은 오늘 기록으로 취급"""
+    today = today or datetime.date.today()
+    return table.memo(("time_log_view", today), lambda t: _build_time_log_view(t, today))
+
+
+# --- 스터디 / 프로젝트 진행률 ---
+def _build_study_view(table):
+    done = [to_int(value) for value in table.column("Done", 0)]
+    total = [to_int(value) for value in table.column("Total", 0)]
+    rows = [
+        StudyRow(*values)
+        for values in zip(table.ids(), table.column("Name"), done, total, percentages(done, total))
+    ]
+    return ProgressView(rows, sum(done), sum(total))
+
+
+def study_view(table):
+    return table.memo("study_view", _build_study_view)
+
+
+def _build_project_view(table):
+    done = [to_int(value) for value in table.column("Done", 0)]
+    total = [to_int(value, 1) for value in table.column("Total", 1)]
+    rows = [
+        ProjectRow(*values)
+        for values in zip(table.ids(), table.column("Subject"), table.column("Task"),
+                          table.column("Deadline"), done, total, percentages(done, total))
+    ]
+    return ProgressView(rows, sum(done), sum(total))
+
+
+def project_view(table):
+    return table.memo("project_view", _build_project_view)
@@ -0,0 +1,65 @@
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "mobile_app"))
+
+from analytics import DailyRollup
+from data_handler import DataHandler
+
+
+def test_rollup_range_queries_stay_correct_after_incremental_updates():
+    rollup = DailyRollup()
+    rollup.set_day("2026-02-10", {"todo": (1, 2)})
+    rollup.set_day("2026-02-12", {"todo": (2, 2), "study": (0, 1)})
+    assert rollup.range_counts("2026-02-01", "2026-02-28") == (3, 5)
+
+    # Query first so the prefix arrays exist, then mutate and extend both ends.
+    assert rollup.range_counts("2026-02-11", "2026-02-12", category="study") == (0, 1)
+    rollup.set_day("2026-02-12", {"todo": (2, 2), "study": (1, 1)})
+    rollup.set_day("2026-02-20", {"work": (1, 1)})
+    rollup.set_day("2026-02-01", {"todo": (0, 3)})
+
+    assert rollup.range_counts("2026-02-11", "2026-02-12", category="study") == (1, 1)
+    assert rollup.range_counts("2026-02-01", "2026-02-28") == (5, 9)
+    assert rollup.range_counts("2026-02-12", "2026-02-20") == (4, 4)
+    # 2026-02-10 and 2026-02-17 are Tuesdays.
+    assert rollup.range_counts("2026-02-01", "2026-02-28", weekday=1) == (1, 2)
+    assert rollup.day_counts("2026-02-15") == (0, 0)
+
+
+def test_streaks_count_consecutive_fully_done_days():
+    rollup = DailyRollup()
+    for day in range(1, 6):
+        rollup.set_day(f"2026-03-0{day}", {"todo": (1, 1)})
+    rollup.set_day("2026-03-03", {"todo": (0, 1)})
+
+    assert rollup.current_streak("2026-03-05") == 2
+    assert rollup.current_streak("2026-03-06") == 0
+    assert rollup.longest_streak("2026-03-01", "2026-03-05") == 2
+    assert rollup.longest_streak("2026-03-02", "2026-03-02") == 1
+
+
+def test_data_handler_range_api_follows_mutations(tmp_path):
+    handler = DataHandler(data_file=str(tmp_path / "schedule_data.json"))
+    handler.add_daily_tasks_bulk(
+        [("2026-02-14", "A"), ("2026-02-15", "B"), ("2026-02-16", "C", "study"), ("2026-02-16", "D")]
+    )
+    assert handler.get_range_stats("2026-02-01", "2026-02-28") == {"done": 0, "total": 4, "rate": 0.0}
+
+    for date_str in ["2026-02-15", "2026-02-16"]:
+        for task in handler.get_daily_tasks(date_str):
+            handler.toggle_daily_task(date_str, task["id"])
+    handler.delete_daily_task("2026-02-14", handler.get_daily_tasks("2026-02-14")[0]["id"])
+
+    assert handler.get_range_stats("2026-02-01", "2026-02-28")["rate"] == 1.0
+    assert handler.get_range_stats("2026-02-01", "2026-02-28", category="study")["total"] == 1
+    assert handler.get_range_stats("2026-02-01", "2026-02-28", weekday=0)["total"] == 2
+    assert handler.get_daily_series("2026-02-14", "2026-02-16") == [
+        ("2026-02-14", 0, 0),
+        ("2026-02-15", 1, 1),
+        ("2026-02-16", 2, 2),
+    ]
+    assert handler.get_streak("2026-02-16") == 2
+    assert handler.get_longest_streak("2026-02-01", "2026-02-28") == 2
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+
+import pytest
+
+
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+import streamlit as st  # noqa: E402
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(ROOT))
+    st.cache_resource.clear()  # 공유 저장소는 프로세스 전체에서 하나 -> 테스트마다 새로
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+    at.run()
+    assert not at.exception
+    return at
+
+
+def test_habit_check_in_saves_and_redraws_only_the_habit_data(app, tmp_path):
+    loads = app.session_state["loads"]
+    dashboard = app.session_state["dashboard"]
+    before = dict(dashboard.cache)
+
+    app.button(key="h_check_0").click().run()
+    assert not app.exception
+
+    # 변경된 컬렉션만 저장, 세션 뷰는 다시 읽지 않음
+    saved = json.loads((tmp_path / "data.json").read_text(encoding="utf-8"))
+    assert list(saved) == ["habit_logs"]
+    assert app.session_state["loads"] == loads
+    assert dashboard.revisions == {"habit_logs": 1}
+
+    # 습관 카드만 다시 계산, 나머지 카드는 이전 결과 그대로
+    after = dashboard.cache
+    changed = {card for card in before if after[card] != before[card]}
+    assert changed == {"habit"}
+    assert after["habit"][1][0] == before["habit"][1][0] + 1
+
+
+def test_stale_session_reloads_and_reruns_the_whole_app(app, tmp_path):
+    other = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+    other.run()
+    other.button(key="h_check_0").click().run()
+    assert not other.exception
+
+    loads = app.session_state["loads"]
+    app.button(key="h_check_0").click().run()
+    assert not app.exception
+    # 다른 세션이 같은 항목을 먼저 저장 -> 덮어쓰지 않고 다시 읽음
+    assert app.session_state["loads"] > loads
+    assert any("다른 탭" in warning.value for warning in app.warning)
+    saved = json.loads((tmp_path / "data.json").read_text(encoding="utf-8"))
+    assert saved["habit_logs"] == other.session_state["habit_logs"].to_json()
+
+
+def test_pie_figures_are_built_once_per_counts_and_theme(tmp_path, monkeypatch):
+    go = pytest.importorskip("plotly.graph_objects")
+    built = []
+    pie = go.Pie
+
+    def counting_pie(*args, **kwargs):
+        built.append(list(kwargs["values"]))
+        return pie(*args, **kwargs)
+
+    monkeypatch.setattr(go, "Pie", counting_pie)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(ROOT))
+    st.cache_resource.clear()
+    app = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+    app.run()
+    first = len(built)
+    assert first == len(set(map(tuple, built)))
+
+    # 다시 실행 (변경 없음), 새 세션 -> 같은 조합은 모두 캐시 적중
+    app.run()
+    AppTest.from_file(str(ROOT / "app.py"), default_timeout=60).run()
+    assert len(built) == first
+
+    # 체크인 -> 습관 카드의 새 조합만 (이미 있던 조합이면 없음)
+    app.button(key="h_check_0").click().run()
+    assert not app.exception
+    done, total, _ = app.session_state["dashboard"].cache["habit"][1]
+    assert built[first:] in ([], [[done, total - done]])
@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import columnar  # noqa: E402
+from columnar import ColumnTable  # noqa: E402
+
+
+def test_row_ids_stay_stable_across_deletes():
+    table = ColumnTable.from_records([{"Goal": "a", "Done": False}, {"Goal": "b", "Done": True}], ("Goal", "Done"))
+    third = table.append({"Goal": "c", "Done": False})
+    assert table.ids() == [0, 1, third]
+
+    table.delete(0)
+    assert table.ids() == [1, 2]
+    assert table.get(third, "Goal") == "c"
+    assert table.column("Done") == [True, False]
+    assert [row_id for row_id, _ in table.items()] == [1, 2]
+    assert table.append({"Goal": "d"}) == 3
+    assert table.row(3) == {"Goal": "d", "Done": None}
+
+
+def test_tombstones_are_compacted_without_renumbering(monkeypatch):
+    monkeypatch.setattr(columnar, "COMPACT_MIN_DEAD", 2)
+    table = ColumnTable(("Name",), [{"Name": str(index)} for index in range(4)])
+
+    table.delete(1)
+    assert table._dead == 1
+    table.delete(2)
+    assert table._dead == 0 and len(table._ids) == 2
+    assert table.ids() == [0, 3]
+    table.set(3, "Name", "x")
+    assert table.to_records() == [{"Name": "0", "_id": 0}, {"Name": "x", "_id": 3}]
+
+
+def test_version_tracks_changes_and_unknown_columns_are_added():
+    table = ColumnTable(("Name",))
+    assert table.to_records() == [] and table.columns == ["Name"]
+    before = table.version
+    row_id = table.append({"Name": "a", "Icon": "✅"})
+    assert table.version > before
+    assert table.columns == ["Name", "Icon"]
+    assert table.column("Target", 7) == [7]
+    with pytest.raises(KeyError):
+        table.delete(row_id + 1)
+
+
+def test_row_ids_survive_a_save_and_reload():
+    table = ColumnTable(("Name",), [{"Name": name} for name in "abcd"])
+    table.delete(1)
+    reloaded = ColumnTable.from_records(table.to_records(), ("Name",))
+
+    assert reloaded.ids() == [0, 2, 3]
+    assert reloaded.get(2, "Name") == "c"
+    assert reloaded.columns == ["Name"]
+    assert reloaded.append({"Name": "e"}) == 4
+
+
+def test_legacy_records_without_ids_get_fresh_ones():
+    table = ColumnTable.from_records([{"Name": "a", "_id": 5}, {"Name": "b"}, {"Name": "c", "_id": 5}], ("Name",))
+    assert table.ids() == [5, 6, 7]
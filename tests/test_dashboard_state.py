@@ -0,0 +1,92 @@
+import datetime
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from dashboard_state import CARD_DEPENDENCIES, DashboardState  # noqa: E402
+
+
+DAY = datetime.date(2026, 3, 4)
+
+
+def test_commit_marks_only_dependent_cards_and_reruns_the_fragment():
+    state = DashboardState()
+    saved = []
+
+    assert state.commit(("habit_logs",), lambda: saved.append("habit_logs") or True) == "fragment"
+    assert saved == ["habit_logs"]
+    assert state.take_dirty() == {"habit"}
+    assert state.take_dirty() == set()
+
+    state.commit(("habits", "habit_logs"), lambda: True)
+    state.commit(("weekly_tasks",), lambda: True)
+    assert state.take_dirty() == {"habit", "weekly"}
+    assert state.revisions == {"habit_logs": 2, "habits": 1, "weekly_tasks": 1}
+
+
+def test_failed_or_reloaded_save_reruns_the_whole_app():
+    state = DashboardState()
+    assert state.commit(("monthly_goals",), lambda: False) == "app"
+    # 다시 읽은 데이터로 전체 실행 때 모든 카드를 그리므로 갱신 대상/변경 번호 없음
+    assert state.take_dirty() == set()
+    assert state.revisions == {}
+
+
+def test_every_collection_invalidates_exactly_its_cards():
+    state = DashboardState()
+    for card, deps in CARD_DEPENDENCIES.items():
+        for name in deps:
+            assert state.cards_for([name]) == {card}
+    assert state.cards_for(["daily_memo"]) == set()
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+def test_card_values_are_reused_until_a_dependency_changes():
+    state = DashboardState()
+    habit, weekly = Counter(), Counter()
+    assert state.values("habit", habit, "dark", DAY) == 1
+    assert state.values("weekly", weekly, "dark", DAY) == 1
+
+    # 변경 없음, 다른 카드의 컬렉션만 변경 -> 캐시 재사용
+    state.commit(("weekly_tasks",), lambda: True)
+    fingerprint = state.fingerprint("habit", "dark", DAY)
+    assert state.values("habit", habit, "dark", DAY) == 1
+    assert (state.hits, state.misses, habit.calls) == (1, 2, 1)
+    assert state.values("weekly", weekly, "dark", DAY) == 2
+
+    # 의존 컬렉션 commit -> 지문이 바뀌고 다시 계산
+    state.commit(("habit_logs",), lambda: True)
+    assert state.fingerprint("habit", "dark", DAY) != fingerprint
+    assert state.values("habit", habit, "dark", DAY) == 2
+    assert state.values("habit", habit, "dark", DAY) == 2
+    assert habit.calls == 2
+
+    # 저장 실패는 변경으로 보지 않음
+    state.commit(("habit_logs",), lambda: False)
+    assert state.values("habit", habit, "dark", DAY) == 2
+
+
+def test_theme_day_and_reload_invalidate_card_values():
+    state = DashboardState()
+    habit, weekly = Counter(), Counter()
+    state.values("habit", habit, "dark", DAY)
+    state.values("weekly", weekly, "dark", DAY)
+
+    assert state.values("habit", habit, "light", DAY) == 2
+    # 오늘 기준 카드만 날짜가 바뀌면 다시 계산
+    assert state.values("habit", habit, "light", DAY + datetime.timedelta(days=1)) == 3
+    assert state.values("weekly", weekly, "dark", DAY + datetime.timedelta(days=1)) == 1
+
+    state.reset()
+    assert state.values("weekly", weekly, "dark", DAY) == 2
@@ -1,4 +1,6 @@
+import json
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -7,6 +9,7 @@ import pytest
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "mobile_app"))
 
+import data_handler
 from data_handler import DataHandler
 
 
@@ -74,3 +77,454 @@ def test_delete_timetable_entry_removes_entry(tmp_path):
     handler.delete_timetable_entry(created["id"])
 
     assert handler.get_timetable_entries() == []
+
+
+def test_legacy_overlaps_keep_their_cells_after_a_delete(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    data_file.write_text(json.dumps({"timetable_entries": [
+        {"id": "1", "subject": "A", "day": "월", "start_period": 1, "end_period": 3},
+        {"id": "2", "subject": "B", "day": "월", "start_period": 2, "end_period": 4},
+    ]}), encoding="utf-8")
+    handler = DataHandler(data_file=str(data_file))
+
+    # The later entry in canonical order owns shared cells.
+    assert handler.get_timetable_grid() == {("월", 1): "1", ("월", 2): "2", ("월", 3): "2", ("월", 4): "2"}
+
+    handler.delete_timetable_entry("2")
+    assert handler.get_timetable_grid() == {("월", 1): "1", ("월", 2): "1", ("월", 3): "1"}
+    assert handler.find_free_slots("월", 1)[:3] == [(0, 0), (4, 4), (5, 5)]
+
+
+def test_journal_mode_appends_instead_of_rewriting_snapshot(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), journal=True)
+    handler.add_daily_task("2026-02-16", "Task A")
+    handler.update_memo("memo")
+
+    assert not data_file.exists()
+    assert len((tmp_path / "schedule_data.json.journal").read_text(encoding="utf-8").splitlines()) == 2
+
+    reopened = DataHandler(data_file=str(data_file), journal=True)
+    assert [task["content"] for task in reopened.get_daily_tasks("2026-02-16")] == ["Task A"]
+    assert reopened.get_memo() == "memo"
+
+
+def test_journal_compaction_folds_records_into_snapshot(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), journal=True, compact_threshold=3)
+    for index in range(4):
+        handler.add_daily_task("2026-02-16", f"Task {index}")
+
+    assert data_file.exists()
+    assert len((tmp_path / "schedule_data.json.journal").read_text(encoding="utf-8").splitlines()) == 1
+
+    reopened = DataHandler(data_file=str(data_file), journal=True)
+    assert len(reopened.get_daily_tasks("2026-02-16")) == 4
+
+
+def test_journal_ignores_torn_trailing_record(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), journal=True)
+    handler.add_daily_task("2026-02-16", "Task A")
+
+    with open(tmp_path / "schedule_data.json.journal", "a", encoding="utf-8") as file:
+        file.write('{"ops": [[["daily", "2026-02-17"], [')
+
+    reopened = DataHandler(data_file=str(data_file), journal=True)
+    assert len(reopened.get_daily_tasks("2026-02-16")) == 1
+    assert reopened.get_daily_tasks("2026-02-17") == []
+
+
+def test_journal_recovers_from_backup_and_both_generations(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), journal=True, compact_threshold=2)
+    for index in range(5):
+        handler.add_daily_task("2026-02-16", f"Task {index}")
+
+    data_file.write_text("{broken json", encoding="utf-8")
+
+    recovered = DataHandler(data_file=str(data_file), journal=True)
+    assert len(recovered.get_daily_tasks("2026-02-16")) == 5
+
+
+def test_journal_is_folded_when_reopened_without_journal_mode(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    journal_file = tmp_path / "schedule_data.json.journal"
+    handler = DataHandler(data_file=str(data_file), journal=True)
+    handler.add_daily_task("2026-02-16", "Task A")
+
+    plain = DataHandler(data_file=str(data_file))
+    assert [task["content"] for task in plain.get_daily_tasks("2026-02-16")] == ["Task A"]
+    assert not journal_file.exists()
+    plain.add_daily_task("2026-02-16", "Task B")
+    plain.update_memo("newer")
+
+    reopened = DataHandler(data_file=str(data_file), journal=True)
+    assert [task["content"] for task in reopened.get_daily_tasks("2026-02-16")] == ["Task A", "Task B"]
+    assert reopened.get_memo() == "newer"
+
+
+def test_sharded_layout_replays_a_leftover_journal(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), journal=True)
+    handler.add_daily_task("2026-02-16", "Task A")
+
+    sharded = DataHandler(data_file=str(data_file), layout="sharded")
+    assert [task["content"] for task in sharded.get_daily_tasks("2026-02-16")] == ["Task A"]
+    assert not (tmp_path / "schedule_data.json.journal").exists()
+
+
+def test_id_index_tracks_toggles_and_deletes(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file))
+    target_day = "2026-02-16"
+    for index in range(5):
+        handler.add_daily_task(target_day, f"Task {index}")
+    ids = [task["id"] for task in handler.get_daily_tasks(target_day)]
+
+    handler.delete_daily_task(target_day, ids[1])
+    handler.toggle_daily_task(target_day, ids[3])
+    handler.add_weekly_task("2026-W08", "Mon", "Weekly")
+    handler.add_monthly_goal("2026-02", "Goal")
+    handler.delete_monthly_goal("2026-02", handler.get_monthly_goals("2026-02")[0]["id"])
+
+    assert [task["content"] for task in handler.get_daily_tasks(target_day)] == ["Task 0", "Task 2", "Task 3", "Task 4"]
+    assert [task["done"] for task in handler.get_daily_tasks(target_day)] == [False, False, True, False]
+    assert handler.check_id_index() == []
+
+    reopened = DataHandler(data_file=str(data_file))
+    assert reopened.check_id_index() == []
+
+
+def test_load_migrates_colliding_and_missing_ids(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    data_file.write_text(
+        '{"daily": {"2026-02-16": ['
+        '{"id": "a", "content": "A1", "done": false}, '
+        '{"id": "b", "content": "B", "done": false}, '
+        '{"id": "a", "content": "A2", "done": false}]}, '
+        '"timetable_entries": [{"subject": "OS", "day": "월", "start_period": 1, "end_period": 2}]}',
+        encoding="utf-8",
+    )
+    handler = DataHandler(data_file=str(data_file))
+
+    ids = [task["id"] for task in handler.get_daily_tasks("2026-02-16")]
+    assert ids[:2] == ["a", "b"] and len(set(ids)) == 3
+    assert handler.get_timetable_entries()[0]["id"]
+
+    handler.delete_daily_task("2026-02-16", "a")
+    assert [task["content"] for task in handler.get_daily_tasks("2026-02-16")] == ["B", "A2"]
+    assert handler.check_id_index() == []
+
+    reopened = DataHandler(data_file=str(data_file))
+    assert [task["id"] for task in reopened.get_daily_tasks("2026-02-16")] == ids[1:]
+
+
+def test_bulk_inserts_get_unique_ids_that_survive_reload(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file))
+    handler.add_daily_tasks_bulk(("2026-02-16", f"Task {index}") for index in range(50))
+    ids = [task["id"] for task in handler.get_daily_tasks("2026-02-16")]
+    assert len(set(ids)) == 50
+
+    reopened = DataHandler(data_file=str(data_file))
+    reopened.add_daily_task("2026-02-16", "Next")
+    assert reopened.get_daily_tasks("2026-02-16")[-1]["id"] not in ids
+
+
+def test_batch_persists_once_on_exit(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file))
+    writes = []
+    original_write = handler._write_text_atomic
+    handler._write_text_atomic = lambda text, create_backup=True: (writes.append(1), original_write(text, create_backup))
+
+    handler.add_daily_tasks_bulk([("2026-02-16", "Task A"), ("2026-02-17", "Task B", "todo")])
+    handler.add_weekly_tasks_bulk("2026-W08", [("Mon", "Weekly A"), ("Tue", "Weekly B")])
+
+    assert len(writes) == 2
+    reopened = DataHandler(data_file=str(data_file))
+    assert len(reopened.get_daily_tasks("2026-02-17")) == 1
+    assert len(reopened.get_weekly_tasks("2026-W08")["Tue"]) == 1
+
+
+def test_batch_rolls_back_on_error(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file))
+    handler.add_daily_task("2026-02-16", "Kept")
+
+    with pytest.raises(RuntimeError):
+        with handler.batch():
+            handler.add_daily_task("2026-02-16", "Discarded")
+            handler.update_memo("discarded")
+            raise RuntimeError("boom")
+
+    assert [task["content"] for task in handler.get_daily_tasks("2026-02-16")] == ["Kept"]
+    assert handler.get_memo() == ""
+    assert handler.check_id_index() == []
+    assert [task["content"] for task in DataHandler(data_file=str(data_file)).get_daily_tasks("2026-02-16")] == ["Kept"]
+
+
+def test_write_behind_coalesces_saves_until_flush(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), write_behind=True, debounce_seconds=60)
+    for index in range(3):
+        handler.add_daily_task("2026-02-16", f"Task {index}")
+
+    assert not data_file.exists()
+    handler.flush()
+    assert len(DataHandler(data_file=str(data_file)).get_daily_tasks("2026-02-16")) == 3
+    handler.close()
+
+
+def test_write_behind_worker_saves_after_debounce(tmp_path):
+    import time
+
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), write_behind=True, debounce_seconds=0.01)
+    handler.update_memo("saved in background")
+
+    deadline = time.monotonic() + 5
+    while not data_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    handler.close()
+    assert DataHandler(data_file=str(data_file)).get_memo() == "saved in background"
+
+
+def test_mutators_do_not_wait_for_a_slow_flush(tmp_path, monkeypatch):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), write_behind=True, debounce_seconds=60)
+    handler.add_daily_task("2026-02-16", "Task A")
+    writing, release, written = threading.Event(), threading.Event(), []
+    write = data_handler.write_text_atomic
+
+    def slow_write(path, text, create_backup=True):
+        written.append(text)
+        writing.set()
+        release.wait(5)
+        write(path, text, create_backup=create_backup)
+
+    monkeypatch.setattr(data_handler, "write_text_atomic", slow_write)
+    flusher = threading.Thread(target=handler.flush)
+    flusher.start()
+    assert writing.wait(5)
+
+    mutator = threading.Thread(target=handler.add_daily_task, args=("2026-02-16", "Task B"))
+    mutator.start()
+    mutator.join(2)
+    finished = not mutator.is_alive()
+    release.set()
+    flusher.join()
+    mutator.join()
+    handler.close()
+
+    assert finished
+    assert "Task A" in written[0] and "Task B" not in written[0]
+    reopened = DataHandler(data_file=str(data_file))
+    assert [task["content"] for task in reopened.get_daily_tasks("2026-02-16")] == ["Task A", "Task B"]
+
+
+def test_sharded_layout_round_trips_and_loads_months_lazily(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), layout="sharded")
+    handler.add_daily_task("2026-01-05", "January")
+    handler.add_daily_task("2026-02-16", "February")
+    handler.add_weekly_task("2026-W09", "Mon", "Week of Feb 23")
+    handler.add_monthly_goal("2026-03", "March goal")
+    handler.update_memo("root field")
+
+    assert sorted(path.name for path in (tmp_path / "schedule_data.shards").glob("*.json")) == [
+        "2026-01.json",
+        "2026-02.json",
+        "2026-03.json",
+    ]
+
+    reopened = DataHandler(data_file=str(data_file), layout="sharded")
+    assert reopened._shards.loaded_names() == []
+    assert [task["content"] for task in reopened.get_daily_tasks("2026-02-16")] == ["February"]
+    assert reopened._shards.loaded_names() == ["2026-02"]
+    assert reopened.get_weekly_tasks("2026-W09")["Mon"][0]["content"] == "Week of Feb 23"
+    assert reopened.get_memo() == "root field"
+    assert len(reopened.get_tasks()) == 2
+    assert reopened.check_id_index() == []
+
+
+def test_sharded_layout_evicts_clean_shards_and_rewrites_only_dirty_ones(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), layout="sharded", max_loaded_shards=2)
+    with handler.batch():
+        for month in range(1, 7):
+            handler.add_daily_task(f"2026-{month:02d}-01", f"Task {month}")
+    assert len(handler._shards.loaded_names()) == 2
+
+    reopened = DataHandler(data_file=str(data_file), layout="sharded", max_loaded_shards=2)
+    written = []
+    original_write = reopened._shards.write
+    reopened._shards.write = lambda name, text: (written.append(name), original_write(name, text))
+    reopened.toggle_daily_task("2026-03-01", reopened.get_daily_tasks("2026-03-01")[0]["id"])
+    for month in range(1, 7):
+        assert len(reopened.get_daily_tasks(f"2026-{month:02d}-01")) == 1
+
+    assert written == ["2026-03"]
+    assert len(reopened._shards.loaded_names()) <= 2
+    assert DataHandler(data_file=str(data_file), layout="sharded").get_daily_tasks("2026-03-01")[0]["done"] is True
+
+
+def test_sharded_layout_migrates_single_file_and_back(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    single = DataHandler(data_file=str(data_file))
+    single.add_daily_task("2026-02-16", "Task A")
+    single.add_monthly_goal("2026-04", "Goal")
+
+    sharded = DataHandler(data_file=str(data_file), layout="sharded")
+    assert sharded._shards.names() == ["2026-02", "2026-04"]
+    sharded.add_daily_task("2026-02-17", "Task B")
+
+    merged = DataHandler(data_file=str(data_file))
+    assert [task["content"] for task in merged.get_daily_tasks("2026-02-16")] == ["Task A"]
+    assert [task["content"] for task in merged.get_daily_tasks("2026-02-17")] == ["Task B"]
+    assert merged.get_monthly_goals("2026-04")[0]["content"] == "Goal"
+
+
+def test_sharded_batch_rolls_back_shards_and_root(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file), layout="sharded")
+    handler.add_daily_task("2026-02-16", "Kept")
+
+    with pytest.raises(RuntimeError):
+        with handler.batch():
+            handler.add_daily_task("2026-02-16", "Discarded")
+            handler.add_daily_task("2026-05-01", "New month")
+            handler.update_memo("discarded")
+            raise RuntimeError("boom")
+
+    assert [task["content"] for task in handler.get_daily_tasks("2026-02-16")] == ["Kept"]
+    assert handler.get_daily_tasks("2026-05-01") == []
+    assert handler.get_memo() == ""
+    assert not handler._shards.has_dirty()
+    assert not (tmp_path / "schedule_data.shards" / "2026-05.json").exists()
+
+
+def test_sharded_layout_rejects_journal_mode(tmp_path):
+    with pytest.raises(ValueError):
+        DataHandler(data_file=str(tmp_path / "schedule_data.json"), layout="sharded", journal=True)
+
+
+def test_timetable_grid_tracks_adds_deletes_and_rollback(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file))
+    first = handler.add_timetable_entry("자료구조", "월", 1, 2, "#112233")
+    second = handler.add_timetable_entry("운영체제", "월", 3, 3, "#445566")
+
+    assert handler.get_timetable_grid() == {("월", 1): first["id"], ("월", 2): first["id"], ("월", 3): second["id"]}
+    with pytest.raises(ValueError):
+        handler.add_timetable_entry("영어", "월", 2, 4, "#778899")
+
+    handler.delete_timetable_entry(first["id"])
+    assert handler.get_timetable_grid() == {("월", 3): second["id"]}
+
+    with pytest.raises(RuntimeError):
+        with handler.batch():
+            handler.add_timetable_entry("영어", "월", 1, 2, "#778899")
+            raise RuntimeError("boom")
+    assert handler.get_timetable_grid() == {("월", 3): second["id"]}
+    assert DataHandler(data_file=str(data_file)).get_timetable_grid() == {("월", 3): second["id"]}
+
+
+def test_find_free_slots_and_matrix_follow_occupancy(tmp_path):
+    handler = DataHandler(data_file=str(tmp_path / "schedule_data.json"))
+    handler.add_timetable_entry("자료구조", "화", 0, 3, "#112233")
+    handler.add_timetable_entry("운영체제", "화", 6, 14, "#445566")
+
+    assert handler.find_free_slots("화", 2) == [(4, 5)]
+    assert handler.find_free_slots("화", 3) == []
+    assert len(handler.find_free_slots("월", 15)) == 1
+    assert handler.free_periods_matrix()["화"] == [False] * 4 + [True] * 2 + [False] * 9
+    with pytest.raises(ValueError):
+        handler.find_free_slots("일", 1)
+
+    start, end = handler.find_free_slots("화", 2)[0]
+    handler.add_timetable_entry("영어", "화", start, end, "#778899")
+    assert not any(handler.free_periods_matrix()["화"])
+
+
+def test_timetable_entries_stay_in_canonical_order(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file))
+    handler.add_timetable_entry("운영체제", "수", 3, 4, "#112233")
+    handler.add_timetable_entry("자료구조", "월", 5, 6, "#445566")
+    handler.add_timetable_entry("영어", "월", 1, 1, "#778899")
+    handler.add_timetable_entry("수학", "토", 0, 0, "#AABBCC")
+
+    expected = [("월", 1), ("월", 5), ("수", 3), ("토", 0)]
+    assert [(entry["day"], entry["start_period"]) for entry in handler.get_timetable_entries()] == expected
+    assert [entry["subject"] for entry in handler.get_timetable_entries_for_day("월")] == ["영어", "자료구조"]
+    assert handler.get_timetable_entries_for_day("목") == []
+    assert handler.count_timetable_entries() == 4
+    assert handler.check_id_index() == []
+
+    handler.delete_timetable_entry(handler.get_timetable_entries_for_day("월")[0]["id"])
+    assert handler.check_id_index() == []
+    reopened = DataHandler(data_file=str(data_file))
+    assert [(entry["day"], entry["start_period"]) for entry in reopened.get_timetable_entries()] == expected[1:]
+
+
+def test_completion_counters_follow_every_mutation(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    handler = DataHandler(data_file=str(data_file))
+    handler.add_daily_task("2026-02-16", "Task A")
+    assert handler.get_daily_counts("2026-02-16") == (0, 1)
+
+    handler.add_daily_tasks_bulk([("2026-02-16", "Task B"), ("2026-02-16", "Task C")])
+    first, second, third = (task["id"] for task in handler.get_daily_tasks("2026-02-16"))
+    handler.toggle_daily_task("2026-02-16", first)
+    handler.toggle_daily_task("2026-02-16", second)
+    handler.delete_daily_task("2026-02-16", first)
+    assert handler.get_daily_counts("2026-02-16") == (1, 2)
+    assert handler.get_completion_rate("2026-02-16") == 0.5
+
+    handler.add_weekly_task("2026-W08", "Mon", "Weekly A")
+    handler.add_weekly_task("2026-W08", "Sun", "Weekly B")
+    assert handler.get_weekly_counts("2026-W08") == (0, 2)
+    handler.toggle_weekly_task("2026-W08", "Sun", handler.get_weekly_tasks("2026-W08")["Sun"][0]["id"])
+    assert handler.get_weekly_completion_rate("2026-W08") == 0.5
+
+    handler.add_monthly_goal("2026-02", "Goal")
+    handler.toggle_monthly_goal("2026-02", handler.get_monthly_goals("2026-02")[0]["id"])
+    assert handler.get_monthly_counts("2026-02") == (1, 1)
+
+    with pytest.raises(RuntimeError):
+        with handler.batch():
+            handler.toggle_daily_task("2026-02-16", third)
+            raise RuntimeError("boom")
+    assert handler.get_daily_counts("2026-02-16") == (1, 2)
+
+    reopened = DataHandler(data_file=str(data_file))
+    assert reopened.get_daily_counts("2026-02-16") == (1, 2)
+    assert reopened.get_weekly_counts("2026-W08") == (1, 2)
+    assert reopened.get_monthly_counts("2026-03") == (0, 0)
+
+
+def test_iterators_walk_buckets_in_key_order_with_filters(tmp_path):
+    handler = DataHandler(data_file=str(tmp_path / "schedule_data.json"))
+    handler.add_daily_tasks_bulk(
+        [("2026-02-17", "C"), ("2026-02-15", "A"), ("2026-02-16", "B", "study"), ("2026-03-01", "D")]
+    )
+    handler.toggle_daily_task("2026-02-15", handler.get_daily_tasks("2026-02-15")[0]["id"])
+    handler.add_weekly_task("2026-W09", "Sun", "Late")
+    handler.add_weekly_task("2026-W09", "Mon", "Early")
+    handler.add_weekly_task("2026-W08", "Fri", "Before")
+    handler.add_monthly_goal("2026-03", "March")
+    handler.add_monthly_goal("2026-01", "January")
+
+    assert [task["content"] for _, task in handler.iter_tasks()] == ["A", "B", "C", "D"]
+    assert [date for date, _ in handler.iter_tasks("2026-02-16", "2026-02-28")] == ["2026-02-16", "2026-02-17"]
+    assert [task["content"] for _, task in handler.iter_tasks(done=False, category="todo")] == ["C", "D"]
+    assert [task["content"] for _, task in handler.iter_tasks(done=True)] == ["A"]
+    assert [(week, day) for week, day, _ in handler.iter_weekly_tasks()] == [
+        ("2026-W08", "Fri"),
+        ("2026-W09", "Mon"),
+        ("2026-W09", "Sun"),
+    ]
+    assert [month for month, _ in handler.iter_monthly_goals(start="2026-02")] == ["2026-03"]
+    assert [task["content"] for task in handler.get_tasks()] == ["A", "B", "C", "D"]
@@ -0,0 +1,121 @@
+import datetime
+import random
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from habit_log import HabitDays, HabitLogs, habit_analytics  # noqa: E402
+
+
+DAY = datetime.date(2026, 3, 4)  # Wednesday
+
+
+def days_ago(*offsets):
+    return [str(DAY - datetime.timedelta(days=offset)) for offset in offsets]
+
+
+def test_json_round_trip_keeps_unchanged_habits_verbatim():
+    data = {"독서": days_ago(0, 1, 3) + ["not-a-date"], "운동": [], "물": days_ago(10, 2, 10)}
+    logs = HabitLogs.from_json(data)
+    assert logs.to_json() == data
+
+    # 바꾼 습관만 정렬 + 중복 제거, 날짜가 아닌 값은 뒤에 유지
+    logs.toggle("물", DAY)
+    logs.toggle("독서", DAY)
+    assert logs.to_json() == {
+        "독서": days_ago(3, 1) + ["not-a-date"],
+        "운동": [],
+        "물": days_ago(10, 2, 0),
+    }
+    assert HabitLogs.from_json(logs.to_json()).to_json() == logs.to_json()
+
+
+def test_non_list_habit_entries_do_not_break_loading():
+    logs = HabitLogs.from_json({"독서": str(DAY), "운동": 3, "물": None, "산책": days_ago(1)})
+    assert list(logs) == ["독서", "산책"]
+    assert logs.contains("독서", DAY)
+    assert logs.to_json() == {"독서": [str(DAY)], "산책": days_ago(1)}
+
+
+def test_membership_counts_and_toggle():
+    logs = HabitLogs.from_json({"독서": days_ago(0, 1, 3, 9)})
+    assert logs.contains("독서", DAY) and logs.contains("독서", str(DAY))
+    assert not logs.contains("독서", DAY - datetime.timedelta(days=2))
+    assert not logs.contains("없음", DAY) and "없음" not in logs
+
+    habit = logs.get("독서")
+    assert habit.count(DAY - datetime.timedelta(days=6), DAY) == 3
+    assert habit.count(DAY - datetime.timedelta(days=30), DAY - datetime.timedelta(days=5)) == 1
+    assert habit.count(DAY + datetime.timedelta(days=1), DAY + datetime.timedelta(days=9)) == 0
+
+    assert logs.toggle("독서", DAY) is False
+    assert logs.toggle("새 습관", DAY - datetime.timedelta(days=400)) is True
+    assert logs.get("새 습관").days() == [DAY - datetime.timedelta(days=400)]
+    logs.remove("새 습관")
+    assert list(logs) == ["독서"]
+
+
+def test_streaks_match_brute_force():
+    rng = random.Random(5)
+    habit = HabitDays()
+    checked = set()
+    for offset in range(400):
+        if rng.random() < 0.7:
+            day = DAY - datetime.timedelta(days=offset)
+            habit.add(day)
+            checked.add(day)
+
+    def run_ending(day):
+        run = 0
+        while day in checked:
+            run += 1
+            day -= datetime.timedelta(days=1)
+        return run
+
+    def longest(start, end):
+        best = run = 0
+        day = start
+        while day <= end:
+            run = run + 1 if day in checked else 0
+            best = max(best, run)
+            day += datetime.timedelta(days=1)
+        return best
+
+    for offset in (0, 1, 7, 100, 399, 500):
+        day = DAY - datetime.timedelta(days=offset)
+        assert habit.current_streak(day) == run_ending(day)
+    start = DAY - datetime.timedelta(days=120)
+    assert habit.longest_streak() == longest(DAY - datetime.timedelta(days=399), DAY)
+    assert habit.longest_streak(start, DAY) == longest(start, DAY)
+
+
+def test_heatmap_buckets_by_weekday_and_week():
+    logs = HabitLogs.from_json({"a": days_ago(0, 2, 7), "b": days_ago(0, 400)})
+    grid = habit_analytics(logs, [("a", 1), ("b", 1)], DAY, weeks=2).heatmap
+    assert len(grid) == 7 and all(len(row) == 2 for row in grid)
+    assert grid[DAY.weekday()] == [1, 2]  # 오늘 (a, b) + 지난주 같은 요일 (a)
+    assert grid[0] == [0, 1]  # 이번 주 월요일 (a)
+    assert sum(map(sum, grid)) == 4
+    assert habit_analytics(logs, [("b", 1)], DAY, weeks=2).heatmap[DAY.weekday()] == [0, 1]
+
+
+def test_habit_analytics_streaks_attainment_and_heatmap():
+    logs = HabitLogs.from_json({"a": days_ago(1, 2, 3, 7, 8, 9, 10, 11), "b": days_ago(0)})
+    analytics = habit_analytics(logs, [("a", 3), ("b", 1), ("c", 1)], DAY, weeks=3)
+
+    a, b, c = analytics.habits
+    assert (a.current, a.longest) == (3, 5)  # 오늘 체크 전: 어제까지 3일 연속
+    assert (b.current, b.longest) == (1, 1)
+    assert (c.current, c.longest, c.weekly) == (0, 0, [0, 0, 0])
+    assert a.weekly == [2, 4, 2]
+    assert analytics.week_starts[-1] == DAY - datetime.timedelta(days=DAY.weekday())
+    assert analytics.attainment == [0, 1, 1]
+    assert sum(map(sum, analytics.heatmap)) == 9
+    assert analytics.heatmap[DAY.weekday()][-1] == 1  # b 오늘
+    before = logs.fingerprint()
+    assert before == HabitLogs.from_json(logs.to_json()).fingerprint()
+    logs.toggle("b", DAY)
+    assert logs.fingerprint() != before
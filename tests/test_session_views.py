@@ -0,0 +1,59 @@
+import datetime
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from columnar import ColumnTable  # noqa: E402
+from session_views import parse_minutes, percentages, project_view, study_view, time_log_view, to_int  # noqa: E402
+
+
+def test_parse_minutes_and_to_int():
+    assert parse_minutes("09:30") == 570
+    assert parse_minutes("00:00") == 0
+    assert parse_minutes("24:00") is None
+    assert parse_minutes("9시") is None
+    assert parse_minutes(None) is None
+    assert [to_int(value) for value in (True, 2.0, "3", None, float("nan"), "x")] == [1, 2, 3, 0, 0, 0]
+
+
+def test_percentages_floor_and_zero_total():
+    assert percentages([1, 29, 3], [3, 100, 0]) == [33, 29, 0]
+    assert percentages([], []) == []
+
+
+def test_time_log_view_is_cached_until_the_table_changes():
+    today = datetime.date(2026, 3, 2)
+    table = ColumnTable(("Date", "StartTime", "EndTime", "Activity", "Category"), [
+        {"StartTime": "09:00", "EndTime": "11:00", "Activity": "a", "Category": "Study"},
+        {"Date": "2026-03-01", "StartTime": "23:30", "EndTime": "00:30", "Activity": "b", "Category": "Study"},
+        {"StartTime": "bad", "EndTime": "10:00", "Activity": "c", "Category": "Study"},
+    ])
+    view = time_log_view(table, today)
+    assert [(row.id, row.day, row.start_min, row.end_min) for row in view.rows] == [
+        (0, today, 540, 660), (1, datetime.date(2026, 3, 1), 1410, 30), (2, today, None, 600),
+    ]
+    assert len(view.log) == 2
+    assert view.log.daily_covered(datetime.date(2026, 3, 1), today) == [30, 150]
+    assert time_log_view(table, today) is view
+
+    table.delete(0)
+    assert time_log_view(table, today).log.daily_covered(today, today) == [30]
+
+
+def test_progress_views_type_columns_once():
+    study = ColumnTable(("Name", "Total", "Done"), [{"Name": "알고리즘", "Total": 10, "Done": 8.0}])
+    view = study_view(study)
+    assert view.rows[0] == (0, "알고리즘", 8, 10, 80)
+    assert (view.done, view.total) == (8, 10)
+
+    projects = ColumnTable(("Subject", "Task", "Total", "Done", "Deadline"), [
+        {"Subject": "캡스톤1", "Task": "기획안", "Total": 5, "Done": True, "Deadline": "2026-03-15"},
+        {"Subject": "자료구조", "Task": "연결리스트", "Total": None, "Done": 0, "Deadline": "2026-03-20"},
+    ])
+    rows = project_view(projects).rows
+    assert [(row.done, row.total, row.pct) for row in rows] == [(1, 5, 20), (0, 1, 0)]
+    projects.set(0, "Done", 5)
+    assert project_view(projects).done == 5
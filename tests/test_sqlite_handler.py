@@ -0,0 +1,222 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "mobile_app"))
+
+from data_handler import DataHandler
+from sqlite_handler import SqliteDataHandler
+
+
+def _public_methods(cls):
+    return {name for name in dir(cls) if not name.startswith("_") and callable(getattr(cls, name))}
+
+
+def test_sqlite_handler_exposes_data_handler_api():
+    missing = _public_methods(DataHandler) - _public_methods(SqliteDataHandler) - {"check_id_index", "compact_journal"}
+    assert missing == set()
+
+
+def test_backend_is_selectable_at_construction(tmp_path):
+    handler = DataHandler(data_file=str(tmp_path / "schedule_data.json"), backend="sqlite")
+    assert isinstance(handler, SqliteDataHandler)
+    assert (tmp_path / "schedule_data.sqlite3").exists()
+
+    with pytest.raises(ValueError):
+        DataHandler(data_file=str(tmp_path / "schedule_data.json"), backend="csv")
+
+
+@pytest.mark.parametrize("option", [{"journal": True}, {"write_behind": True}, {"layout": "sharded"}])
+def test_sqlite_backend_rejects_json_storage_options(tmp_path, option):
+    with pytest.raises(TypeError):
+        DataHandler(data_file=str(tmp_path / "schedule_data.json"), backend="sqlite", **option)
+
+
+def test_backend_is_keyword_only(tmp_path):
+    with pytest.raises(TypeError):
+        DataHandler(str(tmp_path / "schedule_data.json"), False, 200, "sqlite")
+
+
+def test_daily_weekly_monthly_round_trip(tmp_path):
+    handler = SqliteDataHandler(str(tmp_path / "planner.sqlite3"))
+
+    handler.add_daily_task("2026-02-16", "Task A")
+    handler.add_daily_task("2026-02-16", "Task B")
+    first, second = handler.get_daily_tasks("2026-02-16")
+    handler.toggle_daily_task("2026-02-16", first["id"])
+    handler.delete_daily_task("2026-02-16", second["id"])
+    assert handler.get_daily_tasks("2026-02-16") == [dict(first, done=True)]
+    assert handler.get_completion_rate("2026-02-16") == 1.0
+
+    handler.add_weekly_task("2026-W08", "Tue", "Weekly A")
+    task = handler.get_weekly_tasks("2026-W08")["Tue"][0]
+    handler.toggle_weekly_task("2026-W08", "Tue", task["id"])
+    assert handler.get_weekly_completion_rate("2026-W08") == 1.0
+
+    handler.add_monthly_goal("2026-02", "[Work] Goal", group="Work", name="Goal")
+    goal = handler.get_monthly_goals("2026-02")[0]
+    assert goal["group"] == "Work" and goal["name"] == "Goal"
+    handler.delete_monthly_goal("2026-02", goal["id"])
+    assert handler.get_monthly_goals("2026-02") == []
+
+    handler.update_memo("memo")
+    reopened = SqliteDataHandler(str(tmp_path / "planner.sqlite3"))
+    assert reopened.get_memo() == "memo"
+
+
+def test_timetable_rules_match_json_backend(tmp_path):
+    handler = SqliteDataHandler(str(tmp_path / "planner.sqlite3"))
+    handler.add_timetable_entry("자료구조", "수", 1, 2, "#111111")
+    handler.add_timetable_entry("자료구조", "월", 5, 8, "#F2CF66")
+
+    with pytest.raises(ValueError):
+        handler.add_timetable_entry("컴퓨터네트워크", "월", 8, 9, "#6CAB45")
+
+    entries = handler.get_timetable_entries()
+    assert [entry["day"] for entry in entries] == ["월", "수"]
+    assert handler.find_free_slots("월", 4) == [(0, 3), (1, 4), (9, 12), (10, 13), (11, 14)]
+    assert handler.get_subject_color("자료구조") == "#111111"
+
+    handler.delete_timetable_entry(entries[0]["id"])
+    assert len(handler.get_timetable_entries()) == 1
+    assert handler.count_timetable_entries() == 1
+    assert [entry["day"] for entry in handler.get_timetable_entries_for_day("수")] == ["수"]
+    assert handler.get_timetable_grid() == {("수", 1): entries[1]["id"], ("수", 2): entries[1]["id"]}
+
+
+def test_imports_existing_json_document_once(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    source = DataHandler(data_file=str(data_file))
+    source.add_daily_task("2026-02-16", "Task A")
+    source.add_weekly_task("2026-W08", "Mon", "Weekly A")
+    source.add_monthly_goal("2026-02", "Goal", description="desc")
+    source.add_timetable_entry("컴퓨터구조", "목", 2, 4, "#F0D169")
+    source.update_memo("memo")
+
+    imported = DataHandler(data_file=str(data_file), backend="sqlite")
+    assert imported.get_daily_tasks("2026-02-16") == source.get_daily_tasks("2026-02-16")
+    assert imported.get_weekly_tasks("2026-W08") == source.get_weekly_tasks("2026-W08")
+    assert imported.get_monthly_goals("2026-02") == source.get_monthly_goals("2026-02")
+    assert imported.get_timetable_entries() == source.get_timetable_entries()
+    assert imported.get_subject_colors() == source.get_subject_colors()
+    assert imported.get_memo() == "memo"
+
+    data_file.write_text(json.dumps({"memo": "changed"}), encoding="utf-8")
+    reopened = DataHandler(data_file=str(data_file), backend="sqlite")
+    assert reopened.get_memo() == "memo"
+
+
+def test_batch_commits_once_and_rolls_back_on_error(tmp_path):
+    handler = SqliteDataHandler(str(tmp_path / "planner.sqlite3"))
+    handler.add_daily_tasks_bulk([("2026-02-16", "Task A"), ("2026-02-16", "Task B")])
+
+    with pytest.raises(RuntimeError):
+        with handler.batch():
+            handler.add_daily_task("2026-02-16", "Discarded")
+            raise RuntimeError("boom")
+
+    assert [task["content"] for task in handler.get_daily_tasks("2026-02-16")] == ["Task A", "Task B"]
+
+
+def test_ids_continue_after_imported_counter(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    source = DataHandler(data_file=str(data_file))
+    source.add_daily_tasks_bulk(("2026-02-16", f"Task {index}") for index in range(3))
+
+    handler = DataHandler(data_file=str(data_file), backend="sqlite")
+    handler.add_daily_tasks_bulk(("2026-02-16", f"More {index}") for index in range(3))
+    ids = [task["id"] for task in handler.get_daily_tasks("2026-02-16")]
+    assert len(set(ids)) == 6
+
+
+def test_range_analytics_match_json_backend(tmp_path):
+    json_handler = DataHandler(data_file=str(tmp_path / "schedule_data.json"))
+    sqlite_handler = SqliteDataHandler(str(tmp_path / "planner.sqlite3"))
+    for handler in (json_handler, sqlite_handler):
+        handler.add_daily_tasks_bulk([("2026-02-15", "A"), ("2026-02-16", "B", "study"), ("2026-02-16", "C")])
+        for date_str in ["2026-02-15", "2026-02-16"]:
+            handler.toggle_daily_task(date_str, handler.get_daily_tasks(date_str)[0]["id"])
+
+    for handler in (json_handler, sqlite_handler):
+        assert handler.get_range_stats("2026-02-01", "2026-02-28") == {"done": 2, "total": 3, "rate": 2 / 3}
+        assert handler.get_range_stats("2026-02-01", "2026-02-28", category="study", weekday=0)["done"] == 1
+        assert handler.get_daily_series("2026-02-15", "2026-02-16") == [("2026-02-15", 1, 1), ("2026-02-16", 1, 2)]
+        assert handler.get_streak("2026-02-15") == 1
+        assert handler.get_longest_streak("2026-02-01", "2026-02-28") == 1
+
+
+def test_iterators_match_json_backend(tmp_path):
+    json_handler = DataHandler(data_file=str(tmp_path / "schedule_data.json"))
+    sqlite_handler = SqliteDataHandler(str(tmp_path / "planner.sqlite3"))
+    for handler in (json_handler, sqlite_handler):
+        handler.add_daily_tasks_bulk([("2026-02-17", "C"), ("2026-02-15", "A"), ("2026-02-16", "B", "study")])
+        handler.toggle_daily_task("2026-02-17", handler.get_daily_tasks("2026-02-17")[0]["id"])
+        handler.add_weekly_tasks_bulk("2026-W08", [("Sun", "Late"), ("Mon", "Early")])
+        handler.add_monthly_goal("2026-02", "Goal")
+
+    for method, kwargs in [
+        ("iter_tasks", {"start": "2026-02-16"}),
+        ("iter_tasks", {"done": False, "category": "todo"}),
+        ("iter_weekly_tasks", {}),
+        ("iter_monthly_goals", {"end": "2026-02"}),
+    ]:
+        assert list(getattr(sqlite_handler, method)(**kwargs)) == list(getattr(json_handler, method)(**kwargs))
+
+
+def test_import_falls_back_to_backup_and_retries_after_failure(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    source = DataHandler(data_file=str(data_file))
+    source.add_daily_task("2026-02-16", "Task A")
+    source.add_daily_task("2026-02-16", "Task B")  # second save leaves a .bak with Task A
+    data_file.write_text("{broken json", encoding="utf-8")
+
+    recovered = DataHandler(data_file=str(data_file), backend="sqlite")
+    assert [task["content"] for task in recovered.get_daily_tasks("2026-02-16")] == ["Task A"]
+
+    other = tmp_path / "other.json"
+    other.write_text("{broken json", encoding="utf-8")
+    empty = DataHandler(data_file=str(other), backend="sqlite")
+    assert empty.get_daily_tasks("2026-02-16") == []
+    empty.close()
+
+    other.write_text(json.dumps({"daily": {"2026-02-16": [{"id": "1", "content": "Fixed"}]}}), encoding="utf-8")
+    retried = DataHandler(data_file=str(other), backend="sqlite")
+    assert [task["content"] for task in retried.get_daily_tasks("2026-02-16")] == ["Fixed"]
+
+
+def test_counts_match_json_backend(tmp_path):
+    json_handler = DataHandler(data_file=str(tmp_path / "schedule_data.json"))
+    sqlite_handler = SqliteDataHandler(str(tmp_path / "planner.sqlite3"))
+    for handler in (json_handler, sqlite_handler):
+        handler.add_weekly_tasks_bulk("2026-W08", [("Mon", "A"), ("Tue", "B"), ("Holiday", "Not a weekday")])
+        handler.toggle_weekly_task("2026-W08", "Mon", handler.get_weekly_tasks("2026-W08")["Mon"][0]["id"])
+        handler.add_daily_tasks_bulk([("2026-02-16", "A"), ("2026-02-16", "B")])
+        handler.add_monthly_goal("2026-02", "Goal")
+
+    for method, key in [
+        ("get_weekly_counts", "2026-W08"),
+        ("get_weekly_completion_rate", "2026-W08"),
+        ("get_daily_counts", "2026-02-16"),
+        ("get_completion_rate", "2026-02-16"),
+        ("get_monthly_counts", "2026-02"),
+    ]:
+        assert getattr(sqlite_handler, method)(key) == getattr(json_handler, method)(key), method
+
+
+def test_overlapping_legacy_entries_match_json_backend(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    data_file.write_text(json.dumps({"timetable_entries": [
+        {"id": "2", "subject": "B", "day": "월", "start_period": 2, "end_period": 4},
+        {"id": "1", "subject": "A", "day": "월", "start_period": 1, "end_period": 3},
+    ]}), encoding="utf-8")
+    json_handler = DataHandler(data_file=str(data_file))
+    sqlite_handler = DataHandler(data_file=str(data_file), backend="sqlite")
+
+    assert sqlite_handler.get_timetable_grid() == json_handler.get_timetable_grid()
+    for handler in (json_handler, sqlite_handler):
+        handler.delete_timetable_entry("2")
+    assert sqlite_handler.get_timetable_grid() == json_handler.get_timetable_grid()
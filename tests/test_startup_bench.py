@@ -0,0 +1,36 @@
+import json
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import startup_bench
+from data_handler import DataHandler
+
+
+def test_synthetic_schedule_data_loads_without_id_migration(tmp_path):
+    data_file = tmp_path / "schedule_data.json"
+    startup_bench.write_json(data_file, startup_bench.make_schedule_data(30))
+
+    handler = DataHandler(data_file=str(data_file))
+    assert handler._migrated_ids == 0
+    assert len(handler.data["daily"]) == 30
+    assert len(handler.get_timetable_entries()) == 3 * len(DataHandler.VALID_TIMETABLE_DAYS)
+
+
+def test_run_suite_writes_comparable_report(tmp_path):
+    output = tmp_path / "bench.json"
+    assert startup_bench.main(["--sizes", "1", "--repeat", "1", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    timings = report["sizes"]["1d"]["data_handler"]
+    assert {"load", "add_daily_task", "delete_timetable_entry", "get_monthly_completion_rate"} <= set(timings)
+    assert "read_store" in report["sizes"]["1d"]["web"]
+    assert report["habits"]["budget_ms"] == startup_bench.HABIT_ANALYTICS_BUDGET_MS
+    assert "median_ms" in report["habits"]["habit_analytics"]
+
+    slower = json.loads(json.dumps(report))
+    slower["sizes"]["1d"]["data_handler"]["load"]["median_ms"] = timings["load"]["median_ms"] * 10 + 1
+    assert [metric for metric, _, _ in startup_bench.compare(report, slower)] == ["sizes/1d/data_handler/load"]
@@ -0,0 +1,69 @@
+import datetime
+import random
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from time_log import MINUTES_PER_DAY, TimeLog, day_start, merge, to_interval, week_days  # noqa: E402
+
+
+DAY = datetime.date(2026, 3, 2)
+
+
+def test_to_interval_handles_midnight_and_empty_ranges():
+    base = day_start(DAY)
+    assert to_interval(DAY, 540, 660) == (base + 540, base + 660)
+    assert to_interval(DAY, 1410, 30) == (base + 1410, base + MINUTES_PER_DAY + 30)
+    assert to_interval(DAY, 600, 600) is None
+    assert to_interval(DAY, None, 600) is None
+
+
+def test_overlapping_and_duplicate_logs_are_merged():
+    base = day_start(DAY)
+    log = TimeLog([
+        (base + 540, base + 660, "Study"),
+        (base + 540, base + 660, "Study"),
+        (base + 600, base + 720, "Practice"),
+        (base + 840, base + 960, "Study"),
+    ])
+    assert log.summary() == {"total": 480, "covered": 300, "gap": 120}
+    assert log.summary(category="Study") == {"total": 360, "covered": 240, "gap": 180}
+    assert log.covered_minutes(base + 630, base + 900) == 150
+    assert merge([(1, 3), (2, 5), (5, 6), (8, 9)]) == [(1, 6), (8, 9)]
+
+
+def test_daily_covered_splits_at_midnight_per_category():
+    log = TimeLog()
+    log.add(*to_interval(DAY, 1380, 60), "Study")  # 23:00 ~ 01:00
+    log.add(*to_interval(DAY, 600, 660), "Practice")
+    log.add(*to_interval(DAY + datetime.timedelta(days=1), 30, 90), "Study")
+    next_day = DAY + datetime.timedelta(days=1)
+
+    assert log.daily_covered(DAY, next_day) == [120, 90]
+    assert log.daily_covered(DAY, next_day, by_category=True) == {"Study": [60, 90], "Practice": [60, 0]}
+    assert log.daily_covered(next_day, next_day) == [90]
+
+
+def test_daily_covered_matches_brute_force_over_months():
+    rng = random.Random(3)
+    first = DAY - datetime.timedelta(days=89)
+    log = TimeLog()
+    minutes = {}
+    for _ in range(1500):
+        day = first + datetime.timedelta(days=rng.randrange(90))
+        start, length = rng.randrange(1440), rng.randrange(1, 240)
+        interval = to_interval(day, start, (start + length) % 1440)
+        log.add(*interval, "Study")
+        for minute in range(*interval):
+            minutes[minute] = True
+
+    expected = [0] * 91
+    for minute in minutes:
+        index = (minute - day_start(first)) // MINUTES_PER_DAY
+        if index < 91:
+            expected[index] += 1
+    assert log.daily_covered(first, DAY + datetime.timedelta(days=1)) == expected
+    assert week_days(DAY)[0] == DAY - datetime.timedelta(days=6) and week_days(DAY)[-1] == DAY
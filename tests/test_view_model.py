@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "mobile_app"))
+
+from view_model import CellGrid, KeyedControls
+
+
+def _keyed(container, created):
+    def create(item):
+        control = SimpleNamespace(value=item["content"])
+        created.append(item["id"])
+        return control
+
+    def patch(control, item):
+        control.value = item["content"]
+
+    return KeyedControls(
+        container,
+        key=lambda item: item["id"],
+        create=create,
+        patch=patch,
+        state=lambda item: item["content"],
+        empty=lambda: SimpleNamespace(value="empty"),
+    )
+
+
+def test_keyed_controls_patch_only_changed_items():
+    container = SimpleNamespace(controls=[])
+    created = []
+    keyed = _keyed(container, created)
+    keyed.sync([{"id": "1", "content": "A"}, {"id": "2", "content": "B"}])
+    first, second = container.controls
+
+    changed = keyed.sync([{"id": "1", "content": "A"}, {"id": "2", "content": "B2"}])
+
+    assert changed == [second]
+    assert second.value == "B2"
+    assert container.controls[0] is first
+    assert created == ["1", "2"]
+
+
+def test_keyed_controls_update_container_on_insert_remove_and_empty():
+    container = SimpleNamespace(controls=[])
+    created = []
+    keyed = _keyed(container, created)
+    keyed.sync([{"id": "1", "content": "A"}])
+    first = container.controls[0]
+
+    assert keyed.sync([{"id": "1", "content": "A"}, {"id": "3", "content": "C"}]) == [container]
+    assert container.controls[0] is first
+    assert keyed.sync([]) == [container]
+    assert [control.value for control in container.controls] == ["empty"]
+    assert len(keyed) == 0
+
+
+def test_cell_grid_repaints_only_cells_whose_state_changed():
+    painted = []
+    grid = CellGrid(lambda cell, state: painted.append((cell.key, state)))
+    for key in ["a", "b", "c"]:
+        grid.add(key, SimpleNamespace(key=key))
+
+    grid.repaint({"a": "red"})
+    painted.clear()
+    changed = grid.repaint({"a": "red", "b": "blue"})
+
+    assert [cell.key for cell in changed] == ["b"]
+    assert painted == [("b", "blue")]
+    assert [cell.key for cell in grid.repaint({})] == ["a", "b"]
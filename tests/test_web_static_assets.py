@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from web_styles import BACKGROUND_FILE, background_css, page_css  # noqa: E402
+
+
+def test_background_is_served_as_static_file():
+    config = (ROOT / ".streamlit" / "config.toml").read_text(encoding="utf-8")
+    assert "enableStaticServing = true" in config
+    assert (ROOT / "static" / "background.png").exists()
+
+
+def test_background_css_points_at_the_static_url(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    css = background_css(BACKGROUND_FILE)
+    assert 'url("app/static/background.png")' in css
+    assert "base64" not in css
+    assert background_css(BACKGROUND_FILE) is css
+
+
+def test_background_css_falls_back_to_a_data_uri(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    assert 'url("data:image/png;base64,' in background_css(BACKGROUND_FILE, static_serving=False)
+    assert background_css("missing.png") == ""
+
+
+def test_stylesheet_is_compiled_once_per_theme_and_background(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    page_css.cache_clear()
+    dark = page_css("dark", BACKGROUND_FILE)
+    assert page_css("dark", BACKGROUND_FILE) is dark
+    assert page_css.cache_info().hits == 1
+
+    light = page_css("light", BACKGROUND_FILE)
+    assert light != dark
+    assert "#38bdf8" in dark and "#0d9488" in light
+    assert dark.count("<style>") == 2  # 테마 + 배경
+    assert page_css("dark").count("<style>") == 1
@@ -0,0 +1,100 @@
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from web_store import SharedStore, StaleWriteError, read_store, write_store  # noqa: E402
+
+
+def test_write_store_is_atomic_and_compact(tmp_path):
+    path = tmp_path / "data.json"
+    write_store({"daily_memo": "메모", "habits": []}, str(path))
+
+    assert not (tmp_path / "data.json.tmp").exists()
+    text = path.read_text(encoding="utf-8")
+    assert "메모" in text and "\n" not in text
+    assert read_store(str(path)) == {"daily_memo": "메모", "habits": []}
+
+
+def test_shared_store_versions_and_persists_updates(tmp_path):
+    path = tmp_path / "data.json"
+    store = SharedStore(str(path))
+    version, data = store.snapshot()
+    assert data is None
+
+    new_version = store.update({"daily_memo": "a"})
+    assert new_version > version
+    assert store.current_version() == new_version
+    assert store.snapshot() == (new_version, {"daily_memo": "a"})
+
+    store.update({"habit_logs": {"독서": ["2026-03-01"]}})
+    assert read_store(str(path)) == {"daily_memo": "a", "habit_logs": {"독서": ["2026-03-01"]}}
+
+
+def test_stale_write_to_same_key_is_rejected(tmp_path):
+    path = tmp_path / "data.json"
+    store = SharedStore(str(path))
+    seen = store.update({"daily_memo": "a", "habits": []})
+
+    store.update({"habits": [{"Name": "독서"}]}, expected_version=seen)  # 다른 세션
+    with pytest.raises(StaleWriteError) as info:
+        store.update({"habits": []}, expected_version=seen)
+
+    assert info.value.keys == ["habits"]
+    assert read_store(str(path))["habits"] == [{"Name": "독서"}]
+
+
+def test_write_to_untouched_key_merges_with_other_sessions(tmp_path):
+    path = tmp_path / "data.json"
+    store = SharedStore(str(path))
+    seen = store.update({"daily_memo": "a", "habits": []})
+
+    other = store.update({"habits": [{"Name": "독서"}]}, expected_version=seen)
+    version = store.update({"daily_memo": "b"}, expected_version=seen)
+
+    assert version == other + 1
+    assert read_store(str(path)) == {"daily_memo": "b", "habits": [{"Name": "독서"}]}
+
+
+def test_shared_store_reloads_after_external_write(tmp_path):
+    path = tmp_path / "data.json"
+    write_store({"daily_memo": "old"}, str(path))
+    store = SharedStore(str(path))
+    version = store.current_version()
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"daily_memo": "new"}, f)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    new_version, data = store.snapshot()
+    assert new_version > version
+    assert data == {"daily_memo": "new"}
+    with pytest.raises(StaleWriteError):
+        store.update({"daily_memo": "mine"}, expected_version=version)
+
+
+def test_concurrent_updates_are_serialized(tmp_path):
+    path = tmp_path / "data.json"
+    store = SharedStore(str(path))
+    start = store.current_version()
+
+    def worker(index):
+        for step in range(10):
+            store.update({f"key{index}": step})
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.current_version() == start + 40
+    assert read_store(str(path)) == {f"key{index}": 9 for index in range(4)}
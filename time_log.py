@@ -0,0 +1,140 @@
+import bisect
+import datetime
+
+# ---------------------------------------------------------
+# 데일리 시간 기록 엔진
+# - 기록은 절대 분 단위 정수 구간 [start, end) 로 변환해 시작 순으로 정렬 보관
+#   (절대 분 = 날짜 ordinal * 1440 + 자정 이후 분)
+# - 종료가 시작보다 이르면 다음 날 종료로 보고 자정을 넘겨 이어지게 저장
+# - 겹치거나 중복된 기록은 sweep 으로 병합해서 실제로 쓴 시간(covered)만 계산
+# ---------------------------------------------------------
+MINUTES_PER_DAY = 1440
+
+
+def day_start(day):
+    """날짜의 첫 절대 분"""
+    return day.toordinal() * MINUTES_PER_DAY
+
+
+def to_interval(day, start_min, end_min):
+    """(날짜, 시작 분, 종료 분) -> 절대 분 구간. 시작/종료가 없으면 None"""
+    if start_min is None or end_min is None:
+        return None
+    start = day_start(day) + start_min
+    end = day_start(day) + end_min
+    if end <= start:
+        end += MINUTES_PER_DAY  # 자정을 넘긴 기록
+    if end - start >= MINUTES_PER_DAY:
+        return None  # 시작 == 종료 (길이 0)
+    return start, end
+
+
+def merge(intervals):
+    """시작 순으로 정렬된 (start, end) 들을 겹침 없이 병합"""
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+class TimeLog:
+    """정렬된 시간 구간 모음 (카테고리별 조회, 구간 병합, 날짜별 집계)"""
+
+    def __init__(self, intervals=()):
+        self._starts = []
+        self._items = []  # (start, end, category), 시작 순
+        self._max_length = 0
+        for start, end, category in sorted(intervals):
+            self._append(start, end, category)
+
+    def __len__(self):
+        return len(self._items)
+
+    def _append(self, start, end, category):
+        self._starts.append(start)
+        self._items.append((start, end, category))
+        self._max_length = max(self._max_length, end - start)
+
+    def add(self, start, end, category=None):
+        position = bisect.bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._items.insert(position, (start, end, category))
+        self._max_length = max(self._max_length, end - start)
+
+    def categories(self):
+        return sorted({category for _, _, category in self._items if category is not None})
+
+    def _clipped(self, lo, hi):
+        """[lo, hi) 와 겹치는 (start, end, category) 를 잘라서 시작 순으로"""
+        if lo is None:
+            first = 0
+        else:
+            # 시작이 lo - (가장 긴 구간 길이) 이전인 기록은 lo 까지 닿지 못함
+            first = bisect.bisect_left(self._starts, lo - self._max_length)
+        last = len(self._items) if hi is None else bisect.bisect_left(self._starts, hi)
+        for start, end, category in self._items[first:last]:
+            if lo is not None:
+                start = max(start, lo)
+            if hi is not None:
+                end = min(end, hi)
+            if start < end:
+                yield start, end, category
+
+    def intervals(self, lo=None, hi=None, category=None):
+        """[lo, hi) 와 겹치는 구간을 잘라서 시작 순으로 반환"""
+        return [
+            (start, end) for start, end, item_category in self._clipped(lo, hi)
+            if category is None or item_category == category
+        ]
+
+    def summary(self, lo=None, hi=None, category=None):
+        """{"total": 기록 합(중복 포함), "covered": 병합 후 실제 시간, "gap": 첫 시작~마지막 종료 사이 빈 시간}"""
+        intervals = self.intervals(lo, hi, category)
+        merged = merge(intervals)
+        covered = sum(end - start for start, end in merged)
+        span = merged[-1][1] - merged[0][0] if merged else 0
+        return {
+            "total": sum(end - start for start, end in intervals),
+            "covered": covered,
+            "gap": span - covered,
+        }
+
+    def covered_minutes(self, lo=None, hi=None, category=None):
+        return self.summary(lo, hi, category)["covered"]
+
+    def daily_covered(self, first_day, last_day, by_category=False):
+        """first_day ~ last_day 각 날짜의 병합된 시간(분)을 한 번의 순회로 계산
+
+        by_category=True 이면 {카테고리: [날짜별 분]}, 아니면 [날짜별 분].
+        자정을 넘긴 구간은 날짜 경계에서 나눠서 각 날짜에 더함.
+        """
+        lo = day_start(first_day)
+        days = (last_day - first_day).days + 1
+        hi = lo + days * MINUTES_PER_DAY
+        if by_category:
+            grouped = {}
+            for start, end, category in self._clipped(lo, hi):
+                grouped.setdefault(category, []).append((start, end))
+            return {category: self._spread(merge(intervals), lo, days) for category, intervals in grouped.items()}
+        return self._spread(merge(self.intervals(lo, hi)), lo, days)
+
+    @staticmethod
+    def _spread(merged, lo, days):
+        totals = [0] * days
+        for start, end in merged:
+            while start < end:
+                index = (start - lo) // MINUTES_PER_DAY
+                boundary = lo + (index + 1) * MINUTES_PER_DAY
+                stop = min(end, boundary)
+                totals[index] += stop - start
+                start = stop
+        return totals
+
+
+def week_days(end_day, count=7):
+    """end_day 를 마지막으로 하는 count 일의 날짜 리스트"""
+    return [end_day - datetime.timedelta(days=offset) for offset in range(count - 1, -1, -1)]
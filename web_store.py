@@ -0,0 +1,164 @@
+import json
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 내 잠금만 사용
+    fcntl = None
+
+
+# ---------------------------------------------------------
+# Streamlit 앱(app.py)의 JSON 저장소 입출력
+# Streamlit/pandas 없이 읽고 쓸 수 있도록 분리 (벤치마크, 테스트용)
+# ---------------------------------------------------------
+DATA_FILE = "data.json"
+
+# DataFrame 으로 복원되는 키 (records 리스트로 저장)
+FRAME_KEYS = ("monthly_goals", "weekly_tasks", "daily_time_logs",
+              "study_sessions", "project_data", "habits")
+
+# 컬렉션별 기본 열 (빈 컬렉션도 같은 열 구성을 유지)
+FRAME_COLUMNS = {
+    "monthly_goals": ("Goal", "Done"),
+    "weekly_tasks": ("Day", "Task", "Done"),
+    "daily_time_logs": ("Date", "StartTime", "EndTime", "Activity", "Category"),
+    "study_sessions": ("Name", "Total", "Done"),
+    "project_data": ("Subject", "Task", "Total", "Done", "Deadline"),
+    "habits": ("Name", "Icon", "Target"),
+}
+
+
+def read_store(path=DATA_FILE):
+    """저장 파일을 dict 로 읽어 반환. 파일이 없으면 None (손상 시 예외 전파)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_store(data, path=DATA_FILE):
+    """임시 파일에 쓴 뒤 교체 (중간에 죽어도 기존 파일은 온전함)"""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class StaleWriteError(Exception):
+    """세션이 읽은 version 이후에 다른 세션이 같은 키를 저장함 (쓰기 거부)"""
+
+    def __init__(self, keys, version):
+        super().__init__(f"다른 세션이 먼저 저장한 항목: {', '.join(keys)} (version {version})")
+        self.keys = keys
+        self.version = version
+
+
+class SharedStore:
+    """프로세스 전체에서 공유하는 저장소 (app.py 에서 st.cache_resource 로 1개만 생성)
+
+    - 원본 데이터는 한 벌만 보관, 세션은 snapshot() 으로 읽기 전용 뷰를 받음
+    - 쓰기는 잠금으로 직렬화 + 원자적 저장, 저장할 때마다 version 증가
+    - 세션은 자신이 읽은 version 과 current_version() 을 비교해 뷰를 갱신
+    - 다른 프로세스가 파일을 바꾸면 (mtime 변화) 다시 읽어서 version 증가
+    - 최상위 키마다 마지막으로 바뀐 version 을 기록: 세션이 읽은 뒤 바뀐 키를
+      덮어쓰려 하면 StaleWriteError (다른 키만 바뀌었으면 그대로 병합)
+    """
+
+    def __init__(self, path=DATA_FILE):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self._lock = threading.RLock()
+        self._data = None
+        self._version = 0
+        self._key_versions = {}  # 최상위 키 -> 마지막으로 바뀐 version
+        self._mtime = None
+        self._refresh()
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh(self):
+        mtime = self._file_mtime()
+        if mtime == self._mtime:
+            return
+        try:
+            data = read_store(self.path)
+        except Exception as e:
+            # 손상된 파일: 마지막으로 읽은 데이터를 유지
+            print(f"Error loading {self.path}: {e}")
+            return
+        old = self._data or {}
+        new = data or {}
+        self._version += 1
+        for key in set(old) | set(new):
+            if old.get(key) != new.get(key):
+                self._key_versions[key] = self._version
+        self._data = data
+        self._mtime = mtime
+
+    def current_version(self):
+        with self._lock:
+            self._refresh()
+            return self._version
+
+    def snapshot(self):
+        """(version, data) 반환. data 는 공유 객체이므로 수정하지 말 것"""
+        with self._lock:
+            self._refresh()
+            return self._version, self._data
+
+    def update(self, changes, expected_version=None):
+        """최상위 키 단위로 변경 내용을 병합해 저장하고 새 version 반환
+
+        expected_version: 세션이 마지막으로 읽은 version. 그 뒤에 changes 의 키가
+        다른 곳에서 바뀌었으면 저장하지 않고 StaleWriteError.
+        """
+        with self._lock, self._file_lock():
+            self._refresh()
+            if expected_version is not None:
+                stale = sorted(key for key in changes if self._key_versions.get(key, 0) > expected_version)
+                if stale:
+                    raise StaleWriteError(stale, self._version)
+            data = dict(self._data or {})
+            data.update(changes)
+            write_store(data, self.path)
+            self._data = data
+            self._mtime = self._file_mtime()
+            self._version += 1
+            for key in changes:
+                self._key_versions[key] = self._version
+            return self._version
+
+    def _file_lock(self):
+        return _FileLock(self.lock_path)
+
+
+class _FileLock:
+    """여러 프로세스(서버 워커)가 같은 파일에 쓸 때를 위한 advisory lock"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._file = open(self.path, "a")
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
@@ -0,0 +1,257 @@
+import base64
+import functools
+import os
+
+# ---------------------------------------------------------
+# Streamlit 앱(app.py)의 스타일시트 조각
+# Streamlit 없이 만들 수 있도록 분리 (같은 인자면 프로세스당 한 번만 생성)
+# ---------------------------------------------------------
+
+# 테마 팔레트 정의 (예시 이미지 기반)
+THEMES = {
+    'light': {
+        'bg_main': '#f8fafc',
+        'bg_card': '#ffffff',
+        'text_primary': '#1e293b',
+        'text_secondary': '#64748b',
+        'accent': '#0d9488',  # Teal (예시1)
+        'accent_light': '#14b8a6',
+        'border': '#e2e8f0',
+        'chart_colors': ['#0d9488', '#64748b', '#94a3b8'],
+    },
+    'dark': {
+        'bg_main': '#0a1628',
+        'bg_card': 'rgba(15, 30, 60, 0.8)',
+        'text_primary': '#f1f5f9',
+        'text_secondary': '#94a3b8',
+        'accent': '#38bdf8',  # Sky Blue (예시2)
+        'accent_light': '#7dd3fc',
+        'border': 'rgba(56, 189, 248, 0.2)',
+        'chart_colors': ['#38bdf8', '#0ea5e9', '#0284c7'],
+    }
+}
+
+
+# CSS 생성 (테마별로 한 번만 만들고 프로세스 전체에서 재사용)
+@functools.lru_cache(maxsize=None)
+def theme_css(theme):
+    T = THEMES[theme]
+    is_dark = theme == 'dark'
+    return f"""
+    <style>
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+    
+    /* ============================================ */
+    /* 기본 스타일 */
+    /* ============================================ */
+    html, body, .stApp, [data-testid="stAppViewContainer"], [data-testid="stHeader"] {{
+        background: {T['bg_main']} !important;
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+    }}
+    
+    {"" if not is_dark else f'''
+    /* 다크모드 글로우 배경 효과 */
+    [data-testid="stAppViewContainer"]::before {{
+        content: "";
+        position: fixed;
+        top: 0; left: 0; right: 0; bottom: 0;
+        background: 
+            radial-gradient(ellipse 80% 60% at 30% 30%, rgba(56, 189, 248, 0.08) 0%, transparent 50%),
+            radial-gradient(ellipse 60% 50% at 70% 70%, rgba(14, 165, 233, 0.06) 0%, transparent 50%);
+        pointer-events: none;
+        z-index: -1;
+    }}
+    '''}
+    
+    h1, h2, h3, h4 {{
+        color: {T['text_primary']} !important;
+        font-weight: 700 !important;
+    }}
+    
+    p, span, div, label {{
+        color: {T['text_primary']} !important;
+    }}
+    
+    /* ============================================ */
+    /* 카드 스타일 */
+    /* ============================================ */
+    .metric-card {{
+        background: {T['bg_card']};
+        {"backdrop-filter: blur(20px); -webkit-backdrop-filter: blur(20px);" if is_dark else ""}
+        border-radius: 16px;
+        padding: 20px;
+        border: 1px solid {T['border']};
+        {"box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3), inset 0 1px 0 rgba(255,255,255,0.05);" if is_dark else "box-shadow: 0 1px 3px rgba(0,0,0,0.08);"}
+        margin-bottom: 16px;
+        transition: all 0.3s ease;
+    }}
+    
+    .metric-card:hover {{
+        {"border-color: " + T['accent'] + "; box-shadow: 0 0 30px rgba(56, 189, 248, 0.15);" if is_dark else "box-shadow: 0 4px 12px rgba(0,0,0,0.1);"}
+        transform: translateY(-2px);
+    }}
+    
+    /* ============================================ */
+    /* 버튼 스타일 */
+    /* ============================================ */
+    div[data-testid="column"] button {{
+        background: {T['accent']} !important;
+        color: white !important;
+        border: none !important;
+        border-radius: 12px !important;
+        height: 48px !important;
+        font-weight: 600 !important;
+        font-size: 0.95rem !important;
+        width: 100% !important;
+        {"box-shadow: 0 4px 15px rgba(56, 189, 248, 0.3);" if is_dark else "box-shadow: 0 2px 8px rgba(13, 148, 136, 0.2);"}
+        transition: all 0.2s ease !important;
+    }}
+    
+    div[data-testid="column"] button:hover {{
+        background: {T['accent_light']} !important;
+        transform: translateY(-2px) !important;
+        {"box-shadow: 0 8px 25px rgba(56, 189, 248, 0.4) !important;" if is_dark else "box-shadow: 0 4px 12px rgba(13, 148, 136, 0.3) !important;"}
+    }}
+    
+    /* ============================================ */
+    /* 입력 필드 */
+    /* ============================================ */
+    .stTextInput input, .stSelectbox div[data-baseweb="select"], .stNumberInput input, .stTextArea textarea {{
+        background: {"rgba(15, 30, 60, 0.6)" if is_dark else "#ffffff"} !important;
+        color: {T['text_primary']} !important;
+        border: 1px solid {T['border']} !important;
+        border-radius: 10px !important;
+    }}
+    
+    .stTextInput input:focus {{
+        border-color: {T['accent']} !important;
+        {"box-shadow: 0 0 15px rgba(56, 189, 248, 0.2) !important;" if is_dark else ""}
+    }}
+    
+    /* ============================================ */
+    /* 탭 스타일 */
+    /* ============================================ */
+    .stTabs [data-baseweb="tab-list"] {{
+        gap: 6px;
+        background: {"rgba(15, 30, 60, 0.5)" if is_dark else "#f1f5f9"};
+        padding: 6px;
+        border-radius: 14px;
+        {"backdrop-filter: blur(10px);" if is_dark else ""}
+    }}
+    
+    .stTabs [data-baseweb="tab"] {{
+        background: transparent;
+        border-radius: 10px;
+        padding: 10px 16px;
+        border: none;
+        color: {T['text_secondary']} !important;
+        font-weight: 500;
+        transition: all 0.2s ease;
+    }}
+    
+    .stTabs [data-baseweb="tab"]:hover {{
+        background: {"rgba(56, 189, 248, 0.1)" if is_dark else "rgba(13, 148, 136, 0.08)"};
+        color: {T['text_primary']} !important;
+    }}
+    
+    .stTabs [aria-selected="true"] {{
+        background: {T['accent']} !important;
+        color: white !important;
+        {"box-shadow: 0 4px 15px rgba(56, 189, 248, 0.3);" if is_dark else ""}
+    }}
+    
+    /* ============================================ */
+    /* 사이드바 */
+    /* ============================================ */
+    section[data-testid="stSidebar"] {{
+        background: {"#0f1e3c" if is_dark else "#ffffff"} !important;
+        border-right: 1px solid {T['border']};
+    }}
+    
+    section[data-testid="stSidebar"] * {{
+        color: {T['text_primary']} !important;
+    }}
+    
+    /* ============================================ */
+    /* 체크박스 */
+    /* ============================================ */
+    .stCheckbox label span {{
+        color: {T['text_primary']} !important;
+    }}
+    
+    /* ============================================ */
+    /* 스크롤바 */
+    /* ============================================ */
+    ::-webkit-scrollbar {{ width: 8px; height: 8px; }}
+    ::-webkit-scrollbar-track {{ background: {"#0a1628" if is_dark else "#f1f5f9"}; }}
+    ::-webkit-scrollbar-thumb {{ 
+        background: {T['accent']};
+        border-radius: 4px;
+    }}
+    
+    /* 선택 색상 */
+    ::selection {{
+        background: {T['accent']};
+        color: white;
+    }}
+    
+    /* ============================================ */
+    /* 습관 체크인 버튼 (미완료 = primary, 완료 = secondary) */
+    /* ============================================ */
+    /* [미완료/하늘색] Primary 버튼 스타일 덮어쓰기 */
+    div.stButton > button[kind="primary"] {{
+        background-color: {T['accent']} !important;
+        color: white !important;
+        border: none !important;
+        box-shadow: 0 4px 15px rgba(56, 189, 248, 0.3) !important;
+    }}
+    /* [완료/빨간색] Secondary 버튼 스타일 덮어쓰기 */
+    div.stButton > button[kind="secondary"] {{
+        background-color: #FF4B4B !important;
+        color: white !important;
+        border: none !important;
+        box-shadow: 0 4px 15px rgba(255, 75, 75, 0.3) !important;
+    }}
+    /* 호버 효과 */
+    div.stButton > button:hover {{
+        opacity: 0.8 !important;
+        transform: translateY(-1px) !important;
+    }}
+    
+    </style>
+"""
+
+
+# static/ 폴더는 Streamlit 정적 파일 서빙(/app/static/...)으로 제공되므로
+# rerun마다 이미지 대신 짧은 URL만 전송됨
+BACKGROUND_FILE = os.path.join("static", "background.png")
+
+
+@functools.lru_cache(maxsize=8)
+def background_css(path, static_serving=True):
+    """배경 이미지 CSS. 파일이 없으면 빈 문자열"""
+    if not os.path.exists(path):
+        return ""
+    if static_serving:
+        url = "app/static/" + os.path.basename(path)
+    else:
+        # 정적 서빙이 꺼져 있으면 data URI로 대체 (이 경우에도 인코딩은 한 번만)
+        with open(path, 'rb') as f:
+            url = "data:image/png;base64," + base64.b64encode(f.read()).decode()
+    return f"""
+        <style>
+        .stApp, [data-testid="stAppViewContainer"] {{
+            background: url("{url}") no-repeat center fixed !important;
+            background-size: cover !important;
+        }}
+        [data-testid="stHeader"] {{
+            background: rgba(0,0,0,0) !important;
+        }}
+        </style>
+    """
+
+
+@functools.lru_cache(maxsize=16)
+def page_css(theme, background=None, static_serving=True):
+    """(테마, 배경 파일) 조합별 전체 스타일시트. background 가 None 이면 배경 없음"""
+    return theme_css(theme) + (background_css(background, static_serving) if background else "")